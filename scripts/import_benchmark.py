@@ -0,0 +1,80 @@
+"""Measure the time it takes to import pyvesync.
+
+Each run imports pyvesync in a fresh interpreter with `-X importtime`, so the
+results include every module loaded by the import and are not affected by
+modules cached in the current process. The `src` directory of the checkout is
+added to `PYTHONPATH`, so the package does not need to be installed.
+
+Usage:
+    python scripts/import_benchmark.py [--runs 10] [--top 10] [--module pyvesync]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+
+def checkout_env() -> dict[str, str]:
+    """Return the environment with the checkout's `src` directory on `PYTHONPATH`."""
+    env = os.environ.copy()
+    paths = [str(SRC_DIR)]
+    if env.get('PYTHONPATH'):
+        paths.append(env['PYTHONPATH'])
+    env['PYTHONPATH'] = os.pathsep.join(paths)
+    return env
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a new interpreter and return cumulative times in us."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=checkout_env(),
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='Number of imports')
+    parser.add_argument('--top', type=int, default=10, help='Modules to list')
+    parser.add_argument('--module', default='pyvesync', help='Module to import')
+    args = parser.parse_args()
+
+    samples: dict[str, list[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        for name, cumulative in import_times(args.module).items():
+            samples[name].append(cumulative)
+
+    total = statistics.median(samples[args.module]) / 1000
+    print(f'import {args.module}: median {total:.1f} ms over {args.runs} runs')  # noqa: T201
+    print(f'modules loaded: {len(samples)}')  # noqa: T201
+    print(f'slowest {args.module} modules (median cumulative ms):')  # noqa: T201
+    package = [
+        (statistics.median(times) / 1000, name)
+        for name, times in samples.items()
+        if name.startswith(f'{args.module}.')
+    ]
+    for elapsed, name in sorted(package, reverse=True)[: args.top]:
+        print(f'  {elapsed:8.1f}  {name}')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,6 +26,7 @@ from pyvesync.utils.errors import (
     ErrorCodes,
     ErrorTypes,
     VeSyncAPIResponseError,
+    VeSyncError,
     VeSyncLoginError,
     VeSyncServerError,
 )
@@ -31,6 +36,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+LOGIN_REQUEST: ContextVar[bool] = ContextVar('vesync_login_request', default=False)
+"""True while `VeSyncAuth.login` sends its requests. Token errors of login requests
+are raised without re-authenticating, which would wait for the login itself."""
+
+
+@dataclass(kw_only=True)
+class TokenRefreshConfig:
+    """Configuration for proactive token refresh.
+
+    Attributes:
+        token_lifetime (float | None): Seconds a token is valid after it is issued,
+            None to disable background refresh.
+        refresh_margin (float): Seconds before expiry the token is refreshed. The
+            refresh never happens before half of the token lifetime has passed.
+        retry_interval (float): Seconds to wait before retrying a failed refresh.
+    """
+
+    token_lifetime: float | None = None
+    refresh_margin: float = 600.0
+    retry_interval: float = 60.0
+
 
 class VeSyncAuth:
     """VeSync Authentication Manager.
@@ -42,10 +68,16 @@ class VeSyncAuth:
     __slots__ = (
         '_account_id',
         '_country_code',
+        '_credential_generation',
         '_current_region',
+        '_login_task',
         '_password',
+        '_refresh_config',
+        '_refresh_file_path',
+        '_refresh_task',
         '_token',
         '_token_file_path',
+        '_token_issued_at',
         '_username',
         'manager',
     )
@@ -56,6 +88,7 @@ class VeSyncAuth:
         username: str,
         password: str,
         country_code: str = DEFAULT_REGION,
+        refresh_config: TokenRefreshConfig | None = None,
     ) -> None:
         """Initialize VeSync Authentication Manager.
 
@@ -64,6 +97,8 @@ class VeSyncAuth:
             username: VeSync account username (email)
             password: VeSync account password
             country_code: Country code in ISO 3166 Alpha-2 format
+            refresh_config: Proactive token refresh settings, background refresh
+                is disabled by default
 
         Note:
             Either username/password or token/account_id must be provided.
@@ -78,6 +113,17 @@ class VeSyncAuth:
         self._country_code = country_code.upper()
         self._current_region = self._country_code_to_region()
         self._token_file_path: Path | None = None
+        self._refresh_file_path: Path | None = None
+        self._credential_generation = 0
+        self._token_issued_at: float | None = None
+        self._refresh_config = refresh_config or TokenRefreshConfig()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._login_task: asyncio.Task[bool] | None = None
+
+    def _credentials_changed(self) -> None:
+        """Count a credential change and clear the manager's cached request fields."""
+        self._credential_generation += 1
+        self.manager._field_cache.invalidate()  # noqa: SLF001
 
     def _country_code_to_region(self) -> str:
         """Convert country code to region string for API use."""
@@ -112,12 +158,34 @@ class VeSyncAuth:
     def country_code(self, value: str) -> None:
         """Set country code."""
         self._country_code = value.upper()
+        self.manager._field_cache.invalidate()  # noqa: SLF001
 
     @property
     def current_region(self) -> str:
         """Return current region."""
         return self._current_region
 
+    @property
+    def credential_generation(self) -> int:
+        """Return a counter that is incremented each time the token changes."""
+        return self._credential_generation
+
+    @property
+    def token_issued_at(self) -> float | None:
+        """Return the UNIX timestamp the current token was issued at."""
+        return self._token_issued_at
+
+    @property
+    def token_expires_at(self) -> float | None:
+        """Return the UNIX timestamp the current token is expected to expire at.
+
+        None if the token lifetime is not configured or no token is set.
+        """
+        lifetime = self._refresh_config.token_lifetime
+        if lifetime is None or self._token_issued_at is None:
+            return None
+        return self._token_issued_at + lifetime
+
     @property
     def is_authenticated(self) -> bool:
         """Check if user is authenticated."""
@@ -142,15 +210,78 @@ class VeSyncAuth:
         self._account_id = account_id
         self._country_code = country_code.upper()
         self._current_region = region
+        self._token_issued_at = time.time()
+        self._credentials_changed()
 
     async def reauthenticate(self) -> bool:
         """Re-authenticate using stored username and password.
 
+        The current credentials stay in use until the login succeeds, then they
+        are replaced at once and saved to the file they were last loaded from or
+        saved to, if any. A login
+        already in progress, such as a background token refresh, is awaited
+        instead of starting another one.
+
         Returns:
             True if re-authentication successful, False otherwise
         """
-        self.clear_credentials()
-        return await self.login()
+        if self._login_task is None:
+            self._login_task = asyncio.create_task(self._refresh_credentials())
+            self._login_task.add_done_callback(self._clear_login_task)
+        return await asyncio.shield(self._login_task)
+
+    def _clear_login_task(self, task: asyncio.Task[bool]) -> None:
+        """Forget the finished login task."""
+        if self._login_task is task:
+            self._login_task = None
+
+    async def _refresh_credentials(self) -> bool:
+        """Log in and persist the new credentials."""
+        success = await self.login()
+        if success and self._refresh_file_path is not None:
+            await self.save_credentials_to_file(self._refresh_file_path)
+        return success
+
+    def start_token_refresh(self) -> None:
+        """Start refreshing the token in the background before it expires.
+
+        Does nothing if `TokenRefreshConfig.token_lifetime` is not set or the
+        refresh task is already running.
+        """
+        if self._refresh_config.token_lifetime is None:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._token_refresh_loop())
+
+    async def stop_token_refresh(self) -> None:
+        """Stop the background token refresh task."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _token_refresh_loop(self) -> None:
+        """Refresh the token ahead of its expiry until stopped."""
+        config = self._refresh_config
+        while True:
+            issued_at = self._token_issued_at
+            lifetime = config.token_lifetime
+            if issued_at is None or lifetime is None:
+                return
+            refresh_at = issued_at + max(lifetime - config.refresh_margin, lifetime / 2)
+            delay = refresh_at - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            logger.debug('Refreshing token before expiry')
+            try:
+                await self.reauthenticate()
+            except VeSyncError as exc:
+                logger.warning('Background token refresh failed: %s', exc)
+                await asyncio.sleep(config.retry_interval)
 
     async def load_credentials_from_file(
         self, file_path: str | Path | None = None
@@ -183,6 +314,9 @@ class VeSyncAuth:
             self._account_id = data['account_id']
             self._country_code = data['country_code'].upper()
             self._current_region = data['current_region'].upper()
+            self._token_issued_at = data.get('token_issued_at')
+            self._refresh_file_path = file_path_object
+            self._credentials_changed()
             logger.debug('Credentials loaded from file: %s', file_path)
         except orjson.JSONDecodeError as exc:
             logger.warning('Failed to load credentials from file: %s', exc)
@@ -236,10 +370,13 @@ class VeSyncAuth:
             'token': self._token,
             'account_id': self._account_id,
             'country_code': self._country_code,
+            'current_region': self._current_region,
+            'token_issued_at': self._token_issued_at,
         }
         try:
             data = orjson.dumps(credentials).decode('utf-8')
             await asyncio.to_thread(file_path_object.write_text, data, encoding='utf-8')
+            self._refresh_file_path = file_path_object
             logger.debug('Credentials saved to file: %s', file_path_object)
         except (orjson.JSONEncodeError, OSError) as exc:
             logger.warning('Failed to save credentials to file: %s', exc)
@@ -248,6 +385,8 @@ class VeSyncAuth:
         """Clear all stored credentials."""
         self._token = None
         self._account_id = None
+        self._token_issued_at = None
+        self._credentials_changed()
 
         # Remove token file if it exists
         if self._token_file_path and self._token_file_path.exists():
@@ -270,7 +409,11 @@ class VeSyncAuth:
         """
         # Attempt username/password login
         if self._username and self._password:
-            return await self._login_with_credentials()
+            token = LOGIN_REQUEST.set(True)
+            try:
+                return await self._login_with_credentials()
+            finally:
+                LOGIN_REQUEST.reset(token)
 
         raise VeSyncLoginError(
             'No valid authentication method available. '
@@ -337,7 +480,9 @@ class VeSyncAuth:
             resp_message = resp_dict.get('msg')
 
             if resp_message is not None:
-                error_info.message = f'{error_info.message} ({resp_message})'
+                error_info = replace(
+                    error_info, message=f'{error_info.message} ({resp_message})'
+                )
 
             msg = f'Authentication failed - {error_info.message}'
             raise VeSyncLoginError(msg)
@@ -354,19 +499,26 @@ class VeSyncAuth:
         result = response_model.result
         if not isinstance(result, RespGetTokenResultModel):
             raise VeSyncAPIResponseError('Invalid authentication response format')
-        self._account_id = result.accountID
         return result.authorizeCode
 
     async def _exchange_authorization_code(
         self,
         auth_code: str,
         region_change_token: str | None = None,
+        country_code: str | None = None,
+        region: str | None = None,
     ) -> None:
         """Exchange authorization code for access token.
 
+        The token, account ID, country code and region are set together once the
+        token is received, requests sent during the login keep using the current
+        credentials.
+
         Args:
             auth_code: Authorization code from first auth step
             region_change_token: Token for region change (retry scenario)
+            country_code: Country code to log in with, defaults to the current one
+            region: Region to switch to after a cross region error
 
         Raises:
             VeSyncLoginError: If login fails
@@ -376,7 +528,7 @@ class VeSyncAuth:
             method='loginByAuthorizeCode4Vesync',
             authorizeCode=auth_code,
             bizToken=region_change_token,
-            userCountryCode=self._country_code,
+            userCountryCode=country_code or self._country_code,
             regionChange='lastRegion' if region_change_token else None,
         )
 
@@ -401,19 +553,22 @@ class VeSyncAuth:
                 # Handle cross region error by retrying with new region
                 if error_info.error_type == ErrorTypes.CROSS_REGION:
                     result = response_model.result
-                    self._country_code = result.countryCode
-                    self._current_region = result.currentRegion
                     logger.debug(
                         'Cross-region error, retrying with country: %s',
-                        self._country_code,
+                        result.countryCode,
                     )
                     return await self._exchange_authorization_code(
-                        auth_code, region_change_token=result.bizToken
+                        auth_code,
+                        region_change_token=result.bizToken,
+                        country_code=result.countryCode,
+                        region=result.currentRegion,
                     )
 
                 resp_message = resp_dict.get('msg')
                 if resp_message is not None:
-                    error_info.message = f'{error_info.message} ({resp_message})'
+                    error_info = replace(
+                        error_info, message=f'{error_info.message} ({resp_message})'
+                    )
 
                 msg = f'Login failed - {error_info.message}'
 
@@ -423,9 +578,12 @@ class VeSyncAuth:
                 raise VeSyncLoginError(msg)
 
             result = response_model.result
-            self._token = result.token
-            self._account_id = result.accountID
-            self._country_code = result.countryCode
+            self.set_credentials(
+                result.token,
+                result.accountID,
+                result.countryCode,
+                region or self._current_region,
+            )
 
         except (MissingField, UnserializableDataError) as exc:
             logger.debug('Error parsing login response: %s', exc)
@@ -3,17 +3,44 @@
 This module contains the base classes for VeSync devices, as well as the state classes
 for each device type. The base classes are used to create the device objects, while the
 state classes are used to store the current state of the device.
+
+The product type modules are imported on first attribute access, so importing
+`pyvesync` does not load the models of every product line.
 """
 
-from .bulb_base import BulbState, VeSyncBulb
-from .fan_base import FanState, VeSyncFanBase
-from .fryer_base import FryerState, VeSyncFryer
-from .humidifier_base import HumidifierState, VeSyncHumidifier
-from .outlet_base import OutletState, VeSyncOutlet
-from .purifier_base import PurifierState, VeSyncPurifier
-from .switch_base import SwitchState, VeSyncSwitch
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .vesyncbasedevice import DeviceState, VeSyncBaseDevice, VeSyncBaseToggleDevice
 
+if TYPE_CHECKING:
+    from .bulb_base import BulbState, VeSyncBulb
+    from .fan_base import FanState, VeSyncFanBase
+    from .fryer_base import FryerState, VeSyncFryer
+    from .humidifier_base import HumidifierState, VeSyncHumidifier
+    from .outlet_base import OutletState, VeSyncOutlet
+    from .purifier_base import PurifierState, VeSyncPurifier
+    from .switch_base import SwitchState, VeSyncSwitch
+
+_LAZY_IMPORTS = {
+    'BulbState': 'bulb_base',
+    'VeSyncBulb': 'bulb_base',
+    'FanState': 'fan_base',
+    'VeSyncFanBase': 'fan_base',
+    'FryerState': 'fryer_base',
+    'VeSyncFryer': 'fryer_base',
+    'HumidifierState': 'humidifier_base',
+    'VeSyncHumidifier': 'humidifier_base',
+    'OutletState': 'outlet_base',
+    'VeSyncOutlet': 'outlet_base',
+    'PurifierState': 'purifier_base',
+    'VeSyncPurifier': 'purifier_base',
+    'SwitchState': 'switch_base',
+    'VeSyncSwitch': 'switch_base',
+}
+
 __all__ = [
     'BulbState',
     'DeviceState',
@@ -33,3 +60,14 @@ __all__ = [
     'VeSyncPurifier',
     'VeSyncSwitch',
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import product type base classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
@@ -14,6 +14,7 @@ from pyvesync.const import (
 )
 from pyvesync.models.outlet_models import RequestEnergyHistory, ResponseEnergyHistory
 from pyvesync.utils.helpers import Helpers
+from pyvesync.utils.request_templates import request_template
 
 if TYPE_CHECKING:
     from pyvesync import VeSync
@@ -206,11 +207,8 @@ class VeSyncOutlet(VeSyncBaseToggleDevice):
             'uuid',
         )
 
-        body = Helpers.get_defaultvalues_attributes(request_keys)
-        body.update(Helpers.get_manager_attributes(self.manager, request_keys))
-        body.update(Helpers.get_device_attributes(self, request_keys))
-        body['method'] = method
-        return RequestEnergyHistory.from_dict(body)
+        template = request_template(RequestEnergyHistory, request_keys)
+        return template.build(self, {'method': method})
 
     async def _get_energy_history(self, history_interval: str | EnergyIntervals) -> None:
         """Pull energy history from API.
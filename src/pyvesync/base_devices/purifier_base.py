@@ -256,6 +256,34 @@ class VeSyncPurifier(VeSyncBaseToggleDevice):
         self.nightlight_modes: list[str] = feature_map.nightlight_modes
         self.auto_preferences: list[str] = feature_map.auto_preferences
 
+    def update_from_device_list(self, details: ResponseDeviceDetailsModel) -> bool:
+        """Refresh state from the device list, including the `extension` field.
+
+        Purifiers that report mode, fan speed and, if supported, air quality in the
+        device list `extension` field are covered by the list entry. Fields such as
+        filter life and display status are only refreshed by `get_details()`.
+        """
+        covered = super().update_from_device_list(details)
+        extension = details.extension
+        if extension is None:
+            return covered
+        fan_level = extension.fanSpeedLevel
+        has_fan_level = fan_level is not None and fan_level.isdigit()
+        if extension.mode is not None:
+            self.state.mode = extension.mode
+        if fan_level is not None and has_fan_level:
+            self.state.fan_level = int(fan_level)
+        if extension.airQualityLevel is not None:
+            self.state.set_air_quality_level(extension.airQualityLevel)
+        if extension.airQuality is not None:
+            self.state.pm25 = extension.airQuality
+        has_air_quality = not self.supports_air_quality or (
+            extension.airQualityLevel is not None and extension.airQuality is not None
+        )
+        return covered or (
+            extension.mode is not None and has_fan_level and has_air_quality
+        )
+
     @property
     def supports_air_quality(self) -> bool:
         """Return True if device supports air quality."""
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 import orjson
 
 from pyvesync.const import ConnectionStatus, DeviceStatus
+from pyvesync.utils.helpers import FieldCache
+from pyvesync.utils.tracing import register_traced_class
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,7 @@ class VeSyncBaseDevice(ABC, Generic[VS_STATE_T]):
         set_state: Set device state attribute.
         get_state: Get device state attribute.
         update: Update device details.
+        update_from_device_list: Refresh state from the device list response.
         display: Print formatted static device info to stdout.
         to_json: Print JSON API string
         to_jsonb: JSON API bytes device details
@@ -81,12 +84,17 @@ class VeSyncBaseDevice(ABC, Generic[VS_STATE_T]):
         The `last_response` attribute is used to store the last response and error
         information from the API call. See the `pyvesync.errors` module for more
         information.
+
+        The `update()`, `get_details()`, `toggle_switch()` and `set_*()` coroutine
+        methods of each subclass are wrapped in a tracing span when the manager has
+        a tracer, see `pyvesync.utils.tracing`.
     """
 
     __slots__ = (
         '__base_exclusions',
         '__weakref__',
         '_exclude_serialization',
+        '_field_cache',
         'cid',
         'config_module',
         'connection_type',
@@ -112,6 +120,11 @@ class VeSyncBaseDevice(ABC, Generic[VS_STATE_T]):
 
     state: VS_STATE_T
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Register the device class to wrap its methods once tracing is on."""
+        super().__init_subclass__(**kwargs)
+        register_traced_class(cls)
+
     def __init__(
         self,
         details: ResponseDeviceDetailsModel,
@@ -120,6 +133,7 @@ class VeSyncBaseDevice(ABC, Generic[VS_STATE_T]):
     ) -> None:
         """Initialize VeSync device base class."""
         self._exclude_serialization: list[str] = []
+        self._field_cache = FieldCache(self)
         self.enabled: bool = True
         self.last_response: ResponseInfo | None = None
         self.manager = manager
@@ -244,8 +258,35 @@ class VeSyncBaseDevice(ABC, Generic[VS_STATE_T]):
         """
 
     async def update(self) -> None:
-        """Update device details."""
-        await self.get_details()
+        """Update device details.
+
+        Concurrent calls for the same device share a single `get_details()` call.
+        """
+        await self.manager.coalescer.run(
+            ('update', self.cid, self.sub_device_no), self.get_details
+        )
+
+    def update_from_device_list(self, details: ResponseDeviceDetailsModel) -> bool:
+        """Refresh device state from the device's entry in the device list.
+
+        The device list response carries the power and connection status of every
+        device, so refreshing them costs no extra request. Device classes whose
+        state is fully covered by the list entry override this method to return
+        True.
+
+        Args:
+            details (ResponseDeviceDetailsModel): Device entry from the device list
+                response.
+
+        Returns:
+            bool: True if the list entry covers the device state and `get_details()`
+                can be skipped. Offline devices are always covered, since they do
+                not answer detail requests.
+        """
+        self.state.device_status = details.deviceStatus
+        self.state.connection_status = details.connectionStatus
+        self.state.update_ts()
+        return details.connectionStatus != ConnectionStatus.ONLINE
 
     def display(self, state: bool = True) -> None:
         """Print formatted static device info to stdout.
@@ -351,6 +392,9 @@ class VeSyncBaseDevice(ABC, Generic[VS_STATE_T]):
         return orjson.dumps(return_dict, option=orjson.OPT_NON_STR_KEYS)
 
 
+register_traced_class(VeSyncBaseDevice)
+
+
 class VeSyncBaseToggleDevice(VeSyncBaseDevice, Generic[VS_STATE_T]):
     """Base class for VeSync devices that can be toggled on and off.
 
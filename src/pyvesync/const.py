@@ -67,6 +67,8 @@ TERMINAL_ID = '2' + (
 CLIENT_TYPE = 'vesyncApp'
 
 STATUS_OK = 200
+STATUS_TOO_MANY_REQUESTS = 429
+STATUS_SERVER_ERROR = 500
 
 
 # Generic Constants
@@ -8,6 +8,9 @@ Classes:
     DeviceContainer: Container for VeSync device instances.
         This class should not be instantiated directly. Use the `DeviceContainerInstance`
         instead.
+    DeviceView: Read-only view of the devices of one product type.
+    DeviceEvent: Device added, removed or changed by device list reconciliation.
+    ReconcileResult: Outcome of `DeviceContainer.reconcile()`.
     _DeviceContainerBase: Base class for VeSync device
         container. Inherits from `MutableSet`.
 """
@@ -17,13 +20,17 @@ from __future__ import annotations
 import logging
 import re
 from collections.abc import Iterator, MutableSet, Sequence
-from typing import TYPE_CHECKING, TypeVar, cast
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
 
 from pyvesync.base_devices.vesyncbasedevice import VeSyncBaseDevice
 from pyvesync.const import ProductTypes
 from pyvesync.device_map import get_device_config
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pyvesync import VeSync
     from pyvesync.base_devices.bulb_base import VeSyncBulb
     from pyvesync.base_devices.fan_base import VeSyncFanBase
@@ -46,16 +53,147 @@ T = TypeVar('T')
 
 def _clean_string(string: str) -> str:
     """Clean a string by removing non alphanumeric characters and making lowercase."""
-    return re.sub(r'[^a0zA-Z0-9]', '', string)
+    return re.sub(r'[^a-zA-Z0-9]', '', string).lower()
+
+
+def _device_key(cid: str, sub_device_no: int | None) -> str:
+    """Return the container key of a device, matching `VeSyncBaseDevice.__hash__`."""
+    return cid + str(sub_device_no)
+
+
+STATIC_FIELDS: tuple[tuple[str, str], ...] = (
+    ('device_name', 'deviceName'),
+    ('current_firm_version', 'currentFirmVersion'),
+    ('connection_type', 'connectionType'),
+    ('device_image', 'deviceImg'),
+    ('mac_id', 'macID'),
+)
+"""Device attributes patched from the device list, with their list field names."""
+
+
+def _call_listener(listener: Callable[[DeviceEvent], None], event: DeviceEvent) -> None:
+    """Call a device event listener, logging instead of raising its errors."""
+    try:
+        listener(event)
+    except Exception:
+        logger.exception('Error in device container listener')
+
+
+class DeviceEventType(StrEnum):
+    """Device list reconciliation event types.
+
+    Attributes:
+        ADDED: Device appeared in the device list and was added.
+        REMOVED: Device is no longer in the device list and was removed.
+        CHANGED: Static fields of an existing device changed.
+    """
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+
+
+@dataclass
+class DeviceEvent:
+    """Device added, removed or changed by device list reconciliation.
+
+    Attributes:
+        event_type (DeviceEventType): Type of change.
+        device (VeSyncBaseDevice): Device instance that was added, removed or
+            changed.
+        changes (dict[str, tuple[Any, Any]]): Changed attribute names with their
+            old and new values, only set for `CHANGED` events.
+    """
+
+    event_type: DeviceEventType
+    device: VeSyncBaseDevice
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of reconciling the container with the device list.
+
+    Attributes:
+        added (list[VeSyncBaseDevice]): New devices.
+        removed (list[VeSyncBaseDevice]): Devices no longer in the device list.
+        changed (list[VeSyncBaseDevice]): Existing devices with patched static
+            fields.
+    """
+
+    added: list[VeSyncBaseDevice] = field(default_factory=list)
+    removed: list[VeSyncBaseDevice] = field(default_factory=list)
+    changed: list[VeSyncBaseDevice] = field(default_factory=list)
+
+
+class DeviceView(Sequence[T], Generic[T]):
+    """Read-only view of the devices of one product type.
+
+    The view reads the container's product type index directly, so it does not
+    copy the devices and always reflects the current container contents.
+    """
+
+    __slots__ = ('_devices',)
+
+    def __init__(self, devices: list[T]) -> None:
+        """Initialize the view over a product type index."""
+        self._devices = devices
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """Return the device at an index, or a list of devices for a slice."""
+        return self._devices[index]
+
+    def __len__(self) -> int:
+        """Return the number of devices in the view."""
+        return len(self._devices)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the devices in the view."""
+        return iter(self._devices)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the devices in the view with another sequence."""
+        if isinstance(other, Sequence):
+            return list(self._devices) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the devices in the view."""
+        return f'DeviceView({self._devices!r})'
 
 
 class _DeviceContainerBase(MutableSet[VeSyncBaseDevice]):
     """Base class for VeSync device container.
 
-    Inherits from `MutableSet` and defines the core MutableSet methods.
+    Inherits from `MutableSet` and defines the core MutableSet methods. Secondary
+    indexes by key (cid and sub-device number), cid, name, normalized name and
+    product type are updated as devices are added and removed.
+
+    The name indexes hold the name a device had when it was added or last patched
+    from the device list, assigning `device_name` directly does not move the device
+    in them. Removing a device moves the last device of its product type into its
+    place, so removal does not shift the product type index.
     """
 
-    __slots__ = ('__weakref__', '_data')
+    __slots__ = (
+        '__weakref__',
+        '_by_cid',
+        '_by_clean_name',
+        '_by_key',
+        '_by_name',
+        '_by_product_type',
+        '_data',
+        '_indexed_names',
+        '_positions',
+    )
 
     def __init__(
         self,
@@ -64,8 +202,17 @@ class _DeviceContainerBase(MutableSet[VeSyncBaseDevice]):
     ) -> None:
         """Initialize the DeviceContainer class."""
         self._data: set[VeSyncBaseDevice] = set()
+        self._by_key: dict[str, VeSyncBaseDevice] = {}
+        self._by_cid: dict[str, list[VeSyncBaseDevice]] = {}
+        self._by_name: dict[str, list[VeSyncBaseDevice]] = {}
+        self._by_clean_name: dict[str, list[VeSyncBaseDevice]] = {}
+        self._by_product_type: dict[str, list[VeSyncBaseDevice]] = {}
+        # Indexed name and product type index position by device key
+        self._indexed_names: dict[str, str] = {}
+        self._positions: dict[str, int] = {}
         if isinstance(sequence, Sequence):
-            self._data.update(sequence)
+            for device in sequence:
+                self.add(device)
 
     def __iter__(self) -> Iterator[VeSyncBaseDevice]:
         """Iterate over the container."""
@@ -81,19 +228,85 @@ class _DeviceContainerBase(MutableSet[VeSyncBaseDevice]):
             logger.debug('Device already exists')
             return
         self._data.add(value)
+        key = _device_key(value.cid, value.sub_device_no)
+        self._by_key[key] = value
+        self._by_cid.setdefault(value.cid, []).append(value)
+        self._index_name(key, value, value.device_name)
+        devices = self._by_product_type.setdefault(value.product_type, [])
+        self._positions[key] = len(devices)
+        devices.append(value)
 
     def remove(self, value: VeSyncBaseDevice) -> None:
         """Remove a device from the container."""
         self._data.remove(value)
+        key = _device_key(value.cid, value.sub_device_no)
+        device = self._by_key.pop(key)
+        self._unindex(self._by_cid, device.cid, device)
+        self._unindex_name(key, device)
+        devices = self._by_product_type[device.product_type]
+        position = self._positions.pop(key)
+        last = devices.pop()
+        if last is not device:
+            devices[position] = last
+            self._positions[_device_key(last.cid, last.sub_device_no)] = position
+
+    def _rename(self, device: VeSyncBaseDevice, name: str) -> None:
+        """Change a device name and move it in the name indexes."""
+        key = _device_key(device.cid, device.sub_device_no)
+        self._unindex_name(key, device)
+        device.device_name = name
+        self._index_name(key, device, name)
+
+    def _index_name(self, key: str, device: VeSyncBaseDevice, name: str) -> None:
+        """Add a device to the name indexes under a name."""
+        self._indexed_names[key] = name
+        self._by_name.setdefault(name, []).append(device)
+        self._by_clean_name.setdefault(_clean_string(name), []).append(device)
+
+    def _unindex_name(self, key: str, device: VeSyncBaseDevice) -> None:
+        """Remove a device from the name indexes under its indexed name."""
+        name = self._indexed_names.pop(key)
+        self._unindex(self._by_name, name, device)
+        self._unindex(self._by_clean_name, _clean_string(name), device)
+
+    def discard(self, value: VeSyncBaseDevice) -> None:
+        """Remove a device from the container if it is present."""
+        if value in self._data:
+            self.remove(value)
+
+    @staticmethod
+    def _unindex(
+        index: dict[str, list[VeSyncBaseDevice]], key: str, device: VeSyncBaseDevice
+    ) -> None:
+        """Remove a device from a list index, dropping the key once it is empty."""
+        devices = index.get(key)
+        if devices is None or device not in devices:
+            return
+        devices.remove(device)
+        if not devices:
+            del index[key]
 
     def clear(self) -> None:
         """Clear the container."""
         self._data.clear()
+        self._by_key.clear()
+        self._by_cid.clear()
+        self._by_name.clear()
+        self._by_clean_name.clear()
+        self._indexed_names.clear()
+        self._positions.clear()
+        # Keep the product type lists, views returned to callers read them
+        for devices in self._by_product_type.values():
+            devices.clear()
 
     def __contains__(self, value: object) -> bool:
         """Check if a device is in the container."""
         return value in self._data
 
+    def _product_type_view(self, product_type: str) -> DeviceView:
+        """Return the read-only view of a product type index."""
+        return DeviceView(self._by_product_type.setdefault(product_type, []))
+
 
 class DeviceContainer(_DeviceContainerBase):
     """Container for VeSync device instances.
@@ -111,11 +324,14 @@ class DeviceContainer(_DeviceContainerBase):
     and is instantiated directly by the `DeviceContainerInstance` in the
     `device_container` module and imported as needed.
 
-    Use the [`add_new_devices`][pyvesync.device_container.DeviceContainer.add_new_devices]
-    class method to add devices from the device list model API response and
-    `remove_stale_devices` to remove stale devices from the device list API response
-    model. The device list response model is built in the
-    [VeSync.get_devices()][pyvesync.vesync.VeSync.get_devices] method.
+    Use the [`reconcile`][pyvesync.device_container.DeviceContainer.reconcile]
+    method to bring the container in line with the device list model API response.
+    New devices are added, stale devices are removed and static fields of existing
+    devices are patched in place, so their state is kept. `add_new_devices` and
+    `remove_stale_devices` run the individual steps. The device list response
+    model is built in the [VeSync.get_devices()][pyvesync.vesync.VeSync.get_devices]
+    method. Register a callback with `add_listener()` to receive a `DeviceEvent`
+    for every device added, removed or changed by these methods.
 
     Args:
         sequence (Sequence[VeSyncBaseDevice] | None): A sequence of device instances to
@@ -126,7 +342,7 @@ class DeviceContainer(_DeviceContainerBase):
         _data (set[VeSyncBaseDevice]): The mutable set of devices in the container.
     """
 
-    __slots__ = ()
+    __slots__ = ('_listeners',)
 
     def __init__(
         self,
@@ -135,6 +351,25 @@ class DeviceContainer(_DeviceContainerBase):
     ) -> None:
         """Initialize the DeviceContainer class."""
         super().__init__(sequence)
+        self._listeners: list[Callable[[DeviceEvent], None]] = []
+
+    def add_listener(self, listener: Callable[[DeviceEvent], None]) -> Callable[[], None]:
+        """Register a callback for devices added, removed or changed.
+
+        Args:
+            listener (Callable[[DeviceEvent], None]): Called with a `DeviceEvent`
+                for every device changed by device list reconciliation.
+
+        Returns:
+            Callable[[], None]: Function that removes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _emit(self, event: DeviceEvent) -> None:
+        """Pass a device event to all listeners."""
+        for listener in list(self._listeners):
+            _call_listener(listener, event)
 
     def _build_device_instance(
         self, device: ResponseDeviceDetailsModel, manager: VeSync
@@ -167,7 +402,7 @@ class DeviceContainer(_DeviceContainerBase):
 
     def add_device_from_model(
         self, device: ResponseDeviceDetailsModel, manager: VeSync
-    ) -> None:
+    ) -> VeSyncBaseDevice | None:
         """Add a single device from the device list response model.
 
         Args:
@@ -175,6 +410,10 @@ class DeviceContainer(_DeviceContainerBase):
                 device list response model.
             manager (VeSync): The VeSync instance to pass to the device instance
 
+        Returns:
+            VeSyncBaseDevice | None: The device instance, None if the device type
+                is not supported.
+
         Raises:
             VeSyncAPIResponseError: If the model is not an instance of
                 `ResponseDeviceDetailsModel`.
@@ -187,6 +426,7 @@ class DeviceContainer(_DeviceContainerBase):
                 device_obj.device_name,
                 device_obj.device_type,
             )
+        return device_obj
 
     def device_exists(self, cid: str, sub_device_no: int | None = None) -> bool:
         """Check if a device with the given cid & sub_dev_no exists.
@@ -199,8 +439,22 @@ class DeviceContainer(_DeviceContainerBase):
         Returns:
             bool: True if the device exists, False otherwise.
         """
-        new_hash = hash(cid + str(sub_device_no))
-        return any(new_hash == hash(dev) for dev in self._data)
+        return _device_key(cid, sub_device_no) in self._by_key
+
+    def get_by_cid(
+        self, cid: str, sub_device_no: int | None = None
+    ) -> VeSyncBaseDevice | None:
+        """Get a device by cid and sub-device number.
+
+        Args:
+            cid (str): The cid of the device to get.
+            sub_device_no (int | None): The sub_device_no of the device, None for
+                most devices.
+
+        Returns:
+            VeSyncBaseDevice | None: The device instance if found, None otherwise.
+        """
+        return self._by_key.get(_device_key(cid, sub_device_no))
 
     def get_by_name(self, name: str, fuzzy: bool = False) -> VeSyncBaseDevice | None:
         """Forgiving method to get a device by name.
@@ -215,14 +469,13 @@ class DeviceContainer(_DeviceContainerBase):
         Note:
             Fuzzy matching removes all non-alphanumeric characters and makes the string
             lowercase. If there are multiple devices with the same name, the first one
-            found will be returned (a set is unordered).
+            added will be returned. Devices are found by the name they had when they
+            were added or last patched from the device list.
         """
-        for device in self._data:
-            if (fuzzy and _clean_string(device.device_name) == _clean_string(name)) or (
-                device.device_name == name
-            ):
-                return device
-        return None
+        devices = self._by_name.get(name)
+        if not devices and fuzzy:
+            devices = self._by_clean_name.get(_clean_string(name))
+        return devices[0] if devices else None
 
     def remove_by_cid(self, cid: str) -> bool:
         """Remove a device by cid.
@@ -233,47 +486,125 @@ class DeviceContainer(_DeviceContainerBase):
         Returns:
             bool : True if the device was removed, False otherwise.
         """
-        device_found: VeSyncBaseDevice | None = None
-        for device in self._data:
-            if device.cid == cid:
-                device_found = device
-                break
-        if device_found is not None:
-            self.remove(device_found)
-            return True
-        return False
+        devices = self._by_cid.get(cid)
+        if not devices:
+            return False
+        self.remove(devices[0])
+        return True
+
+    def remove_stale_devices(
+        self, device_list_result: ResponseDeviceListModel
+    ) -> list[VeSyncBaseDevice]:
+        """Remove devices that are not in the provided list.
 
-    def discard(self, value: VeSyncBaseDevice) -> None:
-        """Discard a device from the container.
+        Args:
+            device_list_result (ResponseDeviceListModel): The device list response model
+                from the VeSync API. This is generated by the `VeSync.get_devices()`
+                method.
+
+        Returns:
+            list[VeSyncBaseDevice]: The removed devices.
+        """
+        new_keys = {
+            _device_key(device.cid, device.subDeviceNo)
+            for device in device_list_result.result.list
+        }
+        removed = [device for key, device in self._by_key.items() if key not in new_keys]
+        for device in removed:
+            logger.debug('Removing stale device %s', device.device_name)
+            self.remove(device)
+            self._emit(DeviceEvent(DeviceEventType.REMOVED, device))
+        return removed
+
+    def patch_devices(
+        self, device_list_result: ResponseDeviceListModel
+    ) -> list[VeSyncBaseDevice]:
+        """Update static fields of existing devices from the device list.
+
+        The name, firmware version, connection type, image and MAC address are
+        patched in place, the device state is not touched. The cached request
+        fields of a patched device are cleared.
 
         Args:
-            value (VeSyncBaseDevice): The device to discard.
+            device_list_result (ResponseDeviceListModel): The device list response model
+                from the VeSync API. This is generated by the `VeSync.get_devices()`
+                method.
+
+        Returns:
+            list[VeSyncBaseDevice]: Devices with changed fields.
         """
-        return self._data.discard(value)
+        changed: list[VeSyncBaseDevice] = []
+        for details in device_list_result.result.list:
+            device = self.get_by_cid(details.cid, details.subDeviceNo)
+            if device is None:
+                continue
+            changes: dict[str, tuple[Any, Any]] = {}
+            for attr, list_field in STATIC_FIELDS:
+                new_value = getattr(details, list_field)
+                old_value = getattr(device, attr)
+                # Missing list values do not overwrite known values
+                if new_value in (None, '') or new_value == old_value:
+                    continue
+                changes[attr] = (old_value, new_value)
+                if attr == 'device_name':
+                    self._rename(device, new_value)
+                else:
+                    setattr(device, attr, new_value)
+            if changes:
+                device._field_cache.invalidate()  # noqa: SLF001
+                logger.debug('Updated %s of device %s', list(changes), device.cid)
+                changed.append(device)
+                self._emit(DeviceEvent(DeviceEventType.CHANGED, device, changes))
+        return changed
+
+    def reconcile(
+        self, device_list_result: ResponseDeviceListModel, manager: VeSync
+    ) -> ReconcileResult:
+        """Bring the container in line with the device list.
 
-    def remove_stale_devices(self, device_list_result: ResponseDeviceListModel) -> None:
-        """Remove devices that are not in the provided list.
+        Devices missing from the list are removed, new devices are added and
+        static fields of existing devices are patched. Existing device instances
+        are kept, along with their state and timers.
+
+        Args:
+            device_list_result (ResponseDeviceListModel): The device list response model
+                from the VeSync API. This is generated by the `VeSync.get_devices()`
+                method.
+            manager (VeSync): The VeSync instance to pass to new device instances
+
+        Returns:
+            ReconcileResult: Devices added, removed and changed.
+        """
+        return ReconcileResult(
+            removed=self.remove_stale_devices(device_list_result),
+            changed=self.patch_devices(device_list_result),
+            added=self.add_new_devices(device_list_result, manager),
+        )
+
+    def update_from_device_list(
+        self, device_list_result: ResponseDeviceListModel
+    ) -> list[VeSyncBaseDevice]:
+        """Refresh device states from the device list response.
 
         Args:
             device_list_result (ResponseDeviceListModel): The device list response model
                 from the VeSync API. This is generated by the `VeSync.get_devices()`
                 method.
+
+        Returns:
+            list[VeSyncBaseDevice]: Devices whose state is not covered by the device
+                list and still need a `get_details()` call.
         """
-        device_list = device_list_result.result.list
-        new_hashes = [
-            hash(device.cid + str(device.subDeviceNo)) for device in device_list
-        ]
-        remove_cids = []
-        for device in self._data:
-            if hash(device) not in new_hashes:
-                logger.debug('Removing stale device %s', device.device_name)
-                remove_cids.append(device.cid)
-        for cid in remove_cids:
-            self.remove_by_cid(cid)
+        covered: set[VeSyncBaseDevice] = set()
+        for details in device_list_result.result.list:
+            device = self.get_by_cid(details.cid, details.subDeviceNo)
+            if device is not None and device.update_from_device_list(details):
+                covered.add(device)
+        return [device for device in self._data if device not in covered]
 
     def add_new_devices(
         self, device_list_result: ResponseDeviceListModel, manager: VeSync
-    ) -> None:
+    ) -> list[VeSyncBaseDevice]:
         """Add new devices to the container.
 
         Args:
@@ -281,83 +612,67 @@ class DeviceContainer(_DeviceContainerBase):
                 from the VeSync API. This is generated by the `VeSync.get_devices()`
                 method.
             manager (VeSync): The VeSync instance to pass to the device instance
+
+        Returns:
+            list[VeSyncBaseDevice]: The added devices.
         """
-        device_list = device_list_result.result.list
-        for device in device_list:
-            if self.device_exists(device.cid, device.subDeviceNo) not in self._data:
-                self.add_device_from_model(device, manager)
+        added: list[VeSyncBaseDevice] = []
+        for details in device_list_result.result.list:
+            if self.device_exists(details.cid, details.subDeviceNo):
+                continue
+            device = self.add_device_from_model(details, manager)
+            if device is not None:
+                added.append(device)
+                self._emit(DeviceEvent(DeviceEventType.ADDED, device))
+        return added
 
     @property
-    def outlets(self) -> list[VeSyncOutlet]:
-        """Return a list of devices that are outlets."""
-        return [
-            cast('VeSyncOutlet', device)
-            for device in self
-            if device.product_type == ProductTypes.OUTLET
-        ]
+    def outlets(self) -> DeviceView[VeSyncOutlet]:
+        """Return a read-only view of the devices that are outlets."""
+        view = self._product_type_view(ProductTypes.OUTLET)
+        return cast('DeviceView[VeSyncOutlet]', view)
 
     @property
-    def switches(self) -> list[VeSyncSwitch]:
-        """Return a list of devices that are switches."""
-        return [
-            cast('VeSyncSwitch', device)
-            for device in self
-            if device.product_type == ProductTypes.SWITCH
-        ]
+    def switches(self) -> DeviceView[VeSyncSwitch]:
+        """Return a read-only view of the devices that are switches."""
+        view = self._product_type_view(ProductTypes.SWITCH)
+        return cast('DeviceView[VeSyncSwitch]', view)
 
     @property
-    def bulbs(self) -> list[VeSyncBulb]:
-        """Return a list of devices that are lights."""
-        return [
-            cast('VeSyncBulb', device)
-            for device in self
-            if device.product_type == ProductTypes.BULB
-        ]
+    def bulbs(self) -> DeviceView[VeSyncBulb]:
+        """Return a read-only view of the devices that are lights."""
+        view = self._product_type_view(ProductTypes.BULB)
+        return cast('DeviceView[VeSyncBulb]', view)
 
     @property
-    def air_purifiers(self) -> list[VeSyncPurifier]:
-        """Return a list of devices that are air purifiers."""
-        return [
-            cast('VeSyncPurifier', device)
-            for device in self
-            if device.product_type == ProductTypes.PURIFIER
-        ]
+    def air_purifiers(self) -> DeviceView[VeSyncPurifier]:
+        """Return a read-only view of the devices that are air purifiers."""
+        view = self._product_type_view(ProductTypes.PURIFIER)
+        return cast('DeviceView[VeSyncPurifier]', view)
 
     @property
-    def fans(self) -> list[VeSyncFanBase]:
-        """Return a list of devices that are fans."""
-        return [
-            cast('VeSyncFanBase', device)
-            for device in self
-            if device.product_type == ProductTypes.FAN
-        ]
+    def fans(self) -> DeviceView[VeSyncFanBase]:
+        """Return a read-only view of the devices that are fans."""
+        view = self._product_type_view(ProductTypes.FAN)
+        return cast('DeviceView[VeSyncFanBase]', view)
 
     @property
-    def humidifiers(self) -> list[VeSyncHumidifier]:
-        """Return a list of devices that are humidifiers."""
-        return [
-            cast('VeSyncHumidifier', device)
-            for device in self
-            if device.product_type == ProductTypes.HUMIDIFIER
-        ]
+    def humidifiers(self) -> DeviceView[VeSyncHumidifier]:
+        """Return a read-only view of the devices that are humidifiers."""
+        view = self._product_type_view(ProductTypes.HUMIDIFIER)
+        return cast('DeviceView[VeSyncHumidifier]', view)
 
     @property
-    def air_fryers(self) -> list[VeSyncFryer]:
-        """Return a list of devices that are air fryers."""
-        return [
-            cast('VeSyncFryer', device)
-            for device in self
-            if device.product_type == ProductTypes.AIR_FRYER
-        ]
+    def air_fryers(self) -> DeviceView[VeSyncFryer]:
+        """Return a read-only view of the devices that are air fryers."""
+        view = self._product_type_view(ProductTypes.AIR_FRYER)
+        return cast('DeviceView[VeSyncFryer]', view)
 
     @property
-    def thermostats(self) -> list[VeSyncThermostat]:
-        """Return a list of devices that are thermostats."""
-        return [
-            cast('VeSyncThermostat', device)
-            for device in self
-            if device.product_type == ProductTypes.THERMOSTAT
-        ]
+    def thermostats(self) -> DeviceView[VeSyncThermostat]:
+        """Return a read-only view of the devices that are thermostats."""
+        view = self._product_type_view(ProductTypes.THERMOSTAT)
+        return cast('DeviceView[VeSyncThermostat]', view)
 
 
 DeviceContainerInstance = DeviceContainer()
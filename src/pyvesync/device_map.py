@@ -50,19 +50,24 @@ Functions:
     get_purifier: Get the purifier config, returning the PurifierMap object.
     get_air_fryer: Get the Air Fryer config, returning the AirFryerMap object.
     get_thermostat: Get the thermostat config, returning the ThermostatMap object.
+    invalidate_device_index: Rebuild the lookup indexes after changing the lists.
 
 Note:
     To add devices, add the device mapping to the appropriate `<product-type>_modules`
     list, ensuring all required fields are present based on the `<product-type>Map`
     fields.
+
+    Lookups use a device type index built on first use. Call
+    `invalidate_device_index()` after changing a `<product-type>_modules` list at
+    runtime, so the next lookup rebuilds the index.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from itertools import chain
-from types import ModuleType
-from typing import Union
+from importlib import import_module
+from typing import TYPE_CHECKING, Generic, TypeVar, Union
 
 from pyvesync.const import (
     BulbFeatures,
@@ -87,16 +92,9 @@ from pyvesync.const import (
     ThermostatRoutineTypes,
     ThermostatWorkModes,
 )
-from pyvesync.devices import (
-    vesyncbulb,
-    vesyncfan,
-    vesynchumidifier,
-    vesynckitchen,
-    vesyncoutlet,
-    vesyncpurifier,
-    vesyncswitch,
-    vesyncthermostat,
-)
+
+if TYPE_CHECKING:
+    from types import ModuleType
 
 T_MAPS = Union[  # noqa: UP007, RUF100
     list['OutletMap'],
@@ -118,7 +116,8 @@ class DeviceMapTemplate:
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device.
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device. The module
+            is imported when the `module` property is first read.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -131,13 +130,18 @@ class DeviceMapTemplate:
     class_name: str
     product_type: str
     product_line: str
-    module: ModuleType
+    module_name: str
     setup_entry: str
     model_display: str
     model_name: str
     device_alias: str | None = None
     features: list[str] = field(default_factory=list)
 
+    @property
+    def module(self) -> ModuleType:
+        """Return the module for the device, importing it on first use."""
+        return import_module(self.module_name)
+
 
 @dataclass(kw_only=True)
 class OutletMap(DeviceMapTemplate):
@@ -147,7 +151,7 @@ class OutletMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.OUTLET
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -155,13 +159,13 @@ class OutletMap(DeviceMapTemplate):
         device_alias (str | None): Alias for the device, if any.
         features (list[str]): List of features for the device.
         product_type (str): Product type of the device.
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         nightlight_modes (list[str]): List of nightlight modes for the device.
     """
 
     product_line: str = ProductLines.WIFI_LIGHT
     product_type: str = ProductTypes.OUTLET
-    module: ModuleType = vesyncoutlet
+    module_name: str = 'pyvesync.devices.vesyncoutlet'
     energy_intervals: tuple[str, ...] = (
         EnergyIntervals.YEAR,
         EnergyIntervals.MONTH,
@@ -178,7 +182,7 @@ class SwitchMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.SWITCH
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -186,12 +190,12 @@ class SwitchMap(DeviceMapTemplate):
         device_alias (str | None): Alias for the device, if any.
         features (list[str]): List of features for the device.
         product_type (str): Product type of the device.
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
     """
 
     product_line: str = ProductLines.SWITCHES
     product_type: str = ProductTypes.SWITCH
-    module: ModuleType = vesyncswitch
+    module_name: str = 'pyvesync.devices.vesyncswitch'
 
 
 @dataclass(kw_only=True)
@@ -202,7 +206,7 @@ class BulbMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.BULB
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -216,7 +220,7 @@ class BulbMap(DeviceMapTemplate):
     product_line: str = ProductLines.WIFI_LIGHT
     color_model: str | None = None
     product_type: str = ProductTypes.BULB
-    module: ModuleType = vesyncbulb
+    module_name: str = 'pyvesync.devices.vesyncbulb'
     color_modes: list[str] = field(default_factory=list)
 
 
@@ -228,7 +232,7 @@ class FanMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.FAN
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -243,7 +247,7 @@ class FanMap(DeviceMapTemplate):
 
     product_line: str = ProductLines.WIFI_AIR
     product_type: str = ProductTypes.FAN
-    module: ModuleType = vesyncfan
+    module_name: str = 'pyvesync.devices.vesyncfan'
     fan_levels: list[int] = field(default_factory=list)
     modes: dict[str, str] = field(default_factory=dict)
     sleep_preferences: list[str] = field(default_factory=list)
@@ -258,7 +262,7 @@ class HumidifierMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.HUMIDIFIER
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -275,7 +279,7 @@ class HumidifierMap(DeviceMapTemplate):
     mist_modes: dict[str, str] = field(default_factory=dict)
     mist_levels: list[int] = field(default_factory=list)
     product_type: str = ProductTypes.HUMIDIFIER
-    module: ModuleType = vesynchumidifier
+    module_name: str = 'pyvesync.devices.vesynchumidifier'
     target_minmax: tuple[int, int] = (30, 80)
     warm_mist_levels: list[int] = field(default_factory=list)
 
@@ -289,7 +293,7 @@ class PurifierMap(DeviceMapTemplate):
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.PURIFIER
 
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -304,7 +308,7 @@ class PurifierMap(DeviceMapTemplate):
 
     product_line: str = ProductLines.WIFI_AIR
     product_type: str = ProductTypes.PURIFIER
-    module: ModuleType = vesyncpurifier
+    module_name: str = 'pyvesync.devices.vesyncpurifier'
     fan_levels: list[int] = field(default_factory=list)
     modes: list[str] = field(default_factory=list)
     nightlight_modes: list[str] = field(default_factory=list)
@@ -319,7 +323,7 @@ class AirFryerMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device - ProductTypes.AIR_FRYER
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -327,14 +331,14 @@ class AirFryerMap(DeviceMapTemplate):
         device_alias (str | None): Alias for the device, if any.
         features (list[str]): List of features for the device.
         product_type (str): Product type of the device.
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
     """
 
     temperature_range_f: tuple[int, int] = (200, 400)
     temperature_range_c: tuple[int, int] = (75, 200)
     product_line: str = ProductLines.WIFI_KITCHEN
     product_type: str = ProductTypes.AIR_FRYER
-    module: ModuleType = vesynckitchen
+    module_name: str = 'pyvesync.devices.vesynckitchen'
 
 
 @dataclass(kw_only=True)
@@ -345,7 +349,7 @@ class ThermostatMap(DeviceMapTemplate):
         dev_types (list[str]): List of device types to match from API.
         class_name (str): Class name of the device.
         product_type (str): Product type of the device.
-        module (ModuleType): Module for the device.
+        module_name (str): Import path of the module for the device.
         setup_entry (str): Setup entry for the device, if unknown use the device_type
             base without region
         model_display (str): Display name of the model.
@@ -361,7 +365,7 @@ class ThermostatMap(DeviceMapTemplate):
 
     product_line: str = ProductLines.THERMOSTAT
     product_type: str = ProductTypes.THERMOSTAT
-    module: ModuleType = vesyncthermostat
+    module_name: str = 'pyvesync.devices.vesyncthermostat'
     modes: list[int] = field(default_factory=list)
     fan_modes: list[int] = field(default_factory=list)
     eco_types: list[int] = field(default_factory=list)
@@ -1070,7 +1074,7 @@ objects for fan devices."""
 air_fryer_modules: list[AirFryerMap] = [
     AirFryerMap(
         class_name='VeSyncAirFryer158',
-        module=vesynckitchen,
+        module_name='pyvesync.devices.vesynckitchen',
         dev_types=['CS137-AF/CS158-AF', 'CS158-AF', 'CS137-AF'],
         device_alias='Air Fryer',
         model_display='CS158/159/168/169-AF Series',
@@ -1092,6 +1096,103 @@ full_device_list = [
 """List of all device configuration objects."""
 
 
+MapT = TypeVar('MapT', bound='DeviceMapTemplate')
+
+
+class _DeviceTypeIndex(Generic[MapT]):
+    """Device type lookup index for a list of device maps.
+
+    The index is built on first use and kept until `invalidate()` is called.
+    Exact device types are looked up in a dictionary. Device types that do not
+    match exactly fall back to a prefix match of the device type without its last
+    hyphenated segment, usually the region, against the lowercase device types of
+    the maps. The fallback result, including misses, is cached per device type.
+    """
+
+    __slots__ = ('_built', '_exact', '_fallback', '_modules', '_prefixes')
+
+    def __init__(self, *module_lists: Sequence[MapT]) -> None:
+        """Initialize the index for the device map lists."""
+        self._modules = module_lists
+        self._built = False
+        self._exact: dict[str, MapT] = {}
+        self._prefixes: dict[str, MapT] = {}
+        self._fallback: dict[str, MapT | None] = {}
+
+    def invalidate(self) -> None:
+        """Clear the index, it is rebuilt on the next lookup."""
+        self._built = False
+        self._exact.clear()
+        self._prefixes.clear()
+        self._fallback.clear()
+
+    def _build(self) -> None:
+        """Build the exact and prefix indexes, the first map for a key wins."""
+        for modules in self._modules:
+            for module in modules:
+                for dev_type in module.dev_types:
+                    self._exact.setdefault(dev_type, module)
+                    lowered = dev_type.lower()
+                    for end in range(1, len(lowered) + 1):
+                        self._prefixes.setdefault(lowered[:end], module)
+        self._built = True
+
+    def get(self, device_type: str) -> MapT | None:
+        """Return the device map for a device type, None if not found."""
+        if not self._built:
+            self._build()
+        module = self._exact.get(device_type)
+        if module is not None or device_type.count('-') <= 1:
+            return module
+        try:
+            return self._fallback[device_type]
+        except KeyError:
+            trimmed = device_type.rsplit('-', 1)[0].lower()
+            module = self._fallback[device_type] = self._prefixes.get(trimmed)
+            return module
+
+
+_device_index: _DeviceTypeIndex[DeviceMapTemplate] = _DeviceTypeIndex(
+    outlet_modules,
+    switch_modules,
+    bulb_modules,
+    fan_modules,
+    purifier_modules,
+    humidifier_modules,
+    air_fryer_modules,
+    thermostat_modules,
+)
+_fan_index: _DeviceTypeIndex[FanMap] = _DeviceTypeIndex(fan_modules)
+_purifier_index: _DeviceTypeIndex[PurifierMap] = _DeviceTypeIndex(purifier_modules)
+_humidifier_index: _DeviceTypeIndex[HumidifierMap] = _DeviceTypeIndex(humidifier_modules)
+_outlet_index: _DeviceTypeIndex[OutletMap] = _DeviceTypeIndex(outlet_modules)
+_switch_index: _DeviceTypeIndex[SwitchMap] = _DeviceTypeIndex(switch_modules)
+_bulb_index: _DeviceTypeIndex[BulbMap] = _DeviceTypeIndex(bulb_modules)
+_air_fryer_index: _DeviceTypeIndex[AirFryerMap] = _DeviceTypeIndex(air_fryer_modules)
+_thermostat_index: _DeviceTypeIndex[ThermostatMap] = _DeviceTypeIndex(thermostat_modules)
+_INDEXES: tuple[_DeviceTypeIndex, ...] = (
+    _device_index,
+    _fan_index,
+    _purifier_index,
+    _humidifier_index,
+    _outlet_index,
+    _switch_index,
+    _bulb_index,
+    _air_fryer_index,
+    _thermostat_index,
+)
+
+
+def invalidate_device_index() -> None:
+    """Rebuild the device type indexes on the next lookup.
+
+    Call this after adding, removing or replacing a device map in one of the
+    `<product-type>_modules` lists at runtime.
+    """
+    for index in _INDEXES:
+        index.invalidate()
+
+
 def get_device_config(device_type: str) -> DeviceMapTemplate | None:
     """Get general device details from device type to create instance.
 
@@ -1101,25 +1202,7 @@ def get_device_config(device_type: str) -> DeviceMapTemplate | None:
     Returns:
         DeviceMapTemplate | None: DeviceMapTemplate object or None if not found.
     """
-    all_modules: list[T_MAPS] = [
-        outlet_modules,
-        switch_modules,
-        bulb_modules,
-        fan_modules,
-        purifier_modules,
-        humidifier_modules,
-        air_fryer_modules,
-        thermostat_modules,
-    ]
-    for module in chain(*all_modules):
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in chain(*all_modules):
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _device_index.get(device_type)
 
 
 def get_fan(device_type: str) -> FanMap | None:
@@ -1131,16 +1214,7 @@ def get_fan(device_type: str) -> FanMap | None:
     Returns:
         FanMap | None: FanMap object or None if not found.
     """
-    for module in fan_modules:
-        if device_type in module.dev_types:
-            return module
-    # Try to match with a more generic device type
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in fan_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _fan_index.get(device_type)
 
 
 def get_purifier(device_type: str) -> PurifierMap | None:
@@ -1152,15 +1226,7 @@ def get_purifier(device_type: str) -> PurifierMap | None:
     Returns:
         PurifierMap | None: PurifierMap object or None if not found.
     """
-    for module in purifier_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in purifier_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _purifier_index.get(device_type)
 
 
 def get_humidifier(device_type: str) -> HumidifierMap | None:
@@ -1172,15 +1238,7 @@ def get_humidifier(device_type: str) -> HumidifierMap | None:
     Returns:
         HumidifierMap | None: HumidifierMap object or None if not found.
     """
-    for module in humidifier_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in humidifier_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _humidifier_index.get(device_type)
 
 
 def get_outlet(device_type: str) -> OutletMap | None:
@@ -1192,15 +1250,7 @@ def get_outlet(device_type: str) -> OutletMap | None:
     Returns:
         OutletMap | None: OutletMap object or None if not found.
     """
-    for module in outlet_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in outlet_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _outlet_index.get(device_type)
 
 
 def get_switch(device_type: str) -> SwitchMap | None:
@@ -1212,15 +1262,7 @@ def get_switch(device_type: str) -> SwitchMap | None:
     Returns:
         SwitchMap | None: SwitchMap object or None if not found.
     """
-    for module in switch_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in switch_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _switch_index.get(device_type)
 
 
 def get_bulb(device_type: str) -> BulbMap | None:
@@ -1232,15 +1274,7 @@ def get_bulb(device_type: str) -> BulbMap | None:
     Returns:
         BulbMap | None: BulbMap object or None if not found.
     """
-    for module in bulb_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in bulb_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _bulb_index.get(device_type)
 
 
 def get_air_fryer(device_type: str) -> AirFryerMap | None:
@@ -1252,15 +1286,7 @@ def get_air_fryer(device_type: str) -> AirFryerMap | None:
     Returns:
         AirFryerMap | None: AirFryerMap object or None if not found.
     """
-    for module in air_fryer_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in air_fryer_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _air_fryer_index.get(device_type)
 
 
 def get_thermostat(device_type: str) -> ThermostatMap | None:
@@ -1272,12 +1298,4 @@ def get_thermostat(device_type: str) -> ThermostatMap | None:
     Returns:
         ThermostatMap | None: The matching thermostat map or None if not found.
     """
-    for module in thermostat_modules:
-        if device_type in module.dev_types:
-            return module
-    if device_type.count('-') > 1:
-        device_type = '-'.join(device_type.split('-')[:-1])
-        for module in thermostat_modules:
-            if any(device_type.lower() in dev.lower() for dev in module.dev_types):
-                return module
-    return None
+    return _thermostat_index.get(device_type)
@@ -31,6 +31,7 @@ from pyvesync.utils.device_mixins import (
     process_bypassv2_result,
 )
 from pyvesync.utils.helpers import Helpers, Timer, Validators
+from pyvesync.utils.request_templates import request_template
 
 if TYPE_CHECKING:
     from pyvesync import VeSync
@@ -748,7 +749,7 @@ class VeSyncBulbValcenoA19MC(VeSyncBulb):
         }
         return payload_dict
 
-    def _build_request(self, payload: dict) -> dict:
+    def _build_request(self, payload: dict) -> bulb_models.RequestValcenoStatus:
         """Build request for Valceno Smart Bulb.
 
         The request is built from the keys in `self.request_keys` and the
@@ -759,7 +760,7 @@ class VeSyncBulbValcenoA19MC(VeSyncBulb):
             payload (dict): The data to use for the payload.
 
         Returns:
-            dict: The request body.
+            RequestValcenoStatus: The request body.
 
         Note:
             The `payload` argument is the value of request_body['payload'].
@@ -786,14 +787,8 @@ class VeSyncBulbValcenoA19MC(VeSyncBulb):
             }
             ```
         """
-        default_dict = Helpers.get_defaultvalues_attributes(self.request_keys)
-        default_dict.update(Helpers.get_device_attributes(self, self.request_keys))
-        default_dict.update(
-            Helpers.get_manager_attributes(self.manager, self.request_keys)
-        )
-        default_dict['method'] = 'bypassV2'
-        default_dict['payload'] = payload
-        return default_dict
+        template = request_template(bulb_models.RequestValcenoStatus, self.request_keys)
+        return template.build(self, {'method': 'bypassV2', 'payload': payload})
 
     async def _call_valceno_api(
         self, payload_method: str, payload_data: Mapping
@@ -35,9 +35,11 @@ from typing_extensions import deprecated
 
 from pyvesync.base_devices import FryerState, VeSyncFryer
 from pyvesync.const import AIRFRYER_PID_MAP, ConnectionStatus, DeviceStatus
+from pyvesync.models.fryer_models import RequestFryerBypass
 from pyvesync.utils.errors import VeSyncError
 from pyvesync.utils.helpers import Helpers
 from pyvesync.utils.logs import LibraryLogger
+from pyvesync.utils.request_templates import request_template
 
 if TYPE_CHECKING:
     from pyvesync import VeSync
@@ -418,9 +420,8 @@ class VeSyncAirFryer158(VeSyncFryer):
         method: str | None = None,
     ) -> dict:
         """Return body of api calls."""
-        req_dict = Helpers.get_defaultvalues_attributes(self.request_keys)
-        req_dict.update(Helpers.get_manager_attributes(self.manager, self.request_keys))
-        req_dict.update(Helpers.get_device_attributes(self, self.request_keys))
+        template = request_template(RequestFryerBypass, self.request_keys)
+        req_dict = template.fields(self)
         req_dict['method'] = method or 'bypass'
         req_dict['jsonCmd'] = json_cmd or {}
         return req_dict
@@ -594,10 +595,6 @@ class VeSyncAirFryer158(VeSyncFryer):
             return False
         return await self._set_cook(status='cooking')
 
-    async def update(self) -> None:
-        """Update the device details."""
-        await self.get_details()
-
     @property
     def _cmd_api_base(self) -> dict:
         """Return Base api dictionary for setting status."""
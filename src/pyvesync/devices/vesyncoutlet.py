@@ -48,6 +48,7 @@ from pyvesync.utils.device_mixins import (
 )
 from pyvesync.utils.helpers import Helpers, Timer
 from pyvesync.utils.logs import LibraryLogger
+from pyvesync.utils.request_templates import request_template
 
 if TYPE_CHECKING:
     from pyvesync import VeSync
@@ -757,13 +758,8 @@ class VeSyncOutletWHOGPlug(BypassV2Mixin, VeSyncOutlet):
         Returns:
             bytes: The response from the API request.
         """
-        keys = BypassV1Mixin.request_keys
-        body = Helpers.get_defaultvalues_attributes(keys)
-        body.update(Helpers.get_manager_attributes(self.manager, keys))
-        body.update(Helpers.get_device_attributes(self, keys))
-        body['method'] = method
-        body.update(update_dict or {})
-        model_instance = request_model.from_dict(body)
+        template = request_template(request_model, BypassV1Mixin.request_keys)
+        model_instance = template.build(self, {'method': method, **(update_dict or {})})
         url_path = '/cloud/v1/outlet/getELECConsumePerMonthLastYear'
         resp_dict, _ = await self.manager.async_call_api(
             url_path, 'post', model_instance, Helpers.req_header_bypass()
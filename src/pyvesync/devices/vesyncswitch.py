@@ -64,6 +64,15 @@ class VeSyncWallSwitch(BypassV1Mixin, VeSyncSwitch):
         """
         super().__init__(details, manager, feature_map)
 
+    def update_from_device_list(self, details: ResponseDeviceDetailsModel) -> bool:
+        """Refresh power and connection status, which is the full switch state.
+
+        The list entry covers the switch only if it reports the switch as on or off,
+        other power states are refreshed by `get_details()`.
+        """
+        covered = super().update_from_device_list(details)
+        return covered or details.deviceStatus in (DeviceStatus.ON, DeviceStatus.OFF)
+
     async def get_details(self) -> None:
         r_dict = await self.call_bypassv1_api(
             RequestBypassV1, method='deviceDetail', endpoint='deviceDetail'
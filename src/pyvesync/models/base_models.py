@@ -53,6 +53,7 @@ class BaseModelConfig(BaseConfig):
     """Base config for dataclasses."""
 
     orjson_options = orjson.OPT_NON_STR_KEYS
+    lazy_compilation = True
 
 
 @dataclass
@@ -82,6 +83,7 @@ class ResponseBaseModel(DataClassORJSONMixin):
 
         orjson_options = orjson.OPT_NON_STR_KEYS
         forbid_extra_keys = False
+        lazy_compilation = True
 
 
 @dataclass
@@ -14,7 +14,11 @@ from mashumaro import field_options
 from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
-from pyvesync.models.base_models import ResponseBaseModel, ResponseCodeModel
+from pyvesync.models.base_models import (
+    RequestBaseModel,
+    ResponseBaseModel,
+    ResponseCodeModel,
+)
 from pyvesync.models.bypass_models import BypassV2InnerResult, RequestBypassV1
 
 
@@ -156,6 +160,26 @@ class ResponseESL100MCResult(BypassV2InnerResult):
     blue: int = 0
 
 
+@dataclass
+class RequestValcenoStatus(RequestBaseModel):
+    """Request model for Valceno bulb bypassV2 calls."""
+
+    acceptLanguage: str
+    accountID: str
+    appVersion: str
+    cid: str
+    configModule: str
+    debugMode: bool
+    deviceRegion: str
+    method: str
+    phoneBrand: str
+    phoneOS: str
+    timeZone: str
+    token: str
+    traceId: str
+    payload: dict
+
+
 @dataclass
 class ResponseValcenoStatus(ResponseCodeModel):
     """Response model for Valceno bulb status."""
@@ -4,7 +4,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from pyvesync.models.base_models import ResponseBaseModel
+from pyvesync.models.base_models import RequestBaseModel, ResponseBaseModel
+
+
+@dataclass
+class RequestFryerBypass(RequestBaseModel):
+    """Request model for air fryer bypass calls."""
+
+    acceptLanguage: str
+    accountID: str
+    appVersion: str
+    cid: str
+    configModule: str
+    debugMode: bool
+    deviceRegion: str
+    method: str
+    phoneBrand: str
+    phoneOS: str
+    pid: str
+    timeZone: str
+    token: str
+    traceId: str
+    userCountryCode: str
+    uuid: str
+    jsonCmd: dict
 
 
 @dataclass
@@ -0,0 +1,342 @@
+"""Circuit breakers for VeSync API base URLs and devices.
+
+The manager keeps a `CircuitBreakerRegistry` with one `CircuitBreaker` per API base
+URL and one per device cid. Each request made through `VeSync.async_call_api` checks
+the breakers for its base URL and device before it is sent.
+
+- **closed**: requests are sent. After `failure_threshold` consecutive failures the
+    circuit opens.
+- **open**: requests fail immediately with `VeSyncCircuitOpenError` until
+    `recovery_timeout` seconds have passed.
+- **half-open**: up to `half_open_max_calls` trial requests are sent. A successful
+    trial closes the circuit, a failed trial opens it again.
+
+Connection errors, timeouts, server error responses and 5xx status codes count as
+failures. Other responses count as successes, since the server answered. Rate
+limiting is left to the rate limiter and does not open circuits.
+State changes are passed to listeners registered with
+`CircuitBreakerRegistry.add_listener()`.
+
+Example:
+    Log every circuit transition:
+
+    ```python
+    from pyvesync import VeSync
+    from pyvesync.utils.circuit_breaker import CircuitBreakerConfig
+
+    manager = VeSync(
+        'user',
+        'password',
+        circuit_breaker_config=CircuitBreakerConfig(failure_threshold=3),
+    )
+    manager.circuit_breakers.add_listener(print)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientError
+
+from pyvesync.const import STATUS_SERVER_ERROR
+from pyvesync.utils.errors import (
+    VeSyncAPIStatusCodeError,
+    VeSyncCircuitOpenError,
+    VeSyncServerError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states.
+
+    Attributes:
+        CLOSED: Requests are sent normally.
+        OPEN: Requests are rejected without being sent.
+        HALF_OPEN: A limited number of trial requests are sent.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+@dataclass(kw_only=True)
+class CircuitBreakerConfig:
+    """Configuration for circuit breakers.
+
+    Attributes:
+        failure_threshold (int | None): Consecutive failures that open a circuit,
+            None to disable circuit breakers.
+        recovery_timeout (float): Seconds an open circuit rejects requests before
+            allowing trial requests.
+        half_open_max_calls (int): Trial requests allowed at once while half-open.
+    """
+
+    failure_threshold: int | None = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass
+class CircuitBreakerEvent:
+    """Circuit breaker state transition.
+
+    Attributes:
+        key (str): Circuit key, `url:<base url>` or `device:<cid>`.
+        previous_state (CircuitState): State before the transition.
+        state (CircuitState): State after the transition.
+        failure_count (int): Consecutive failures at the time of the transition.
+        timestamp (float): UNIX timestamp of the transition.
+    """
+
+    key: str
+    previous_state: CircuitState
+    state: CircuitState
+    failure_count: int
+    timestamp: float
+
+
+def is_circuit_failure(exc: BaseException) -> bool:
+    """Return True if an exception counts as a failure for circuit breakers."""
+    if isinstance(exc, VeSyncAPIStatusCodeError):
+        status = exc.status_code
+        if status is None or not status.isdigit():
+            return False
+        return int(status) >= STATUS_SERVER_ERROR
+    return isinstance(exc, (ClientError, TimeoutError, VeSyncServerError))
+
+
+def _call_listener(
+    listener: Callable[[CircuitBreakerEvent], None], event: CircuitBreakerEvent
+) -> None:
+    """Call a transition listener, logging instead of raising its errors."""
+    try:
+        listener(event)
+    except Exception:
+        logger.exception('Error in circuit breaker listener')
+
+
+def url_key(base_url: str) -> str:
+    """Return the circuit key for an API base URL."""
+    return f'url:{base_url}'
+
+
+def device_key(cid: str) -> str:
+    """Return the circuit key for a device cid."""
+    return f'device:{cid}'
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single base URL or device.
+
+    Args:
+        key (str): Circuit key.
+        config (CircuitBreakerConfig): Circuit breaker settings.
+        on_transition (Callable[[CircuitBreakerEvent], None]): Called on every
+            state change.
+    """
+
+    __slots__ = (
+        '_config',
+        '_failure_count',
+        '_half_open_calls',
+        '_on_transition',
+        '_opened_at',
+        '_state',
+        'key',
+    )
+
+    def __init__(
+        self,
+        key: str,
+        config: CircuitBreakerConfig,
+        on_transition: Callable[[CircuitBreakerEvent], None],
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.key = key
+        self._config = config
+        self._on_transition = on_transition
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._half_open_calls = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current circuit state."""
+        return self._state
+
+    @property
+    def failure_count(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failure_count
+
+    def _transition(self, state: CircuitState) -> None:
+        """Change state and notify listeners."""
+        previous_state, self._state = self._state, state
+        self._half_open_calls = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        logger.debug('Circuit %s changed from %s to %s', self.key, previous_state, state)
+        self._on_transition(
+            CircuitBreakerEvent(
+                key=self.key,
+                previous_state=previous_state,
+                state=state,
+                failure_count=self._failure_count,
+                timestamp=time.time(),
+            )
+        )
+
+    def allow(self) -> None:
+        """Check that a request may be sent, reserving a trial slot if half-open.
+
+        Raises:
+            VeSyncCircuitOpenError: If the circuit rejects the request.
+        """
+        if self._state == CircuitState.CLOSED:
+            return
+        if self._state == CircuitState.OPEN:
+            remaining = self._opened_at + self._config.recovery_timeout - time.monotonic()
+            if remaining > 0:
+                raise VeSyncCircuitOpenError(self.key, remaining)
+            self._transition(CircuitState.HALF_OPEN)
+        if self._half_open_calls >= self._config.half_open_max_calls:
+            raise VeSyncCircuitOpenError(self.key, 0.0)
+        self._half_open_calls += 1
+
+    def release(self) -> None:
+        """Return a trial slot for a request that finished without an outcome."""
+        if self._state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self._failure_count = 0
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self._failure_count += 1
+        threshold = self._config.failure_threshold
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and threshold is not None
+            and self._failure_count >= threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by base URL and device.
+
+    Args:
+        config (CircuitBreakerConfig | None): Circuit breaker settings, defaults
+            to `CircuitBreakerConfig()`.
+    """
+
+    __slots__ = ('_breakers', '_config', '_listeners')
+
+    def __init__(self, config: CircuitBreakerConfig | None = None) -> None:
+        """Initialize the registry."""
+        self._config = config or CircuitBreakerConfig()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._listeners: list[Callable[[CircuitBreakerEvent], None]] = []
+
+    @property
+    def config(self) -> CircuitBreakerConfig:
+        """Return the circuit breaker configuration."""
+        return self._config
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if circuit breakers are enabled."""
+        return self._config.failure_threshold is not None
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Return the circuit breaker for a key, creating it if needed."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, self._config, self._emit)
+            self._breakers[key] = breaker
+        return breaker
+
+    def state(self, key: str) -> CircuitState:
+        """Return the state of a circuit, closed if it has not been used."""
+        breaker = self._breakers.get(key)
+        return CircuitState.CLOSED if breaker is None else breaker.state
+
+    def acquire(self, *keys: str) -> list[CircuitBreaker]:
+        """Check the circuits a request passes through.
+
+        Args:
+            *keys (str): Circuit keys of the request.
+
+        Returns:
+            list[CircuitBreaker]: Breakers to report the request outcome to, empty
+                if circuit breakers are disabled.
+
+        Raises:
+            VeSyncCircuitOpenError: If any of the circuits rejects the request.
+        """
+        if not self.enabled:
+            return []
+        breakers: list[CircuitBreaker] = []
+        for key in keys:
+            breaker = self.get(key)
+            try:
+                breaker.allow()
+            except VeSyncCircuitOpenError:
+                for allowed in breakers:
+                    allowed.release()
+                raise
+            breakers.append(breaker)
+        return breakers
+
+    def record(self, breakers: list[CircuitBreaker], exc: BaseException | None) -> None:
+        """Report the outcome of a request to the breakers from `acquire()`.
+
+        Args:
+            breakers (list[CircuitBreaker]): Breakers returned by `acquire()`.
+            exc (BaseException | None): Exception raised by the request, None if
+                it succeeded.
+        """
+        for breaker in breakers:
+            if isinstance(exc, asyncio.CancelledError):
+                breaker.release()
+            elif exc is not None and is_circuit_failure(exc):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def add_listener(
+        self, listener: Callable[[CircuitBreakerEvent], None]
+    ) -> Callable[[], None]:
+        """Register a callback for circuit state transitions.
+
+        Args:
+            listener (Callable[[CircuitBreakerEvent], None]): Called with a
+                `CircuitBreakerEvent` on every transition.
+
+        Returns:
+            Callable[[], None]: Function that removes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _emit(self, event: CircuitBreakerEvent) -> None:
+        """Pass a transition event to all listeners."""
+        for listener in list(self._listeners):
+            _call_listener(listener, event)
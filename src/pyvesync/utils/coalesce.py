@@ -0,0 +1,116 @@
+"""Coalescing of identical in-flight device reads.
+
+The manager's `RequestCoalescer` lets concurrent callers that make the same read
+share a single call. The first caller for a key starts the call, callers arriving
+while it is still in flight await the same result instead of sending another
+request. Once the call finishes the key is released, so the next read goes out
+to the API again. Nothing is cached. A cancelled caller does not cancel the shared
+call for the others, the call is only cancelled once every caller has been
+cancelled.
+
+Two layers use the coalescer:
+
+- `VeSyncBaseDevice.update()` is keyed on the device `cid` and `sub_device_no`, so
+    overlapping updates of the same device share one `get_details()` call and
+    one parsed result.
+- `BypassV2Mixin.call_bypassv2_api` and `BypassV1Mixin.call_bypassv1_api` coalesce
+    read requests, keyed on the device, endpoint, payload method and request data.
+    Requests that change the device state are never coalesced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+T = TypeVar('T')
+
+_READ_METHODS = frozenset({'deviceDetail'})
+
+
+def is_read_method(method: str) -> bool:
+    """Return True if an API method only reads device state.
+
+    Args:
+        method (str): Payload method or bypass V1 method name, e.g.
+            `getPurifierStatus` or `deviceDetail`.
+    """
+    return method.startswith('get') or method in _READ_METHODS
+
+
+def request_key(*parts: str | int | None, data: dict | None = None) -> tuple:
+    """Build a hashable coalescing key from identifiers and request data.
+
+    Args:
+        *parts (str | int | None): Identifiers such as cid, sub device number and
+            payload method.
+        data (dict | None): Request data, serialized with sorted keys so that
+            equal dictionaries produce equal keys.
+
+    Returns:
+        tuple: Key for `RequestCoalescer.run()`.
+    """
+    return (*parts, orjson.dumps(data or {}, option=orjson.OPT_SORT_KEYS))
+
+
+class RequestCoalescer:
+    """Share in-flight calls between concurrent callers with the same key."""
+
+    __slots__ = ('_coalesced_count', '_in_flight', '_waiters')
+
+    def __init__(self) -> None:
+        """Initialize the request coalescer."""
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._waiters: dict[asyncio.Future[Any], int] = {}
+        self._coalesced_count = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of distinct calls in flight."""
+        return len(self._in_flight)
+
+    @property
+    def coalesced_count(self) -> int:
+        """Return the number of callers that joined a call already in flight."""
+        return self._coalesced_count
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run `func`, or join the call in flight for the same key.
+
+        Args:
+            key (Hashable): Identity of the call.
+            func (Callable[[], Awaitable[T]]): Coroutine function to start if no
+                call with the key is in flight.
+
+        Returns:
+            T: Result of the shared call. Exceptions are raised to every caller.
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._coalesced_count += 1
+        else:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            # Shield the shared call so one cancelled caller does not cancel the others
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._waiters[future] == 1:
+                future.cancel()
+            raise
+        finally:
+            self._waiters[future] -= 1
+            if self._waiters[future] == 0:
+                del self._waiters[future]
+
+    def _release(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Remove a finished call from the in-flight table."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
@@ -15,15 +15,20 @@ from typing import TYPE_CHECKING, TypeVar
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from pyvesync.models.bypass_models import (
+    BypassV2RequestPayload,
     RequestBypassV1,
     RequestBypassV2,
 )
+from pyvesync.utils.coalesce import is_read_method, request_key
 from pyvesync.utils.helpers import Helpers
 from pyvesync.utils.logs import LibraryLogger
+from pyvesync.utils.request_templates import request_template
+from pyvesync.utils.response import ResponseEnvelope
 
 if TYPE_CHECKING:
     from pyvesync import VeSync
     from pyvesync.base_devices import VeSyncBaseDevice
+    from pyvesync.utils.helpers import FieldCache
 
 T_MODEL = TypeVar('T_MODEL', bound=DataClassORJSONMixin)
 
@@ -56,22 +61,22 @@ def process_bypassv1_result(
     r_dict = Helpers.process_dev_response(logger, method, device, resp_dict)
     if r_dict is None or 'result' not in r_dict:
         return None
+    r_dict = ResponseEnvelope.wrap(r_dict)
     result = r_dict['result']
-    return Helpers.model_maker(logger, model, method, result, device)
+    return r_dict.result_model(
+        model, lambda: Helpers.model_maker(logger, model, method, result, device)
+    )
 
 
 def _get_inner_result(
     device: VeSyncBaseDevice,
     logger: Logger,
     method: str,
-    resp_dict: dict,
+    resp_dict: ResponseEnvelope,
 ) -> dict | None:
     """Process the code in the result field of Bypass V2."""
-    try:
-        outer_result = resp_dict['result']
-        inner_result = outer_result['result']
-        code = int(outer_result['code'])
-    except (ValueError, TypeError, KeyError):
+    outer_result = resp_dict.result
+    if outer_result is None or 'code' not in outer_result or 'result' not in outer_result:
         LibraryLogger.error_device_response_content(
             logger,
             device,
@@ -79,10 +84,8 @@ def _get_inner_result(
             'Error processing bypass V2 API response result.',
         )
         return None
-
-    if code != 0:
-        return None
-    return inner_result
+    # The outer and result codes were checked once by the envelope
+    return resp_dict.inner_result
 
 
 def process_bypassv2_result(
@@ -96,7 +99,7 @@ def process_bypassv2_result(
 
     This will gracefully handle errors in the response and error codes,
     logging them as needed. The return dictionary is the **inner** result value of
-    the API response.
+    the API response. The model is built once per response and model class.
 
     Args:
         device (VeSyncBaseDevice): The device object.
@@ -111,10 +114,13 @@ def process_bypassv2_result(
     r_dict = Helpers.process_dev_response(logger, method, device, resp_dict)
     if r_dict is None:
         return None
+    r_dict = ResponseEnvelope.wrap(r_dict)
     result = _get_inner_result(device, logger, method, r_dict)
-    if not isinstance(result, dict):
+    if result is None:
         return None
-    return Helpers.model_maker(logger, model, method, result, device)
+    return r_dict.result_model(
+        model, lambda: Helpers.model_maker(logger, model, method, result, device)
+    )
 
 
 class BypassV2Mixin:
@@ -126,6 +132,9 @@ class BypassV2Mixin:
 
     if TYPE_CHECKING:
         manager: VeSync
+        cid: str
+        sub_device_no: int | None
+        _field_cache: FieldCache
 
     __slots__ = ()
     request_keys: tuple[str, ...] = (
@@ -160,14 +169,11 @@ class BypassV2Mixin:
             method (str): The method to use in the outer body, defaults to bypassV2.
             payload_update (dict | None): Additional keys to add to the payload.
         """
-        body = {}
-        body = Helpers.get_defaultvalues_attributes(self.request_keys).copy()
-        body.update(Helpers.get_manager_attributes(self.manager, self.request_keys))
-        body.update(Helpers.get_device_attributes(self, self.request_keys))
-        body['method'] = method
-        body['payload'] = {'method': payload_method, 'source': 'APP', 'data': data or {}}
-        body['payload'] |= payload_update or {}
-        return RequestBypassV2.from_dict(body)
+        payload = BypassV2RequestPayload(
+            data=data or {}, method=payload_method, **(payload_update or {})
+        )
+        template = request_template(RequestBypassV2, self.request_keys)
+        return template.build(self, {'method': method, 'payload': payload})
 
     async def call_bypassv2_api(
         self,
@@ -180,6 +186,7 @@ class BypassV2Mixin:
         """Send Bypass V2 API request.
 
         This uses the `_build_request` method to send API requests to the Bypass V2 API.
+        Concurrent identical read requests for the same device share one API call.
 
         Args:
             payload_method (str): The method to use in the payload dict.
@@ -192,12 +199,27 @@ class BypassV2Mixin:
         Returns:
             bytes: The response from the API request.
         """
-        request = self._build_request(payload_method, data, method, payload_update)
-        endpoint = BYPASS_V2_BASE + endpoint
-        resp_dict, _ = await self.manager.async_call_api(
-            endpoint, 'post', request, Helpers.req_header_bypass()
+        url_path = BYPASS_V2_BASE + endpoint
+
+        async def send() -> dict | None:
+            request = self._build_request(payload_method, data, method, payload_update)
+            with LibraryLogger.api_caller(f'{type(self).__name__}.{payload_method}'):
+                resp_dict, _ = await self.manager.async_call_api(
+                    url_path, 'post', request, Helpers.req_header_bypass()
+                )
+            return resp_dict
+
+        if not is_read_method(payload_method):
+            return await send()
+        key = request_key(
+            self.cid,
+            self.sub_device_no,
+            url_path,
+            method,
+            payload_method,
+            data={'data': data, 'payload': payload_update},
         )
-        return resp_dict
+        return await self.manager.coalescer.run(key, send)
 
 
 class BypassV1Mixin:
@@ -211,6 +233,9 @@ class BypassV1Mixin:
 
     if TYPE_CHECKING:
         manager: VeSync
+        cid: str
+        sub_device_no: int | None
+        _field_cache: FieldCache
 
     __slots__ = ()
     request_keys: tuple[str, ...] = (
@@ -248,12 +273,8 @@ class BypassV1Mixin:
             RequestBypassV1: The request body for the Bypass V1 endpoint, the correct
             model is determined from the RequestBypassV1 discriminator.
         """
-        body = Helpers.get_defaultvalues_attributes(self.request_keys).copy()
-        body.update(Helpers.get_manager_attributes(self.manager, self.request_keys))
-        body.update(Helpers.get_device_attributes(self, self.request_keys))
-        body['method'] = method
-        body.update(update_dict or {})
-        return request_model.from_dict(body)
+        template = request_template(request_model, self.request_keys)
+        return template.build(self, {'method': method, **(update_dict or {})})
 
     async def call_bypassv1_api(
         self,
@@ -265,7 +286,8 @@ class BypassV1Mixin:
         """Send ByPass V1 API request.
 
         This uses the `_build_request` method to send API requests to the Bypass V1 API.
-        The endpoint can be overridden with the `endpoint` argument.
+        The endpoint can be overridden with the `endpoint` argument. Concurrent
+        identical read requests for the same device share one API call.
 
         Args:
             request_model (type[RequestBypassV1]): The request model to use.
@@ -277,10 +299,24 @@ class BypassV1Mixin:
         Returns:
             bytes: The response from the API request.
         """
-        request = self._build_request(request_model, update_dict, method)
         url_path = BYPASS_V1_PATH + endpoint
-        resp_dict, _ = await self.manager.async_call_api(
-            url_path, 'post', request, Helpers.req_header_bypass()
-        )
 
-        return resp_dict
+        async def send() -> dict | None:
+            request = self._build_request(request_model, update_dict, method)
+            with LibraryLogger.api_caller(f'{type(self).__name__}.{method}'):
+                resp_dict, _ = await self.manager.async_call_api(
+                    url_path, 'post', request, Helpers.req_header_bypass()
+                )
+            return resp_dict
+
+        if not is_read_method(method):
+            return await send()
+        key = request_key(
+            self.cid,
+            self.sub_device_no,
+            url_path,
+            method,
+            request_model.__name__,
+            data=update_dict,
+        )
+        return await self.manager.coalescer.run(key, send)
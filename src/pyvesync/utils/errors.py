@@ -10,6 +10,10 @@ as well.
 This is used by the `pyvesync.utils.helpers.Helpers.process_dev_response` method to
 retrieve response code information and store in the `last_response` device instance.
 
+`find_error_code` searches a nested response for its error code in a single
+iterative pass, and `ErrorCodes.get_error_info` looks the code up in `ERROR_TABLE`.
+Successful responses share the `SUCCESS_RESPONSE` instance.
+
 
 The "check_device" key of the error dictionary is used to determine if the logger
 should emit a warning to the user for critical device errors, such as a short
@@ -47,10 +51,12 @@ from types import MappingProxyType
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 
-@dataclass
+@dataclass(frozen=True)
 class ResponseInfo(DataClassORJSONMixin):
     """Class holding response information and error code definitions and lookup methods.
 
+    Instances are frozen, use `dataclasses.replace()` to change a field.
+
     Attributes:
         name (str): Name of the error
         error_type (ErrorTypes): Type of the error see `ErrorTypes`
@@ -742,6 +748,11 @@ class ErrorCodes:
     ) -> ResponseInfo:
         """Return error dictionary for the given error code.
 
+        Codes are looked up in `ERROR_TABLE`, falling back to the bucket of the
+        code rounded towards zero to a multiple of 1000. A success without a
+        message returns the shared `SUCCESS_RESPONSE` instance, every other code
+        returns a new instance.
+
         Args:
             error_code (str | int): Error code to lookup.
             msg: (str | None): Optional message from API.
@@ -757,30 +768,26 @@ class ErrorCodes:
             )
             ```
         """
+        if error_code == 0 and msg is None:
+            return SUCCESS_RESPONSE
         try:
-            if error_code is None:
-                error_code = '-999999999'
-            error_str = str(error_code)
-            error_int = int(error_code)
-            if error_str == '0':
-                error_info = ResponseInfo('SUCCESS', ErrorTypes.SUCCESS, 'Success')
-            elif error_str in cls.errors:
-                error_info = cls.errors[error_str]
-            else:
-                error_code = int(error_int / 1000) * 1000
-                error_info = cls.errors[str(error_code)]
-
-            error_info = replace(error_info)
-            if msg is not None:
-                error_info.message = f'{error_info.message} - {msg}'
-            error_info.code = error_int
-
-        except (ValueError, TypeError, KeyError):
-            error_info = ResponseInfo(
-                'UNKNOWN', ErrorTypes.UNKNOWN_ERROR, 'Unknown error'
-            )
-
-        return error_info
+            error_int = -999999999 if error_code is None else int(error_code)
+        except (ValueError, TypeError):
+            return ResponseInfo('UNKNOWN', ErrorTypes.UNKNOWN_ERROR, 'Unknown error')
+        base_info = SUCCESS_RESPONSE
+        if error_int == 0:
+            if msg is None:
+                return SUCCESS_RESPONSE
+        else:
+            table_info = ERROR_TABLE.get(error_int)
+            if table_info is None:
+                table_info = ERROR_TABLE.get(_error_bucket(error_int))
+            if table_info is None:
+                return ResponseInfo('UNKNOWN', ErrorTypes.UNKNOWN_ERROR, 'Unknown error')
+            base_info = table_info
+        if msg is None:
+            return replace(base_info, code=error_int)
+        return replace(base_info, code=error_int, message=f'{base_info.message} - {msg}')
 
     @classmethod
     def is_critical(cls, error_code: str | int) -> bool:
@@ -796,6 +803,81 @@ class ErrorCodes:
         return bool(error_info.critical_error)
 
 
+SUCCESS_RESPONSE = ResponseInfo('SUCCESS', ErrorTypes.SUCCESS, 'Success', code=0)
+"""Shared, frozen `ResponseInfo` of successful responses."""
+
+ERROR_TABLE: MappingProxyType[int, ResponseInfo] = MappingProxyType(
+    {int(code): info for code, info in ErrorCodes.errors.items()}
+)
+"""`ErrorCodes.errors` keyed by integer code, built once at import."""
+
+ERROR_CODE_KEYS = ('error', 'code', 'error_code', 'errorCode')
+MAX_ERROR_DEPTH = 8
+
+
+def _error_bucket(error_code: int) -> int:
+    """Return the code rounded towards zero to a multiple of 1000."""
+    if error_code < 0:
+        return -(-error_code // 1000 * 1000)
+    return error_code // 1000 * 1000
+
+
+def find_error_code(
+    response: dict, max_depth: int = MAX_ERROR_DEPTH
+) -> tuple[int, str | None]:
+    """Find the error code and message of an API response in one pass.
+
+    A non-zero outer `code` is returned directly. Otherwise the nested dictionaries
+    and lists are traversed iteratively, up to `max_depth` levels, looking for
+    every key in `ERROR_CODE_KEYS` at once. Only non-zero integer values count.
+    When several codes are found, a code under a later key in `ERROR_CODE_KEYS`
+    wins, and between equal keys the code found last.
+
+    Args:
+        response (dict): Decoded API response.
+        max_depth (int): Levels below the outer dictionary to search.
+
+    Returns:
+        tuple[int, str | None]: Error code, 0 if none was found, and its message.
+    """
+    outside_code = response.get('code')
+    if outside_code is not None and str(outside_code) != '0':
+        return int(outside_code), response.get('msg')
+
+    found_code = 0
+    found_msg: str | None = None
+    found_rank = -1
+    stack: list[tuple[object, int]] = [(response, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, list):
+            if depth < max_depth:
+                stack.extend((item, depth + 1) for item in reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        for rank, key in enumerate(ERROR_CODE_KEYS):
+            value = node.get(key)
+            if (
+                rank >= found_rank
+                and isinstance(value, int)
+                and value != 0
+                and not isinstance(value, bool)
+            ):
+                result = node.get('result')
+                found_msg = node.get('msg') or (
+                    result.get('msg') if isinstance(result, dict) else None
+                )
+                found_code, found_rank = value, rank
+        if depth < max_depth:
+            stack.extend(
+                (value, depth + 1)
+                for value in reversed(node.values())
+                if isinstance(value, (dict, list))
+            )
+    return found_code, found_msg
+
+
 class VeSyncError(Exception):
     """Base exception for VeSync errors.
 
@@ -853,12 +935,28 @@ class VeSyncAPIStatusCodeError(VeSyncError):
 
     def __init__(self, status_code: str | None = None) -> None:
         """Initialize the exception with a message."""
+        self.status_code = status_code
         message = 'VeSync API returned an unknown status code'
         if status_code is not None:
             message = f'VeSync API returned status code {status_code}'
         super().__init__(message)
 
 
+class VeSyncCircuitOpenError(VeSyncError):
+    """Exception raised when a request is rejected by an open circuit breaker.
+
+    Attributes:
+        key (str): Circuit that rejected the request, e.g. `device:<cid>`.
+        retry_after (float): Seconds until the circuit allows a trial request.
+    """
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        """Initialize the exception with the circuit key and retry delay."""
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f'Circuit open for {key}, retry in {retry_after:.1f} seconds')
+
+
 def raise_api_errors(error_info: ResponseInfo) -> None:
     """Raise the appropriate exception for API error code.
 
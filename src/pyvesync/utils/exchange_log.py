@@ -0,0 +1,263 @@
+"""Ring buffer of recent VeSync API exchanges.
+
+The manager keeps an `ExchangeLog` with the last API requests made through
+`VeSync.async_call_api`, one buffer for all requests and one per device cid. Each
+entry is an `ApiExchange` with the endpoint, payload method, status, latency and
+`ResponseInfo` of the request.
+
+Failed requests are always recorded, with the redacted request and response bodies.
+Bodies are redacted whether or not the manager redacts its debug logs. Successful
+requests are recorded with probability `sample_rate`, their bodies are only kept
+when `success_bodies` is set. This gives post-mortem detail of recent errors
+without logging every request at debug level.
+
+Example:
+    Record one in ten successful requests and dump the buffer after an error:
+
+    ```python
+    from pyvesync import VeSync
+    from pyvesync.utils.exchange_log import ExchangeLogConfig
+
+    manager = VeSync(
+        'user', 'password', exchange_log_config=ExchangeLogConfig(sample_rate=0.1)
+    )
+    ...
+    print(manager.exchange_log.dump())
+    ```
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+import orjson
+
+from pyvesync.utils.logs import REDACT_PATTERN, LibraryLogger
+from pyvesync.utils.response import ResponseEnvelope
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pyvesync.utils.errors import ResponseInfo
+    from pyvesync.utils.request_timing import RequestTiming
+    from pyvesync.utils.transport import RequestBody
+
+
+@dataclass(kw_only=True)
+class ExchangeLogConfig:
+    """Configuration for the API exchange ring buffer.
+
+    Attributes:
+        size (int): Number of exchanges kept for all requests, 0 to disable the
+            exchange log.
+        device_size (int): Number of exchanges kept per device cid.
+        max_devices (int): Number of device cids with their own buffer, the
+            buffer of the device recorded least recently is dropped first.
+        sample_rate (float): Fraction of successful requests recorded, failed
+            requests are always recorded.
+        success_bodies (bool): Keep the request and response bodies of recorded
+            successful requests.
+    """
+
+    size: int = 100
+    device_size: int = 10
+    max_devices: int = 256
+    sample_rate: float = 0.0
+    success_bodies: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class ApiExchange:
+    """Record of one API request.
+
+    Attributes:
+        timestamp (float): Unix time the response was received.
+        endpoint (str): API path of the request.
+        payload_method (str | None): Payload method of bypass requests, e.g.
+            `getPurifierStatus`, or the outer `method` of the body.
+        cid (str | None): Device cid of the request, if any.
+        status (int | None): HTTP status code, None if no response was received.
+        latency (float): Seconds from sending the request to parsing the response.
+        response_info (ResponseInfo | None): Response code information, None if the
+            response could not be parsed.
+        error (str | None): Exception raised by the request, if any.
+        request_body (str | None): Redacted request body.
+        response_body (str | None): Redacted response body.
+        timing (RequestTiming | None): Connection level timing of the request.
+    """
+
+    timestamp: float
+    endpoint: str
+    payload_method: str | None
+    cid: str | None
+    status: int | None
+    latency: float
+    response_info: ResponseInfo | None
+    error: str | None = None
+    request_body: str | None = None
+    response_body: str | None = None
+    timing: RequestTiming | None = None
+
+    def to_dict(self) -> dict:
+        """Return the exchange as a JSON serializable dictionary."""
+        exchange = asdict(self)
+        if self.timing is not None:
+            exchange['timing'] = self.timing.to_dict()
+        if self.response_info is not None:
+            exchange['response_info'] = {
+                'name': self.response_info.name,
+                'error_type': str(self.response_info.error_type),
+                'code': self.response_info.code,
+                'message': self.response_info.message,
+            }
+        return exchange
+
+
+def _redacted_body(body: Mapping) -> str | None:
+    """Return a body as indented JSON with the sensitive values redacted."""
+    printed = LibraryLogger.api_printer(body)
+    if printed is None:
+        return None
+    return REDACT_PATTERN.sub('##_REDACTED_##', printed)
+
+
+def payload_method(request_body: RequestBody | None) -> str | None:
+    """Return the payload method of a request body, or its outer method."""
+    if request_body is None:
+        return None
+    payload = request_body.get('payload')
+    if isinstance(payload, dict):
+        method = payload.get('method')
+    else:
+        method = getattr(payload, 'method', None)
+    if method is None:
+        method = request_body.get('method')
+    return method if isinstance(method, str) else None
+
+
+class ExchangeLog:
+    """Bounded buffers of recent API exchanges, globally and per device.
+
+    Recording and snapshots run synchronously on the event loop, so a snapshot
+    never sees a partially recorded exchange.
+
+    Args:
+        config (ExchangeLogConfig | None): Buffer settings, defaults to
+            `ExchangeLogConfig()`.
+    """
+
+    __slots__ = ('_config', '_devices', '_exchanges')
+
+    def __init__(self, config: ExchangeLogConfig | None = None) -> None:
+        """Initialize the exchange log."""
+        self._config = config or ExchangeLogConfig()
+        self._exchanges: deque[ApiExchange] = deque(maxlen=self._config.size)
+        self._devices: dict[str, deque[ApiExchange]] = {}
+
+    @property
+    def config(self) -> ExchangeLogConfig:
+        """Return the exchange log configuration."""
+        return self._config
+
+    def record(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        request_body: RequestBody | None,
+        cid: str | None,
+        status: int | None,
+        response_body: dict | None,
+        latency: float,
+        error: BaseException | None = None,
+        *,
+        timing: RequestTiming | None = None,
+    ) -> None:
+        """Record an exchange if it failed or is sampled.
+
+        Args:
+            endpoint (str): API path of the request.
+            request_body (RequestBody | None): Body of the request.
+            cid (str | None): Device cid of the request.
+            status (int | None): HTTP status code of the response.
+            response_body (dict | None): Parsed response body.
+            latency (float): Seconds the request took.
+            error (BaseException | None): Exception raised by the request.
+            timing (RequestTiming | None): Connection level timing of the request.
+        """
+        config = self._config
+        if config.size <= 0:
+            return
+        response_info = (
+            ResponseEnvelope.wrap(response_body).error_info
+            if isinstance(response_body, dict)
+            else None
+        )
+        failed = error is not None or (
+            response_info is not None and response_info.code not in (0, None)
+        )
+        if not failed and (
+            config.sample_rate <= 0 or random.random() >= config.sample_rate  # noqa: S311
+        ):
+            return
+        keep_bodies = failed or config.success_bodies
+        exchange = ApiExchange(
+            timestamp=time.time(),
+            endpoint=endpoint,
+            payload_method=payload_method(request_body),
+            cid=cid,
+            status=status,
+            latency=latency,
+            response_info=response_info,
+            error=repr(error) if error is not None else None,
+            request_body=(
+                _redacted_body(request_body.to_dict())
+                if keep_bodies and request_body is not None
+                else None
+            ),
+            response_body=(
+                _redacted_body(response_body)
+                if keep_bodies and response_body is not None
+                else None
+            ),
+            timing=timing,
+        )
+        self._exchanges.append(exchange)
+        if cid:
+            # Re-insert the buffer so the dictionary is ordered by last record
+            device_exchanges = self._devices.pop(cid, None)
+            if device_exchanges is None:
+                device_exchanges = deque(maxlen=config.device_size)
+                if len(self._devices) >= config.max_devices:
+                    del self._devices[next(iter(self._devices))]
+            self._devices[cid] = device_exchanges
+            device_exchanges.append(exchange)
+
+    def snapshot(self, cid: str | None = None) -> tuple[ApiExchange, ...]:
+        """Return the recorded exchanges, oldest first.
+
+        Args:
+            cid (str | None): Return the exchanges of this device only, by default
+                the exchanges of all requests.
+        """
+        if cid is None:
+            return tuple(self._exchanges)
+        return tuple(self._devices.get(cid, ()))
+
+    def dump(self, cid: str | None = None) -> str:
+        """Return the recorded exchanges as an indented JSON string.
+
+        Args:
+            cid (str | None): Dump the exchanges of this device only.
+        """
+        return orjson.dumps(
+            [exchange.to_dict() for exchange in self.snapshot(cid)],
+            option=orjson.OPT_INDENT_2,
+        ).decode('utf-8')
+
+    def clear(self) -> None:
+        """Remove all recorded exchanges."""
+        self._exchanges.clear()
+        self._devices.clear()
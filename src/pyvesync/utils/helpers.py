@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import logging
-import re
 import time
-from collections.abc import Iterator
-from dataclasses import InitVar, dataclass, field
+import weakref
+from collections.abc import Callable
+from dataclasses import InitVar, dataclass, field, replace
 from enum import StrEnum
-from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from mashumaro.exceptions import InvalidFieldValue, MissingField, UnserializableField
@@ -29,8 +28,14 @@ from pyvesync.const import (
     ConnectionStatus,
 )
 from pyvesync.models.base_models import DefaultValues
-from pyvesync.utils.errors import ErrorCodes, ErrorTypes, ResponseInfo
+from pyvesync.utils.errors import (
+    ErrorCodes,
+    ErrorTypes,
+    ResponseInfo,
+    find_error_code,
+)
 from pyvesync.utils.logs import LibraryLogger
+from pyvesync.utils.response import ResponseEnvelope
 
 if TYPE_CHECKING:
     from pyvesync.base_devices.vesyncbasedevice import VeSyncBaseDevice
@@ -38,6 +43,7 @@ if TYPE_CHECKING:
 
 
 T = TypeVar('T')
+
 T_MODEL = TypeVar('T_MODEL', bound=DataClassORJSONMixin)
 
 ST = TypeVar('ST', str, int)
@@ -50,6 +56,20 @@ NUMERIC_STRICT = float | str
 
 REQUEST_T = dict[str, Any]
 
+ATTRIBUTE_ALIASES = {
+    'userCountryCode': 'countrycode',
+    'deviceId': 'cid',
+    'homeTimeZone': 'timezone',
+    'configModel': 'configmodule',
+    'region': 'countrycode',
+}
+"""Request keys filled from a differently named attribute."""
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a name by removing underscores and making it lowercase."""
+    return name.replace('_', '').lower()
+
 
 class Validators:
     """Methods to validate input."""
@@ -124,6 +144,64 @@ class Converters:
         return celsius * 9.0 / 5.0 + 32
 
 
+@dataclass(frozen=True)
+class DefaultFields:
+    """`DefaultValues` fields of a tuple of request keys."""
+
+    constants: dict[str, Any]
+    generators: tuple[tuple[str, Callable[[], Any]], ...]
+
+
+_DEFAULT_FIELDS: dict[tuple[str, ...], DefaultFields] = {}
+
+
+class FieldCache:
+    """Request field values of a manager or device, kept until invalidated.
+
+    Each VeSync manager and device owns a cache, so the size follows the number of
+    devices and a removed device takes its cache with it. The cache only holds a
+    weak reference to its owner. The owner clears it with `invalidate()` whenever
+    an attribute used in requests changes, such as the token after a login, the
+    region or a device name.
+
+    Attributes:
+        templates (dict): Request templates compiled for the owner, see
+            `pyvesync.utils.request_templates`.
+    """
+
+    __slots__ = ('_fields', '_owner', 'templates')
+
+    def __init__(self, owner: object) -> None:
+        """Initialize the cache for an owner."""
+        self._owner = weakref.ref(owner)
+        self._fields: dict[tuple[str, ...], dict[str, Any]] = {}
+        self.templates: dict[Any, Any] = {}
+
+    def get(self, keys: tuple[str, ...]) -> dict[str, Any]:
+        """Return the attribute values of the keys, looking them up on first use.
+
+        The returned dictionary is shared, copy it before changing it.
+
+        Args:
+            keys (tuple[str, ...]): Request keys to get values for.
+
+        Returns:
+            dict[str, Any]: Keys found on the owner and their values.
+        """
+        fields = self._fields.get(keys)
+        if fields is None:
+            owner = self._owner()
+            if owner is None:
+                return {}
+            fields = self._fields[keys] = Helpers.get_class_attributes(owner, keys)
+        return fields
+
+    def invalidate(self) -> None:
+        """Clear the cached values and compiled templates."""
+        self._fields.clear()
+        self.templates.clear()
+
+
 class Helpers:
     """VeSync Helper Functions."""
 
@@ -186,14 +264,16 @@ class Helpers:
         method_name: str,
         device: VeSyncBaseDevice,
         r_dict: dict | None,
-    ) -> dict | None:
+    ) -> ResponseEnvelope | None:
         """Process JSON response from Bytes.
 
         Parses bytes and checks for errors common to all JSON
         responses, included checking the "code" key for non-zero
         values. Outputs error to passed logger with formatted string
         if an error is found. This also saves the response code information
-        to the `device.last_response` attribute.
+        to the `device.last_response` attribute. The error information of a
+        `ResponseEnvelope` returned by `VeSync.async_call_api` is reused, other
+        dictionaries are wrapped in an envelope first.
 
         Args:
             logger (logging.Logger): Logger instance.
@@ -202,7 +282,8 @@ class Helpers:
             device (VeSyncBaseDevice): Instance of VeSyncBaseDevice.
 
         Returns:
-            dict | None: Parsed JSON response or None if there was an error.
+            ResponseEnvelope | None: Parsed JSON response or None if there was an
+                error.
         """
         device.state.update_ts()
         if r_dict is None:
@@ -219,7 +300,8 @@ class Helpers:
             )
             return None
 
-        error_info = cls.parse_error_code(r_dict)
+        r_dict = ResponseEnvelope.wrap(r_dict)
+        error_info = r_dict.error_info
         if error_info.device_online is False:
             device.state.connection_status = ConnectionStatus.OFFLINE
         else:
@@ -231,14 +313,67 @@ class Helpers:
             device.device_type,
             error_info,
         )
-        device.last_response = error_info
-        device.last_response.response_data = r_dict
+        device.last_response = replace(error_info, response_data=r_dict)
         if error_info.code != 0:
             return None
         return r_dict
 
     @staticmethod
-    def get_class_attributes(target_class: object, keys: tuple[str]) -> dict[str, Any]:
+    def resolve_class_attributes(
+        target_class: object, keys: tuple[str, ...]
+    ) -> dict[str, tuple[str, ...]]:
+        """Find the attribute names that supply the value of each key.
+
+        Attribute names are matched case insensitive with underscores removed, and
+        through the aliases in `ATTRIBUTE_ALIASES`. Keys without a matching attribute
+        are left out.
+
+        Args:
+            target_class (object): Class or instance to search for attributes
+            keys (tuple[str, ...]): Tuple of keys to search for
+
+        Returns:
+            dict[str, tuple[str, ...]]: Matching attribute names for each key, in the
+                order returned by `dir()`. The last name with a value not None wins.
+        """
+        normalized_keys: dict[str, list[str]] = {}
+        for key in keys:
+            normalized_keys.setdefault(_normalize_name(key), []).append(key)
+        for key, alias in ATTRIBUTE_ALIASES.items():
+            if key in keys:
+                normalized_keys.setdefault(_normalize_name(alias), []).append(key)
+
+        result: dict[str, list[str]] = {}
+        for attr_name in dir(target_class):
+            for key in normalized_keys.get(_normalize_name(attr_name), ()):
+                result.setdefault(key, []).append(attr_name)
+        return {key: tuple(names) for key, names in result.items()}
+
+    @staticmethod
+    def get_attribute_value(target_class: object, names: tuple[str, ...]) -> Any:  # noqa: ANN401
+        """Return the last value not None of the attributes, calling callables.
+
+        Args:
+            target_class (object): Class or instance to read the attributes from
+            names (tuple[str, ...]): Attribute names from `resolve_class_attributes`
+
+        Returns:
+            Any: The attribute value, or None if no attribute has a value.
+        """
+        for attr_name in reversed(names):
+            attr = getattr(target_class, attr_name)
+            try:
+                value = attr() if callable(attr) else attr
+            except TypeError:
+                continue
+            if value is not None:
+                return value
+        return None
+
+    @staticmethod
+    def get_class_attributes(
+        target_class: object, keys: tuple[str, ...]
+    ) -> dict[str, Any]:
         """Find matching attributes, static methods, and class methods from list of keys.
 
         This function is case insensitive and will remove underscores from the keys before
@@ -252,94 +387,98 @@ class Helpers:
         Returns:
             dict[str, Any]: Dictionary of keys and their values from the class
         """
-        alias_map = {
-            'userCountryCode': 'countrycode',
-            'deviceId': 'cid',
-            'homeTimeZone': 'timezone',
-            'configModel': 'configmodule',
-            'region': 'countrycode',
-        }
-
-        def normalize_name(name: str) -> str:
-            """Normalize a string by removing underscores and making it lowercase."""
-            return re.sub(r'_', '', name).lower()
+        result = {}
+        for key, names in Helpers.resolve_class_attributes(target_class, keys).items():
+            value = Helpers.get_attribute_value(target_class, names)
+            if value is not None:
+                result[key] = value
+        return result
 
-        def get_value(attr_name: str) -> str | float | None:
-            """Get value from attribute."""
-            attr = getattr(target_class, attr_name)
-            try:
-                return attr() if callable(attr) else attr  # type: ignore[no-any-return]
-            except TypeError:
-                return None
+    @staticmethod
+    def resolve_default_values(keys: tuple[str, ...]) -> DefaultFields:
+        """Split the `DefaultValues` fields of the keys into constants and generators.
 
-        result = {}
-        normalized_keys = {normalize_name(key): key for key in keys}
-        normalized_aliases = [normalize_name(key) for key in alias_map.values()]
+        The result is cached for each tuple of keys.
 
-        for attr_name in dir(target_class):
-            normalized_attr = normalize_name(attr_name)
-            if normalized_attr in normalized_keys:
-                attr_val = get_value(attr_name)
-                if attr_val is not None:
-                    result[normalized_keys[normalized_attr]] = attr_val
-            if normalized_attr in normalized_aliases:
-                attr_val = get_value(attr_name)
-                if attr_val is not None:
-                    key_index = normalized_aliases.index(normalized_attr)
-                    key_val = list(alias_map.keys())[key_index]
-                    if key_val in keys:
-                        result[key_val] = attr_val
+        Args:
+            keys (tuple[str, ...]): Request keys to find default values for.
 
-        return result
+        Returns:
+            DefaultFields: Constant values of the keys and the functions that
+                generate the other values on each call, such as `traceId`.
+        """
+        default_fields = _DEFAULT_FIELDS.get(keys)
+        if default_fields is not None:
+            return default_fields
+        constants: dict[str, Any] = {}
+        generators: list[tuple[str, Callable[[], Any]]] = []
+        for key, names in Helpers.resolve_class_attributes(DefaultValues, keys).items():
+            attr = getattr(DefaultValues, names[-1])
+            if callable(attr):
+                generators.append((key, attr))
+                continue
+            value = Helpers.get_attribute_value(DefaultValues, names)
+            if value is not None:
+                constants[key] = value
+        default_fields = _DEFAULT_FIELDS[keys] = DefaultFields(
+            constants=constants, generators=tuple(generators)
+        )
+        return default_fields
 
     @classmethod
-    @lru_cache(maxsize=128, typed=True)
-    def get_defaultvalues_attributes(cls, keys: tuple[str]) -> dict[str, Any]:
+    def get_defaultvalues_attributes(cls, keys: tuple[str, ...]) -> dict[str, Any]:
         """Get default values for dataclass attributes.
 
-        This method uses lru_cache to cache results for faster subsequent lookups.
+        The attribute lookup is cached for each tuple of keys, generated values such
+        as `traceId` are created on each call.
 
         Args:
-            keys (list[str]): List of attribute names to get default values for.
+            keys (tuple[str, ...]): Attribute names to get default values for.
 
         Returns:
-            dict[str, Any]: Dictionary of attribute names and their default values.
+            dict[str, Any]: New dictionary of attribute names and default values.
         """
-        return cls.get_class_attributes(DefaultValues, keys)
+        default_fields = cls.resolve_default_values(keys)
+        body = default_fields.constants.copy()
+        for key, generate in default_fields.generators:
+            body[key] = generate()
+        return body
 
     @classmethod
-    @lru_cache(maxsize=128, typed=True)
-    def get_manager_attributes(cls, manager: VeSync, keys: tuple[str]) -> dict[str, Any]:
+    def get_manager_attributes(
+        cls, manager: VeSync, keys: tuple[str, ...]
+    ) -> dict[str, Any]:
         """Get VeSync manager attributes.
 
-        This method uses lru_cache to cache results for faster subsequent lookups.
+        Values are served from the `FieldCache` of the manager, which is cleared
+        when the credentials, region or time zone change.
 
         Args:
-            manager (VeSyncManager): Instance of VeSyncManager.
-            keys (list[str]): List of attribute names to get values for.
+            manager (VeSync): Instance of VeSync.
+            keys (tuple[str, ...]): Attribute names to get values for.
 
         Returns:
-            dict[str, Any]: Dictionary of attribute names and their values.
+            dict[str, Any]: New dictionary of attribute names and their values.
         """
-        return cls.get_class_attributes(manager, keys)
+        return manager._field_cache.get(keys).copy()  # noqa: SLF001
 
     @classmethod
-    @lru_cache(maxsize=128, typed=True)
     def get_device_attributes(
-        cls, device: VeSyncBaseDevice, keys: tuple[str]
+        cls, device: VeSyncBaseDevice, keys: tuple[str, ...]
     ) -> dict[str, Any]:
         """Get VeSync device attributes.
 
-        This method uses lru_cache to cache results for faster subsequent lookups.
+        Values are served from the `FieldCache` of the device, which is cleared
+        when the device is renamed or patched from the device list.
 
         Args:
             device (VeSyncBaseDevice): Instance of VeSyncBaseDevice.
-            keys (list[str]): List of attribute names to get values for.
+            keys (tuple[str, ...]): Attribute names to get values for.
 
         Returns:
-            dict[str, Any]: Dictionary of attribute names and their values.
+            dict[str, Any]: New dictionary of attribute names and their values.
         """
-        return cls.get_class_attributes(device, keys)
+        return device._field_cache.get(keys).copy()  # noqa: SLF001
 
     @staticmethod
     def req_legacy_headers(manager: VeSync) -> dict[str, str]:
@@ -554,50 +693,19 @@ class Helpers:
         return hashlib.md5(string.encode('utf-8')).hexdigest()  # noqa: S324
 
     @staticmethod
-    def parse_error_code(response: dict) -> ResponseInfo:  # noqa: C901
-        """Get all error codes from nested dictionary.
+    def parse_error_code(response: dict) -> ResponseInfo:
+        """Get the error code of a response from the nested dictionary.
+
+        Uses the single pass search of `pyvesync.utils.errors.find_error_code`.
 
         Args:
             response (dict): API response.
 
         Returns:
-            list[int]: List of error codes.
+            ResponseInfo: Information of the error code found, a copy of
+                `SUCCESS_RESPONSE` if there is none.
         """
-        error_keys = ['error', 'code', 'error_code', 'errorCode']
-
-        def extract_all_error_codes(
-            key: str, var: dict
-        ) -> Iterator[tuple[int, str | None]]:
-            """Find all error code keys in nested dictionary."""
-            if hasattr(var, 'items'):
-                for k, v in var.items():
-                    if k == key and isinstance(v, int) and v != 0:
-                        msg = var.get('msg') or var.get('result', {}).get('msg')
-                        yield v, msg
-                    if isinstance(v, dict):
-                        yield from extract_all_error_codes(key, v)
-                    elif isinstance(v, list):
-                        for item in v:
-                            yield from extract_all_error_codes(key, item)
-
-        errors: list[tuple[int, str | None]] = []
-
-        if 'code' in response:
-            outside_code = response.get('code', '')
-            outside_msg = response.get('msg')
-
-            if str(outside_code) != '0':
-                return ErrorCodes.get_error_info(int(outside_code), outside_msg)
-
-        for error_key in error_keys:
-            errors.extend(list(extract_all_error_codes(error_key, response)))
-        return_code = 0
-        return_msg = None
-        for code, msg in errors:
-            if code != 0:
-                return_code = code
-                return_msg = msg
-        return ErrorCodes.get_error_info(int(return_code), return_msg)
+        return ErrorCodes.get_error_info(*find_error_code(response))
 
     @staticmethod
     def get_key(
@@ -21,7 +21,9 @@ import logging
 import os
 import re
 import sys
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -31,12 +33,124 @@ from mashumaro.exceptions import InvalidFieldValue, MissingField, Unserializable
 from multidict import CIMultiDictProxy
 
 from pyvesync.utils.errors import ErrorTypes, ResponseInfo
+from pyvesync.utils.transport import RequestBody
 
 if TYPE_CHECKING:
-    from aiohttp import ClientResponse
     from aiohttp.client_exceptions import ClientResponseError
 
     from pyvesync.base_devices.vesyncbasedevice import VeSyncBaseDevice
+    from pyvesync.utils.transport import TransportResponse
+
+
+REDACT_PATTERN = re.compile(
+    r'(?i)'
+    r'((?<=token":\s")|'
+    r'(?<=password":\s")|'
+    r'(?<=email":\s")|'
+    r'(?<=tk":\s")|'
+    r'(?<=accountId":\s")|'
+    r'(?<=accountID":\s")|'
+    r'(?<=authKey":\s")|'
+    r'(?<=uuid":\s")|'
+    r'(?<=cid":\s")|'
+    r'(?<=token\s)|'
+    r'(?<=authorizeCode\s)|'
+    r'(?<=account_id\s))'
+    r'[^"\s]+'
+)
+"""Compiled pattern of the sensitive values replaced by `LibraryLogger.redactor`."""
+
+API_CALLER: ContextVar[str | None] = ContextVar('pyvesync_api_caller', default=None)
+"""Name of the device method making the current API call, used in API call logs."""
+
+
+class ApiCallRecord:
+    """Deferred message of an API call debug log.
+
+    The record only holds references to the request and the already parsed
+    response. The text, including pretty printing and redaction, is built by
+    `str()`, which `logging.Formatter` calls through `LogRecord.getMessage()` when
+    a handler actually emits the record. The record is also attached to the
+    `LogRecord` as the `api_call` attribute for structured handlers.
+
+    Attributes:
+        caller (str): Device method that made the call, or `unknown`.
+        response (TransportResponse): Response of the call.
+        response_body (dict | bytes | None): Parsed response, or the raw body if it
+            could not be parsed.
+        request_headers (dict | None): Request headers.
+        request_body (str | dict | RequestBody | None): Request body.
+    """
+
+    __slots__ = (
+        'caller',
+        'request_body',
+        'request_headers',
+        'response',
+        'response_body',
+    )
+
+    def __init__(
+        self,
+        caller: str,
+        response: TransportResponse,
+        response_body: dict | bytes | None,
+        request_headers: dict | None,
+        request_body: str | dict | RequestBody | None,
+    ) -> None:
+        """Initialize the API call record."""
+        self.caller = caller
+        self.response = response
+        self.response_body = response_body
+        self.request_headers = request_headers
+        self.request_body = request_body
+
+    def __str__(self) -> str:
+        """Format the API call for output."""
+        response = self.response
+        parts = [
+            '==================API CALL==================',
+            f'Caller: {self.caller}',
+            f'API CALL to endpoint: {response.url.path}',
+            f'Host: {response.url.host}',
+            f'Full URL: {response.url}',
+            f'Response Status: {response.status}',
+            f'Method: {response.method}',
+            '---------------Request-----------------',
+        ]
+        if self.request_headers:
+            parts.append(
+                'Request Headers: '
+                f'{os.linesep} {LibraryLogger.api_printer(self.request_headers)}'
+            )
+        request_body = self.request_body
+        if isinstance(request_body, RequestBody):
+            request_body = request_body.to_dict()
+        if request_body is not None:
+            parts.append(
+                f'Request Body: {os.linesep} {LibraryLogger.api_printer(request_body)}'
+            )
+
+        parts.append('---------------Response-----------------')
+        response_headers = LibraryLogger.api_printer(response.headers)
+        if response_headers:
+            parts.append(f'Response Headers: {os.linesep} {response_headers}')
+
+        response_body = self.response_body
+        if isinstance(response_body, bytes):
+            parsed = LibraryLogger.try_json_loads(response_body)
+            if parsed is not None:
+                response_body = parsed
+        if isinstance(response_body, dict):
+            parts.append(
+                f'Response Body: {os.linesep} {LibraryLogger.api_printer(response_body)}'
+            )
+        elif isinstance(response_body, bytes) and len(response_body) > 0:
+            parts.append(
+                'Error parsing response body: '
+                f'{os.linesep} {response_body.decode("utf-8", errors="replace")}'
+            )
+        return os.linesep.join(parts)
 
 
 class LibraryLogger:
@@ -128,26 +242,7 @@ class LibraryLogger:
                 by '##_REDACTED_##'.
         """
         if cls.shouldredact:
-            stringvalue = re.sub(
-                (
-                    r'(?i)'
-                    r'((?<=token":\s")|'
-                    r'(?<=password":\s")|'
-                    r'(?<=email":\s")|'
-                    r'(?<=tk":\s")|'
-                    r'(?<=accountId":\s")|'
-                    r'(?<=accountID":\s")|'
-                    r'(?<=authKey":\s")|'
-                    r'(?<=uuid":\s")|'
-                    r'(?<=cid":\s")|'
-                    r'(?<=token\s)|'
-                    r'(?<=authorizeCode\s)|'
-                    r'(?<=account_id\s))'
-                    r'[^"\s]+'
-                ),
-                '##_REDACTED_##',
-                stringvalue,
-            )
+            stringvalue = REDACT_PATTERN.sub('##_REDACTED_##', stringvalue)
         return stringvalue
 
     @staticmethod
@@ -443,149 +538,76 @@ class LibraryLogger:
             )
 
     @staticmethod
-    def _resolve_base_caller_of_async_call() -> str:  # noqa: C901
-        """Resolve the frame that invoked VeSync.async_call_api."""
+    @contextmanager
+    def api_caller(caller: str) -> Iterator[None]:
+        """Set the caller shown in the API call logs made inside the block.
+
+        Args:
+            caller (str): Identifier of the calling method, e.g.
+                `VeSyncAirBypass.getPurifierStatus`.
+        """
+        token = API_CALLER.set(caller)
         try:
-            pkg_root = 'pyvesync'
-
-            # Start from the caller of log_api_call
-            f = sys._getframe(1)  # noqa: SLF001  # pylint: disable=protected-access
-
-            # Find the frame for async_call_api in pyvesync.vesync
-            async_frame = None
-            while f:
-                mod_name = f.f_globals.get('__name__', '')
-                func_name = f.f_code.co_name
-                if func_name == 'async_call_api' and (
-                    mod_name == f'{pkg_root}.vesync' or mod_name.endswith('.vesync')
-                ):
-                    async_frame = f
-                    break
-                f = f.f_back  # type: ignore[assignment]
-
-            # The "base caller" is the immediate caller of async_call_api
-            target = async_frame.f_back if async_frame else None
-            if not target:
-                return 'unknown'
-
-            # Skip any frames inside our logging util if present
-            while target and target.f_globals.get('__name__', '').startswith(
-                f'{pkg_root}.utils.logs'
-            ):
-                target = target.f_back
-            if not target:
-                return 'unknown'
-
-            # Build a readable identifier
-            func_name = target.f_code.co_name
-            mod_name = target.f_globals.get('__name__', '')
-
-            # Prefer class context if available
-            cls_name = None
-            if 'self' in target.f_locals and target.f_locals['self'] is not None:
-                cls = type(target.f_locals['self'])
-                cls_name = getattr(cls, '__name__', None)
-                mod_name = getattr(cls, '__module__', mod_name)
-            elif 'cls' in target.f_locals and target.f_locals['cls'] is not None:
-                cls = target.f_locals['cls']
-                cls_name = getattr(cls, '__name__', None)
-                mod_name = getattr(cls, '__module__', mod_name)
-
-            # Normalize module for compactness: strip root package
-            human_mod = mod_name
-            if human_mod.startswith(f'{pkg_root}.'):
-                human_mod = human_mod[len(pkg_root) + 1 :]  # noqa: E203, RUF100
-
-            if cls_name:
-                return f'{cls_name}.{func_name} [{human_mod}]'
-
-        except Exception:  # noqa: BLE001
-            return 'unknown'
-        return f'{human_mod}.{func_name}'
+            yield
+        finally:
+            API_CALLER.reset(token)
 
     @classmethod
     def log_api_call(
         cls,
         logger: logging.Logger,
-        response: ClientResponse,
-        response_body: bytes | None = None,
+        response: TransportResponse,
+        response_body: dict | bytes | None = None,
         request_headers: dict | None = None,
-        request_body: str | dict | None = None,
+        request_body: str | dict | RequestBody | None = None,
+        device: VeSyncBaseDevice | None = None,
     ) -> None:
         """Log API calls in debug mode.
 
         Logs an API call with a specific format that includes the endpoint,
-        JSON-formatted headers, request body (if any) and response body.
+        JSON-formatted headers, request body (if any) and response body. The
+        message is an `ApiCallRecord` that keeps references to its arguments and
+        is only formatted and redacted when a handler emits it.
 
         Args:
             logger (logging.Logger): The logger instance to use.
-            response (aiohttp.ClientResponse): Requests response object from the API call.
-            response_body (bytes, optional): The response body to log.
+            response (TransportResponse): Response object from the API call.
+            response_body (dict | bytes, optional): The parsed response, or the
+                raw body if it could not be parsed.
             request_headers (dict, optional): The request headers to log.
-            request_body (dict | str, optional): The request body to log.
+            request_body (dict | str | RequestBody, optional): The request body to
+                log, a `RequestBody` is only decoded when the record is emitted.
+            device (VeSyncBaseDevice, optional): Device that made the call, named as the
+                caller when `api_caller` was not set.
 
         Notes:
             This is a method used for the logging of API calls when the debug
             flag is enabled. The method logs the endpoint, method, request headers,
             request body (if any), response headers, and response body (if any).
         """
-        if cls.debug_enabled is False:
+        if cls.debug_enabled is False or not logger.isEnabledFor(logging.DEBUG):
             return
-        # Build the log message parts.
-
-        # Emit a dedicated debug line for the base caller
-        parts = ['==================API CALL==================']
-        try:
-            base_caller = cls._resolve_base_caller_of_async_call()
-            # Keep message simple to avoid breaking existing structured logs
-            parts.append(f'Caller: {base_caller}')
-        except Exception:  # noqa: BLE001,S110
-            pass
-
-        parts.append(f'API CALL to endpoint: {response.url.path}')
-        parts.append(f'Host: {response.url.host}')
-        parts.append(f'Full URL: {response.url}')
-        parts.append(f'Response Status: {response.status}')
-        parts.append(f'Method: {response.method}')
-        parts.append('---------------Request-----------------')
-
-        if request_headers:
-            parts.append(
-                f'Request Headers: {os.linesep} {cls.api_printer(request_headers)}'
-            )
-        if request_body is not None:
-            request_body = cls.api_printer(request_body)
-            parts.append(f'Request Body: {os.linesep} {request_body}')
-
-        parts.append('---------------Response-----------------')
-        response_headers = cls.api_printer(response.headers)
-        if response_headers:
-            parts.append(f'Response Headers: {os.linesep} {response_headers}')
-
-        response_dict = cls.try_json_loads(response_body)
-        if response_dict is not None:
-            response_str = cls.api_printer(response_dict)
-            parts.append(f'Response Body: {os.linesep} {response_str}')
-        elif isinstance(response_body, bytes) and len(response_body) > 0:
-            response_str = response_body.decode('utf-8')
-            parts.append(f'Error parsing response body: {os.linesep} {response_str}')
-
-        full_message = os.linesep.join(parts)
-        logger.debug(full_message)
+        caller = API_CALLER.get()
+        if caller is None:
+            caller = type(device).__name__ if device is not None else 'unknown'
+        record = ApiCallRecord(
+            caller, response, response_body, request_headers, request_body
+        )
+        logger.debug(record, extra={'api_call': record})
 
     @classmethod
     def log_api_status_error(
         cls,
         logger: logging.Logger,
         *,
-        response: ClientResponse,
+        response: TransportResponse,
     ) -> None:
         """Log API response with non-200 status codes.
 
         Args:
             logger (logging.Logger): The logger instance to use.
-            response (aiohttp.ClientResponse): KW only, dictionary
-                containing the request information.
+            response (TransportResponse): KW only, response object from the
+                API call.
         """
         # Build the log message parts.
         msg = (
@@ -0,0 +1,304 @@
+"""Request metrics for VeSync API calls.
+
+The manager keeps a `MetricsRegistry` that every `VeSync.async_call_api` request is
+recorded in. Metrics are keyed by `MetricKey`, the endpoint family (see
+`pyvesync.utils.scheduler.endpoint_family`), the payload method, e.g.
+`getPurifierStatus`, and the product type of the device:
+
+- a latency histogram with logarithmic buckets,
+- request, error and retry counters, errors also keyed by `ErrorTypes`,
+- the number of requests in flight per endpoint family.
+
+Recording is a few dictionary updates and a bisect, so it is cheap enough to stay
+enabled. `MetricsRegistry.snapshot()` returns a copy of the metrics and
+`MetricsRegistry.render_prometheus()` renders them in the Prometheus text format.
+
+Example:
+    Print the slowest payload methods:
+
+    ```python
+    snapshot = manager.metrics.snapshot()
+    for key, histogram in sorted(
+        snapshot.latency.items(), key=lambda item: item[1].mean, reverse=True
+    ):
+        print(key.method, key.product_type, histogram.mean, histogram.quantile(0.95))
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from aiohttp import ClientError
+
+from pyvesync.utils.errors import (
+    ErrorTypes,
+    ResponseInfo,
+    VeSyncAPIStatusCodeError,
+    VeSyncRateLimitError,
+    VeSyncServerError,
+    VeSyncTokenError,
+)
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Upper bounds in seconds of the latency histogram buckets, an overflow bucket
+follows the last bound."""
+
+
+class MetricKey(NamedTuple):
+    """Key of the request metrics.
+
+    Attributes:
+        family (str): Endpoint family of the request.
+        method (str): Payload method of the request, empty if it has none.
+        product_type (str): Product type of the device, empty for requests that are
+            not made for a device.
+    """
+
+    family: str
+    method: str
+    product_type: str
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Snapshot of a latency histogram.
+
+    Attributes:
+        counts (tuple[int, ...]): Observations per bucket of `LATENCY_BUCKETS`, the
+            last entry counts observations above the last bound.
+        count (int): Number of observations.
+        total (float): Sum of the observed latencies in seconds.
+    """
+
+    counts: tuple[int, ...]
+    count: int
+    total: float
+
+    @property
+    def mean(self) -> float:
+        """Return the mean latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding quantile `q`.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Bucket upper bound in seconds, `inf` for the overflow bucket.
+        """
+        rank = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and seen:
+                if idx < len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[idx]
+                return float('inf')
+        return 0.0
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Snapshot of the request metrics.
+
+    Attributes:
+        latency (dict[MetricKey, HistogramSnapshot]): Latency histograms.
+        requests (dict[MetricKey, int]): Requests sent.
+        errors (dict[tuple[MetricKey, str], int]): Failed requests by `ErrorTypes`.
+        retries (dict[MetricKey, int]): Retries of rate limited requests.
+        in_flight (dict[str, int]): Requests in flight by endpoint family.
+    """
+
+    latency: dict[MetricKey, HistogramSnapshot]
+    requests: dict[MetricKey, int]
+    errors: dict[tuple[MetricKey, str], int]
+    retries: dict[MetricKey, int]
+    in_flight: dict[str, int]
+
+
+class _Histogram:
+    """Mutable latency histogram."""
+
+    __slots__ = ('count', 'counts', 'total')
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation in seconds."""
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+def error_type_of(
+    error: BaseException | None, response_info: ResponseInfo | None
+) -> str | None:
+    """Return the `ErrorTypes` value of a failed request, None if it succeeded."""
+    if response_info is not None and response_info.code not in (0, None):
+        return str(response_info.error_type)
+    if error is None or isinstance(error, asyncio.CancelledError):
+        return None
+    if isinstance(error, VeSyncRateLimitError):
+        return ErrorTypes.RATE_LIMIT.value
+    if isinstance(error, VeSyncTokenError):
+        return ErrorTypes.TOKEN_ERROR.value
+    if isinstance(
+        error, (VeSyncServerError, VeSyncAPIStatusCodeError, ClientError, TimeoutError)
+    ):
+        return ErrorTypes.SERVER_ERROR.value
+    return ErrorTypes.UNKNOWN_ERROR.value
+
+
+def _labels(**labels: str) -> str:
+    """Render Prometheus labels, escaping the values."""
+    rendered = ','.join(
+        '{}="{}"'.format(
+            name,
+            value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'),
+        )
+        for name, value in labels.items()
+    )
+    return '{' + rendered + '}'
+
+
+class MetricsRegistry:
+    """Latency histograms, counters and in-flight gauges of API requests."""
+
+    __slots__ = ('_errors', '_in_flight', '_latency', '_requests', '_retries')
+
+    def __init__(self) -> None:
+        """Initialize the metrics registry."""
+        self._latency: dict[MetricKey, _Histogram] = {}
+        self._requests: dict[MetricKey, int] = {}
+        self._errors: dict[tuple[MetricKey, str], int] = {}
+        self._retries: dict[MetricKey, int] = {}
+        self._in_flight: dict[str, int] = {}
+
+    def start(self, family: str) -> None:
+        """Count a request of the endpoint family as in flight."""
+        self._in_flight[family] = self._in_flight.get(family, 0) + 1
+
+    def finish(
+        self, key: MetricKey, latency: float, error_type: str | None = None
+    ) -> None:
+        """Record a finished request started with `start()`.
+
+        Args:
+            key (MetricKey): Key of the request.
+            latency (float): Seconds the request took.
+            error_type (str | None): `ErrorTypes` value of a failed request.
+        """
+        self._in_flight[key.family] -= 1
+        histogram = self._latency.get(key)
+        if histogram is None:
+            histogram = self._latency[key] = _Histogram()
+        histogram.observe(latency)
+        self._requests[key] = self._requests.get(key, 0) + 1
+        if error_type is not None:
+            error_key = (key, error_type)
+            self._errors[error_key] = self._errors.get(error_key, 0) + 1
+
+    def record_retry(self, key: MetricKey) -> None:
+        """Count a retry of a rate limited request."""
+        self._retries[key] = self._retries.get(key, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a copy of the current metrics."""
+        return MetricsSnapshot(
+            latency={
+                key: HistogramSnapshot(
+                    tuple(histogram.counts), histogram.count, histogram.total
+                )
+                for key, histogram in self._latency.items()
+            },
+            requests=dict(self._requests),
+            errors=dict(self._errors),
+            retries=dict(self._retries),
+            in_flight=dict(self._in_flight),
+        )
+
+    def reset(self) -> None:
+        """Clear all metrics except the requests in flight."""
+        self._latency.clear()
+        self._requests.clear()
+        self._errors.clear()
+        self._retries.clear()
+
+    def render_prometheus(self, prefix: str = 'pyvesync') -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prefix of the metric names.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f'# HELP {prefix}_request_duration_seconds API request latency.',
+            f'# TYPE {prefix}_request_duration_seconds histogram',
+        ]
+        for key, histogram in snapshot.latency.items():
+            labels = key._asdict()
+            cumulative = 0
+            for idx, bucket_count in enumerate(histogram.counts):
+                cumulative += bucket_count
+                bound = (
+                    repr(LATENCY_BUCKETS[idx]) if idx < len(LATENCY_BUCKETS) else '+Inf'
+                )
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket'
+                    f'{_labels(**labels, le=bound)} {cumulative}'
+                )
+            lines.append(
+                f'{prefix}_request_duration_seconds_sum{_labels(**labels)} '
+                f'{histogram.total}'
+            )
+            lines.append(
+                f'{prefix}_request_duration_seconds_count{_labels(**labels)} '
+                f'{histogram.count}'
+            )
+        for name, help_text, counter in (
+            ('requests_total', 'API requests sent.', snapshot.requests),
+            ('request_retries_total', 'Rate limited request retries.', snapshot.retries),
+        ):
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            lines.extend(
+                f'{prefix}_{name}{_labels(**key._asdict())} {value}'
+                for key, value in counter.items()
+            )
+        lines.append(f'# HELP {prefix}_request_errors_total Failed API requests.')
+        lines.append(f'# TYPE {prefix}_request_errors_total counter')
+        lines.extend(
+            f'{prefix}_request_errors_total'
+            f'{_labels(**key._asdict(), error_type=error_type)} {value}'
+            for (key, error_type), value in snapshot.errors.items()
+        )
+        lines.append(f'# HELP {prefix}_requests_in_flight API requests in flight.')
+        lines.append(f'# TYPE {prefix}_requests_in_flight gauge')
+        lines.extend(
+            f'{prefix}_requests_in_flight{_labels(family=family)} {count}'
+            for family, count in snapshot.in_flight.items()
+        )
+        return '\n'.join(lines) + '\n'
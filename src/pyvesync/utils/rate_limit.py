@@ -0,0 +1,181 @@
+"""Adaptive rate limiting for VeSync API requests.
+
+The `AdaptiveRateLimiter` is a token bucket that every `VeSync.async_call_api` call
+draws from before a request is sent. Rate limiting is disabled unless a `rate` is
+configured. When the API responds with HTTP 429 or a rate limit error code, the
+refill rate is cut by `decrease_factor` (down to `min_rate`). Server errors do not
+reduce the rate. Each successful response adds `recovery_step` back to the refill
+rate until the configured `rate` is reached again.
+
+Requests that fail with `VeSyncRateLimitError` can optionally be retried with
+jittered exponential backoff by setting `max_retries`.
+
+Example:
+    Allow 5 requests per second with bursts of 10 and retry rate limited requests
+    up to 3 times:
+
+    ```python
+    from pyvesync import VeSync
+    from pyvesync.utils.rate_limit import RateLimitConfig
+
+    config = RateLimitConfig(rate=5, burst=10, max_retries=3)
+    manager = VeSync('user', 'password', rate_limit_config=config)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class RateLimitConfig:
+    """Configuration for the adaptive rate limiter.
+
+    Attributes:
+        rate (float | None): Maximum refill rate in requests per second, None (the
+            default) to disable rate limiting.
+        burst (int): Bucket size, the number of requests that can be sent at once
+            after a quiet period.
+        min_rate (float): Lowest refill rate the limiter backs off to.
+        decrease_factor (float): Factor the refill rate is multiplied by after a
+            rate limit response.
+        recovery_step (float): Requests per second added to the refill rate after
+            each successful response.
+        max_retries (int): Number of times a request that raised
+            `VeSyncRateLimitError` is retried, 0 to disable retries.
+        backoff_base (float): Base delay in seconds for retry backoff.
+        backoff_max (float): Maximum delay in seconds for retry backoff.
+    """
+
+    rate: float | None = None
+    burst: int = 40
+    min_rate: float = 0.5
+    decrease_factor: float = 0.5
+    recovery_step: float = 0.2
+    max_retries: int = 0
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+
+class AdaptiveRateLimiter:
+    """Token bucket rate limiter that adapts to API throttling.
+
+    Args:
+        config (RateLimitConfig | None): Rate limit settings, defaults to
+            `RateLimitConfig()`.
+    """
+
+    __slots__ = (
+        '_config',
+        '_current_rate',
+        '_last_refill',
+        '_lock',
+        '_throttle_count',
+        '_tokens',
+    )
+
+    def __init__(self, config: RateLimitConfig | None = None) -> None:
+        """Initialize the rate limiter."""
+        self._config = config or RateLimitConfig()
+        self._current_rate = self._config.rate
+        self._tokens = float(self._config.burst)
+        self._last_refill = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+        self._throttle_count = 0
+
+    @property
+    def config(self) -> RateLimitConfig:
+        """Return the rate limit configuration."""
+        return self._config
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if requests are rate limited."""
+        return self._current_rate is not None
+
+    @property
+    def current_rate(self) -> float | None:
+        """Return the current refill rate in requests per second."""
+        return self._current_rate
+
+    @property
+    def throttle_count(self) -> int:
+        """Return the number of throttling responses seen."""
+        return self._throttle_count
+
+    def _refill(self, rate: float) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._config.burst), self._tokens + (now - self._last_refill) * rate
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> float:
+        """Wait for a token before sending a request.
+
+        Returns:
+            float: Seconds spent waiting for the token.
+        """
+        rate = self._current_rate
+        if rate is None:
+            return 0.0
+        self._refill(rate)
+        if self._tokens >= 1 and (self._lock is None or not self._lock.locked()):
+            self._tokens -= 1
+            return 0.0
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        start = time.monotonic()
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                rate = self._current_rate
+                if rate is None:
+                    break
+                self._refill(rate)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / rate)
+        return time.monotonic() - start
+
+    def on_success(self) -> None:
+        """Recover the refill rate after a successful response."""
+        max_rate = self._config.rate
+        rate = self._current_rate
+        if rate is None or max_rate is None or rate >= max_rate:
+            return
+        self._refill(rate)
+        self._current_rate = min(max_rate, rate + self._config.recovery_step)
+
+    def on_throttle(self) -> None:
+        """Reduce the refill rate after a rate limit response."""
+        self._throttle_count += 1
+        rate = self._current_rate
+        if rate is None:
+            return
+        self._refill(rate)
+        self._current_rate = max(
+            self._config.min_rate, rate * self._config.decrease_factor
+        )
+        logger.debug('API throttled, reducing request rate to %.2f/s', self._current_rate)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return the jittered exponential backoff delay for a retry.
+
+        Args:
+            attempt (int): Zero based retry attempt number.
+
+        Returns:
+            float: Seconds to wait before retrying.
+        """
+        ceiling = min(self._config.backoff_max, self._config.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311
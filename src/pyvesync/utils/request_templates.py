@@ -0,0 +1,211 @@
+"""Compiled request body templates for device API calls.
+
+Request bodies are built from the `DefaultValues` fields, the manager attributes and
+the device attributes that match the request keys. Looking these up by reflection on
+every call is slow, so a `RequestTemplate` resolves the keys of a request model once
+and splits each body into three parts:
+
+- The static part holds the default values and the device attributes, such as
+    `cid`, `configModule` and `uuid`. It is built the first time a device uses
+    the template and kept in the `FieldCache` of the device.
+- The manager attributes (`token`, `accountID`, `timeZone`, `userCountryCode`)
+    come from the `FieldCache` of the manager, which is cleared when the
+    credentials, region or time zone change.
+- Generated defaults such as `traceId` are created on every call.
+
+The precedence of the reflective helpers is kept, a device attribute overrides a
+manager attribute, which overrides a default value. Attributes that are None are
+skipped.
+
+Example:
+    ```python
+    template = request_template(RequestBypassV2, BypassV2Mixin.request_keys)
+    request = template.build(device, {'method': 'bypassV2', 'payload': payload})
+    ```
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields as dataclass_fields
+from types import UnionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Protocol,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pyvesync.models.base_models import RequestBaseModel
+from pyvesync.utils.helpers import Helpers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyvesync import VeSync
+    from pyvesync.utils.helpers import FieldCache
+
+T_REQUEST = TypeVar('T_REQUEST', bound=RequestBaseModel)
+
+
+class TemplateDevice(Protocol):
+    """Device that builds requests from templates, see `VeSyncBaseDevice`."""
+
+    manager: VeSync
+    _field_cache: FieldCache
+
+
+def _runtime_types(field_type: Any) -> tuple[type, ...] | None:  # noqa: ANN401
+    """Return the value types a field accepts without conversion.
+
+    Returns None if values of the field type may need converting by `from_dict()`,
+    such as parametrized collections.
+    """
+    if isinstance(field_type, type):
+        return (field_type,)
+    if isinstance(field_type, UnionType) or get_origin(field_type) is Union:
+        types: tuple[type, ...] = ()
+        for arg in get_args(field_type):
+            arg_types = _runtime_types(arg)
+            if arg_types is None:
+                return None
+            types += arg_types
+        return types
+    return None
+
+
+class _CompiledTemplate:
+    """Static fields and volatile field lookups of a template for one device."""
+
+    __slots__ = ('generated', 'manager_keys', 'static')
+
+    def __init__(
+        self,
+        static: dict[str, Any],
+        generated: tuple[tuple[str, Callable[[], Any]], ...],
+        manager_keys: tuple[str, ...],
+    ) -> None:
+        """Initialize the compiled template."""
+        self.static = static
+        self.generated = generated
+        self.manager_keys = manager_keys
+
+
+class RequestTemplate(Generic[T_REQUEST]):
+    """Request body template for a request model.
+
+    Use `request_template()` to get the shared template of a model rather than
+    creating one directly.
+
+    Args:
+        model (type[T_REQUEST]): Request model the template builds.
+        keys (tuple[str, ...]): Request keys filled from the default values, the
+            manager and the device. Keys that are not fields of the model are
+            ignored.
+
+    Attributes:
+        model (type[T_REQUEST]): Request model the template builds.
+        keys (tuple[str, ...]): Request keys that are fields of the model.
+    """
+
+    __slots__ = ('_defaults', '_field_types', 'keys', 'model')
+
+    def __init__(self, model: type[T_REQUEST], keys: tuple[str, ...]) -> None:
+        """Initialize the template and resolve the default values."""
+        model_fields = {field.name for field in dataclass_fields(model)}
+        self.model = model
+        self.keys = tuple(key for key in keys if key in model_fields)
+        type_hints = get_type_hints(model)
+        self._field_types = {
+            name: _runtime_types(type_hints[name]) for name in model_fields
+        }
+        self._defaults = Helpers.resolve_default_values(self.keys)
+
+    def _compile(self, device: TemplateDevice) -> _CompiledTemplate:
+        """Return the template compiled for a device, building it on first use."""
+        field_cache = device._field_cache  # noqa: SLF001
+        compiled: _CompiledTemplate | None = field_cache.templates.get(self)
+        if compiled is not None:
+            return compiled
+        device_fields = field_cache.get(self.keys)
+        compiled = _CompiledTemplate(
+            static=self._defaults.constants | device_fields,
+            generated=tuple(
+                item for item in self._defaults.generators if item[0] not in device_fields
+            ),
+            manager_keys=tuple(key for key in self.keys if key not in device_fields),
+        )
+        field_cache.templates[self] = compiled
+        return compiled
+
+    def fields(self, device: TemplateDevice) -> dict[str, Any]:
+        """Return the request keys and their values for a device.
+
+        The static part is copied from the device cache and the manager fields
+        from the manager cache, only generated values are created per call.
+
+        Args:
+            device (TemplateDevice): Device making the request.
+
+        Returns:
+            dict[str, Any]: New dictionary of request keys and values.
+        """
+        compiled = self._compile(device)
+        body = compiled.static.copy()
+        for key, generate in compiled.generated:
+            body[key] = generate()
+        body.update(device.manager._field_cache.get(compiled.manager_keys))  # noqa: SLF001
+        return body
+
+    def build(
+        self, device: TemplateDevice, update: dict[str, Any] | None = None
+    ) -> T_REQUEST:
+        """Build the request model for a device.
+
+        The model is created directly from the fields when every value already
+        has the type of its field. Otherwise the body is converted and validated
+        with `from_dict()`, e.g. for a nested model passed as a dictionary.
+
+        Args:
+            device (TemplateDevice): Device making the request.
+            update (dict[str, Any] | None): Fields to set on top of the template,
+                such as `method` and `payload`.
+
+        Returns:
+            T_REQUEST: The request model.
+        """
+        body = self.fields(device)
+        if update:
+            body.update(update)
+        field_types = self._field_types
+        for name, value in body.items():
+            types = field_types.get(name)
+            if types is None or type(value) not in types:
+                return self.model.from_dict(body)
+        return self.model(**body)
+
+
+_TEMPLATES: dict[tuple[type[RequestBaseModel], tuple[str, ...]], RequestTemplate] = {}
+
+
+def request_template(
+    model: type[T_REQUEST], keys: tuple[str, ...]
+) -> RequestTemplate[T_REQUEST]:
+    """Return the shared template of a request model and request keys.
+
+    Args:
+        model (type[T_REQUEST]): Request model the template builds.
+        keys (tuple[str, ...]): Request keys filled from the default values, the
+            manager and the device.
+
+    Returns:
+        RequestTemplate[T_REQUEST]: Template shared by every device.
+    """
+    template = _TEMPLATES.get((model, keys))
+    if template is None:
+        template = _TEMPLATES[model, keys] = RequestTemplate(model, keys)
+    return template
@@ -0,0 +1,250 @@
+"""Connection level timing of VeSync API requests.
+
+`AiohttpTransport` passes a `RequestTiming` to each request as the aiohttp
+`trace_request_ctx`. The `aiohttp.TraceConfig` returned by `timing_trace_config()`
+marks the request phases on it, and the transport adds the time taken to read the
+body. The timing is returned with the `TransportResponse`, kept with the request in
+the manager's exchange log and aggregated in the manager's `RequestTimingStats`:
+
+- **pool_wait**: waiting for a free connection in the connection pool.
+- **dns**: resolving the API host.
+- **connect**: opening a new connection, including the TLS handshake, which
+    aiohttp does not trace separately.
+- **ttfb**: from sending the request headers to receiving the response headers.
+- **body_read**: reading the response body.
+- **total**: from starting the request to reading the body.
+
+The session created by the `VeSync` manager has the trace config installed. Add it
+to a user supplied session to get the same breakdown, without it only `ttfb`,
+`body_read` and `total` are measured.
+
+Example:
+    Trace a user supplied session:
+
+    ```python
+    from aiohttp import ClientSession
+    from pyvesync import VeSync
+    from pyvesync.utils.request_timing import timing_trace_config
+
+    async with ClientSession(trace_configs=[timing_trace_config()]) as session:
+        manager = VeSync('user', 'password', session=session)
+        await manager.login()
+        print(manager.request_timing.snapshot())
+    ```
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import TraceConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+TIMING_PHASES = ('pool_wait', 'dns', 'connect', 'ttfb', 'body_read', 'total')
+
+
+def _span(start: float | None, end: float | None) -> float | None:
+    """Return the seconds between two marks, None if either is missing."""
+    if start is None or end is None:
+        return None
+    return end - start
+
+
+class RequestTiming:
+    """Timestamps of the phases of one request, from `time.monotonic()`.
+
+    Attributes:
+        started (float | None): Request started.
+        queued_start (float | None): Started waiting for a pooled connection.
+        queued_end (float | None): Got a pooled connection.
+        dns_start (float | None): Started resolving the host.
+        dns_end (float | None): Host resolved.
+        connect_start (float | None): Started opening a connection.
+        connect_end (float | None): Connection open.
+        headers_sent (float | None): Request headers sent.
+        response_start (float | None): Response headers received.
+        body_end (float | None): Response body read.
+        reused (bool): An existing pooled connection was reused.
+    """
+
+    __slots__ = (
+        'body_end',
+        'connect_end',
+        'connect_start',
+        'dns_end',
+        'dns_start',
+        'headers_sent',
+        'queued_end',
+        'queued_start',
+        'response_start',
+        'reused',
+        'started',
+    )
+
+    def __init__(self) -> None:
+        """Initialize the request timing without marks."""
+        self.started: float | None = None
+        self.queued_start: float | None = None
+        self.queued_end: float | None = None
+        self.dns_start: float | None = None
+        self.dns_end: float | None = None
+        self.connect_start: float | None = None
+        self.connect_end: float | None = None
+        self.headers_sent: float | None = None
+        self.response_start: float | None = None
+        self.body_end: float | None = None
+        self.reused = False
+
+    @property
+    def pool_wait(self) -> float | None:
+        """Return the seconds spent waiting for a pooled connection."""
+        return _span(self.queued_start, self.queued_end)
+
+    @property
+    def dns(self) -> float | None:
+        """Return the seconds spent resolving the host."""
+        return _span(self.dns_start, self.dns_end)
+
+    @property
+    def connect(self) -> float | None:
+        """Return the seconds spent opening a connection, excluding DNS."""
+        connect = _span(self.connect_start, self.connect_end)
+        if connect is None:
+            return None
+        return connect - (self.dns or 0.0)
+
+    @property
+    def ttfb(self) -> float | None:
+        """Return the seconds from sending the request to the response headers."""
+        return _span(self.headers_sent or self.started, self.response_start)
+
+    @property
+    def body_read(self) -> float | None:
+        """Return the seconds spent reading the response body."""
+        return _span(self.response_start, self.body_end)
+
+    @property
+    def total(self) -> float | None:
+        """Return the seconds from starting the request to reading the body."""
+        return _span(self.started, self.body_end)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the phase durations and connection reuse as a dictionary."""
+        timing: dict[str, Any] = {phase: getattr(self, phase) for phase in TIMING_PHASES}
+        timing['reused'] = self.reused
+        return timing
+
+
+def _mark(
+    attribute: str,
+) -> Callable[[object, Any, object], Awaitable[None]]:
+    """Return a trace callback setting a timestamp of the request's timing."""
+
+    async def callback(
+        _session: object,
+        trace_ctx: Any,  # noqa: ANN401
+        _params: object,
+    ) -> None:
+        timing = trace_ctx.trace_request_ctx
+        if isinstance(timing, RequestTiming):
+            setattr(timing, attribute, time.monotonic())
+
+    return callback
+
+
+async def _on_connection_reused(
+    _session: object,
+    trace_ctx: Any,  # noqa: ANN401
+    _params: object,
+) -> None:
+    """Flag the request's timing as using a reused connection."""
+    timing = trace_ctx.trace_request_ctx
+    if isinstance(timing, RequestTiming):
+        timing.reused = True
+
+
+def timing_trace_config() -> TraceConfig:
+    """Return an `aiohttp.TraceConfig` recording `RequestTiming` marks.
+
+    Only requests sent with a `RequestTiming` as `trace_request_ctx` are recorded,
+    other requests of the session are ignored.
+    """
+    trace_config = TraceConfig()
+    trace_config.on_connection_queued_start.append(_mark('queued_start'))
+    trace_config.on_connection_queued_end.append(_mark('queued_end'))
+    trace_config.on_dns_resolvehost_start.append(_mark('dns_start'))
+    trace_config.on_dns_resolvehost_end.append(_mark('dns_end'))
+    trace_config.on_connection_create_start.append(_mark('connect_start'))
+    trace_config.on_connection_create_end.append(_mark('connect_end'))
+    trace_config.on_connection_reuseconn.append(_on_connection_reused)
+    trace_config.on_request_headers_sent.append(_mark('headers_sent'))
+    trace_config.on_request_end.append(_mark('response_start'))
+    return trace_config
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """Aggregate of one timing phase.
+
+    Attributes:
+        count (int): Requests that went through the phase.
+        total (float): Seconds spent in the phase by all requests.
+        max (float): Longest time spent in the phase in seconds.
+    """
+
+    count: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        """Return the mean seconds spent in the phase."""
+        return self.total / self.count if self.count else 0.0
+
+
+class RequestTimingStats:
+    """Aggregated request timing of the manager's requests."""
+
+    __slots__ = ('_counts', '_max', '_requests', '_reused', '_totals')
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._counts = dict.fromkeys(TIMING_PHASES, 0)
+        self._totals = dict.fromkeys(TIMING_PHASES, 0.0)
+        self._max = dict.fromkeys(TIMING_PHASES, 0.0)
+        self._requests = 0
+        self._reused = 0
+
+    @property
+    def requests(self) -> int:
+        """Return the number of timed requests."""
+        return self._requests
+
+    @property
+    def reused_connections(self) -> int:
+        """Return the number of timed requests that reused a pooled connection."""
+        return self._reused
+
+    def record(self, timing: RequestTiming) -> None:
+        """Add the phases of a finished request."""
+        self._requests += 1
+        if timing.reused:
+            self._reused += 1
+        for phase in TIMING_PHASES:
+            value = getattr(timing, phase)
+            if value is None:
+                continue
+            self._counts[phase] += 1
+            self._totals[phase] += value
+            self._max[phase] = max(self._max[phase], value)
+
+    def snapshot(self) -> dict[str, PhaseStats]:
+        """Return the aggregate of each phase."""
+        return {
+            phase: PhaseStats(self._counts[phase], self._totals[phase], self._max[phase])
+            for phase in TIMING_PHASES
+        }
@@ -0,0 +1,146 @@
+"""Decoded API response envelope.
+
+`VeSync.async_call_api` decodes each response body once into a `ResponseEnvelope`.
+The envelope is a `dict`, so callers that index the response keep working, and it
+also caches what is derived from the response:
+
+- `error_info` is found by direct key access on the three levels a VeSync response
+    carries a status on: the outer body, the `result` dictionary and the inner
+    `result['result']` dictionary of Bypass V2 responses. Only a response without
+    an error key on any of them is searched with
+    `pyvesync.utils.errors.find_error_code`, so large payloads are not walked.
+- `result_model()` builds a typed model from the result the first time it is
+    requested, and returns the same instance after that.
+
+`Helpers.process_dev_response` and the bypass result helpers in
+`pyvesync.utils.device_mixins` reuse the envelope, so large payloads such as energy
+histories are decoded and checked only once.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pyvesync.utils.errors import ERROR_CODE_KEYS, ErrorCodes, find_error_code
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyvesync.utils.errors import ResponseInfo
+
+T = TypeVar('T')
+
+STATUS_LEVELS = 3
+"""Levels of nested `result` dictionaries checked for error keys."""
+
+
+def _level_code(level: dict, key: str) -> int | None:
+    """Return the integer value of an error key of a level, None if it has none."""
+    value = level.get(key)
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if key != 'code':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _status_code(response: dict) -> tuple[int, str | None] | None:
+    """Return the first non-zero error code of the status levels and its message.
+
+    Returns (0, None) if every error code found is zero, and None if no level has
+    an error key.
+    """
+    found = False
+    level: object = response
+    for _ in range(STATUS_LEVELS):
+        if not isinstance(level, dict):
+            break
+        result = level.get('result')
+        for key in ERROR_CODE_KEYS:
+            code = _level_code(level, key)
+            if code is None:
+                continue
+            found = True
+            if code != 0:
+                msg = level.get('msg')
+                if msg is None and isinstance(result, dict):
+                    msg = result.get('msg')
+                return code, msg
+        level = result
+    return (0, None) if found else None
+
+
+class ResponseEnvelope(dict):
+    """Decoded API response that caches its status and result models.
+
+    Args:
+        response (dict): Decoded JSON response body.
+    """
+
+    __slots__ = ('_error_info', '_models')
+
+    def __init__(self, response: dict) -> None:
+        """Initialize the response envelope."""
+        super().__init__(response)
+        self._error_info: ResponseInfo | None = None
+        self._models: dict[Any, Any] = {}
+
+    @classmethod
+    def wrap(cls, response: dict) -> ResponseEnvelope:
+        """Return the response as an envelope, without copying an envelope."""
+        if isinstance(response, cls):
+            return response
+        return cls(response)
+
+    @property
+    def result(self) -> dict | None:
+        """Return the `result` dictionary, None if it is missing."""
+        result = self.get('result')
+        return result if isinstance(result, dict) else None
+
+    @property
+    def inner_result(self) -> dict | None:
+        """Return the inner `result['result']` dictionary of Bypass V2 responses."""
+        result = self.result
+        if result is None:
+            return None
+        inner = result.get('result')
+        return inner if isinstance(inner, dict) else None
+
+    @property
+    def error_info(self) -> ResponseInfo:
+        """Return the `ResponseInfo` of the response, determined once.
+
+        The outer body, the result and the inner result are checked in that order
+        and the first non-zero code is returned. The whole response is searched
+        only when none of these levels has an error key.
+        """
+        if self._error_info is None:
+            error = _status_code(self)
+            if error is None:
+                error = find_error_code(self)
+            self._error_info = ErrorCodes.get_error_info(*error)
+        return self._error_info
+
+    def result_model(self, model: type[T], factory: Callable[[], T | None]) -> T | None:
+        """Return the model built from the result, building it on first use.
+
+        Args:
+            model (type[T]): Model class, used as the cache key.
+            factory (Callable[[], T | None]): Builds the model, returning None if
+                the result cannot be deserialized. None is not cached.
+
+        Returns:
+            T | None: Cached or newly built model instance.
+        """
+        instance = self._models.get(model)
+        if instance is None:
+            instance = factory()
+            if instance is not None:
+                self._models[model] = instance
+        return instance
@@ -0,0 +1,278 @@
+"""Request scheduler for outbound VeSync API calls.
+
+Every call made through `VeSync.async_call_api` acquires a slot from the manager's
+`RequestScheduler` before the request is sent and releases it once the response body
+has been read. By default no limits are set and slots are granted immediately. The
+scheduler can bound the total number of requests in flight and the number of
+requests in flight for each endpoint family. Waiting
+requests are granted slots in the order they arrived (FIFO). A request whose family
+is at its cap does not block requests of other families queued behind it.
+
+Example:
+    Limit the manager to 10 requests in flight, at most 4 of them to energy endpoints:
+
+    ```python
+    from pyvesync import VeSync
+    from pyvesync.utils.scheduler import EndpointFamily, SchedulerConfig
+
+    config = SchedulerConfig(
+        max_in_flight=10,
+        family_limits={EndpointFamily.ENERGY: 4},
+    )
+    manager = VeSync('user', 'password', scheduler_config=config)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class EndpointFamily(StrEnum):
+    """Groups of API endpoints that share request limits.
+
+    Attributes:
+        BYPASS_V1: `/cloud/v1/deviceManaged/*` device endpoints.
+        BYPASS_V2: `/cloud/v2/deviceManaged/bypassV2` endpoint.
+        LEGACY: Legacy `/v1/device/*` and `/v2/device/*` style endpoints.
+        ENERGY: Energy history endpoints.
+        ACCOUNT: Login, device list, firmware and other account endpoints.
+    """
+
+    BYPASS_V1 = 'bypassV1'
+    BYPASS_V2 = 'bypassV2'
+    LEGACY = 'legacy'
+    ENERGY = 'energy'
+    ACCOUNT = 'account'
+
+
+_ACCOUNT_ENDPOINTS = frozenset(
+    {
+        '/cloud/v1/deviceManaged/devices',
+        '/cloud/v2/deviceManaged/getFirmwareUpdateInfoList',
+    }
+)
+
+
+def endpoint_family(api: str) -> EndpointFamily:
+    """Return the endpoint family of an API path.
+
+    Args:
+        api (str): API path without the base URL,
+            e.g. `/cloud/v2/deviceManaged/bypassV2`.
+
+    Returns:
+        EndpointFamily: The family the endpoint belongs to.
+    """
+    if api in _ACCOUNT_ENDPOINTS:
+        return EndpointFamily.ACCOUNT
+    if api.startswith('/cloud/v2/deviceManaged/'):
+        return EndpointFamily.BYPASS_V2
+    if api.startswith('/cloud/v1/deviceManaged/'):
+        return EndpointFamily.BYPASS_V1
+    if api.startswith(('/cloud/v1/device/', '/cloud/v1/outlet/')):
+        return EndpointFamily.ENERGY
+    if api.startswith(('/v1/', '/v2/')):
+        return EndpointFamily.LEGACY
+    return EndpointFamily.ACCOUNT
+
+
+@dataclass(kw_only=True)
+class SchedulerConfig:
+    """Configuration for the request scheduler.
+
+    Attributes:
+        max_in_flight (int | None): Maximum number of requests in flight across all
+            endpoints, None (the default) for no limit.
+        family_limits (dict[EndpointFamily, int]): Maximum number of requests in
+            flight for each endpoint family. Families not in the dictionary are
+            only bound by `max_in_flight`.
+    """
+
+    max_in_flight: int | None = None
+    family_limits: dict[EndpointFamily, int] = field(default_factory=dict)
+
+
+@dataclass
+class SchedulerStats:
+    """Snapshot of request scheduler statistics.
+
+    Attributes:
+        in_flight (int): Requests currently holding a slot.
+        queue_depth (int): Requests currently waiting for a slot.
+        max_queue_depth (int): Largest queue depth observed.
+        total_requests (int): Number of slots granted.
+        queued_requests (int): Number of requests that had to wait for a slot.
+        total_wait_time (float): Seconds spent waiting for slots by all requests.
+        max_wait_time (float): Longest wait for a slot in seconds.
+        in_flight_by_family (dict[str, int]): Requests holding a slot by family.
+    """
+
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    total_requests: int
+    queued_requests: int
+    total_wait_time: float
+    max_wait_time: float
+    in_flight_by_family: dict[str, int]
+
+    @property
+    def average_wait_time(self) -> float:
+        """Return the average wait for a slot in seconds across all requests."""
+        if self.total_requests == 0:
+            return 0.0
+        return self.total_wait_time / self.total_requests
+
+
+class RequestScheduler:
+    """Concurrency limiter with FIFO fairness for outbound API requests.
+
+    Use `acquire()` before sending a request and `release()` after the response
+    has been read, with the same endpoint family.
+
+    Args:
+        config (SchedulerConfig | None): Scheduler limits, defaults to
+            `SchedulerConfig()`.
+    """
+
+    __slots__ = (
+        '_config',
+        '_family_in_flight',
+        '_in_flight',
+        '_max_queue_depth',
+        '_max_wait_time',
+        '_queued_requests',
+        '_total_requests',
+        '_total_wait_time',
+        '_waiters',
+    )
+
+    def __init__(self, config: SchedulerConfig | None = None) -> None:
+        """Initialize the request scheduler."""
+        self._config = config or SchedulerConfig()
+        self._in_flight = 0
+        self._family_in_flight: dict[EndpointFamily, int] = dict.fromkeys(
+            EndpointFamily, 0
+        )
+        self._waiters: deque[tuple[EndpointFamily, asyncio.Future[None]]] = deque()
+        self._max_queue_depth = 0
+        self._total_requests = 0
+        self._queued_requests = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def config(self) -> SchedulerConfig:
+        """Return the scheduler configuration."""
+        return self._config
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    def _has_capacity(self, family: EndpointFamily) -> bool:
+        """Check if a slot is free for the endpoint family."""
+        max_in_flight = self._config.max_in_flight
+        if max_in_flight is not None and self._in_flight >= max_in_flight:
+            return False
+        family_limit = self._config.family_limits.get(family)
+        return family_limit is None or self._family_in_flight[family] < family_limit
+
+    def _take(self, family: EndpointFamily) -> None:
+        """Mark a slot as taken."""
+        self._in_flight += 1
+        self._family_in_flight[family] += 1
+        self._total_requests += 1
+
+    def _wake_waiters(self) -> None:
+        """Grant free slots to waiting requests in arrival order."""
+        if not self._waiters:
+            return
+        max_in_flight = self._config.max_in_flight
+        remaining: deque[tuple[EndpointFamily, asyncio.Future[None]]] = deque()
+        while self._waiters:
+            if max_in_flight is not None and self._in_flight >= max_in_flight:
+                break
+            family, waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            if self._has_capacity(family):
+                self._take(family)
+                waiter.set_result(None)
+            else:
+                remaining.append((family, waiter))
+        remaining.extend(self._waiters)
+        self._waiters = remaining
+
+    async def acquire(self, family: EndpointFamily) -> float:
+        """Wait for a request slot.
+
+        Args:
+            family (EndpointFamily): Endpoint family of the request.
+
+        Returns:
+            float: Seconds spent waiting for the slot.
+        """
+        # Queued requests are always blocked by a limit, so a free slot for this
+        # family cannot be taken ahead of an earlier request that could use it.
+        if self._has_capacity(family):
+            self._take(family)
+            return 0.0
+        start = time.monotonic()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((family, waiter))
+        self._queued_requests += 1
+        self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted before the cancellation was delivered
+                self.release(family)
+            else:
+                with suppress(ValueError):
+                    self._waiters.remove((family, waiter))
+            raise
+        wait_time = time.monotonic() - start
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+        return wait_time
+
+    def release(self, family: EndpointFamily) -> None:
+        """Release a request slot taken with `acquire()`.
+
+        Args:
+            family (EndpointFamily): Endpoint family passed to `acquire()`.
+        """
+        self._in_flight -= 1
+        self._family_in_flight[family] -= 1
+        self._wake_waiters()
+
+    def stats(self) -> SchedulerStats:
+        """Return a snapshot of the scheduler statistics."""
+        return SchedulerStats(
+            in_flight=self._in_flight,
+            queue_depth=len(self._waiters),
+            max_queue_depth=self._max_queue_depth,
+            total_requests=self._total_requests,
+            queued_requests=self._queued_requests,
+            total_wait_time=self._total_wait_time,
+            max_wait_time=self._max_wait_time,
+            in_flight_by_family={
+                str(family): count
+                for family, count in self._family_in_flight.items()
+                if count
+            },
+        )
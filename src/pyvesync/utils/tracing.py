@@ -0,0 +1,237 @@
+"""Optional tracing spans around device and manager operations.
+
+pyvesync has no dependency on a tracing library. The manager accepts any object
+implementing the `Tracer` protocol, a subset of the OpenTelemetry tracer API, so an
+OpenTelemetry tracer can be passed as is. Without a tracer the manager uses
+`NOOP_TRACER`, which does not build span attributes at all.
+
+Spans are started for:
+
+- `VeSync.login`, `VeSync.get_devices`, `VeSync.update` and
+    `VeSync.update_all_devices`,
+- `VeSync.async_call_api`, with the endpoint, payload method, HTTP status and
+    result code of the request,
+- `update()`, `get_details()`, `toggle_switch()` and the `set_*()` methods of each
+    device class, named after the class, e.g. `VeSyncAirBypass.get_details`.
+
+Device spans carry the cid, device type, product type and device class of the
+device, and the code of the device's `last_response` when the method returns. An
+override calling the same method with `super()` runs in the span of the override,
+no nested span of the same name is started. Device methods are only wrapped once
+the first manager with a tracer is created, until then they are called directly.
+
+The current span is expected to be tracked in a context variable, as OpenTelemetry
+does. `VeSync.update_all_devices` starts one task per device, and tasks copy the
+context they are created in, so each device update is a child span of the
+`VeSync.update_all_devices` span and a fleet update shows up as one trace.
+
+Example:
+    Trace the manager with OpenTelemetry:
+
+    ```python
+    from opentelemetry import trace
+    from pyvesync import VeSync
+
+    manager = VeSync('user', 'password', tracer=trace.get_tracer('pyvesync'))
+    ```
+"""
+
+from __future__ import annotations
+
+import inspect
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Mapping
+
+    from pyvesync.base_devices.vesyncbasedevice import VeSyncBaseDevice
+    from pyvesync.utils.errors import ResponseInfo
+
+AttributeValue = str | bool | int | float
+
+ATTR_CID = 'vesync.cid'
+ATTR_DEVICE_CLASS = 'vesync.device_class'
+ATTR_DEVICE_TYPE = 'vesync.device_type'
+ATTR_PRODUCT_TYPE = 'vesync.product_type'
+ATTR_SUB_DEVICE_NO = 'vesync.sub_device_no'
+ATTR_ENDPOINT = 'vesync.endpoint'
+ATTR_PAYLOAD_METHOD = 'vesync.payload_method'
+ATTR_RESULT_CODE = 'vesync.result_code'
+ATTR_HTTP_METHOD = 'http.request.method'
+ATTR_HTTP_STATUS = 'http.response.status_code'
+
+TRACED_DEVICE_METHODS = frozenset({'get_details', 'toggle_switch', 'update'})
+"""Device methods wrapped in a span, in addition to the `set_*` methods."""
+
+_T = TypeVar('_T')
+
+_TRACED_METHOD: ContextVar[tuple[int, str] | None] = ContextVar(
+    'vesync_traced_method', default=None
+)
+"""Device id and method name of the innermost traced device method."""
+
+
+class Span(Protocol):
+    """Span started by a `Tracer`."""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Set an attribute of the span."""
+
+
+class Tracer(Protocol):
+    """Starts spans, compatible with `opentelemetry.trace.Tracer`."""
+
+    def start_as_current_span(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> AbstractContextManager[Span]:
+        """Return a context manager starting a span as the current span.
+
+        The span is a child of the current span and ends when the context exits.
+        An exception raised in the context should be recorded on the span.
+        """
+
+
+class NoOpSpan:
+    """Span that discards its attributes."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Discard the attribute."""
+
+
+class NoOpTracer:
+    """Tracer whose spans do nothing, used when no tracer is configured."""
+
+    __slots__ = ('_context',)
+
+    def __init__(self) -> None:
+        """Initialize the tracer with a reusable span context."""
+        self._context = nullcontext(NoOpSpan())
+
+    def start_as_current_span(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> AbstractContextManager[Span]:
+        """Return a context manager yielding a no-op span."""
+        del name, attributes
+        return self._context
+
+
+NOOP_TRACER = NoOpTracer()
+
+
+def span_attributes(
+    attributes: Mapping[str, AttributeValue | None],
+) -> dict[str, AttributeValue]:
+    """Return the attributes that are set, tracers do not accept None values."""
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def device_attributes(device: VeSyncBaseDevice) -> dict[str, AttributeValue]:
+    """Return the span attributes identifying a device."""
+    return span_attributes(
+        {
+            ATTR_CID: device.cid,
+            ATTR_DEVICE_TYPE: device.device_type,
+            ATTR_PRODUCT_TYPE: device.product_type,
+            ATTR_DEVICE_CLASS: type(device).__name__,
+            ATTR_SUB_DEVICE_NO: device.sub_device_no,
+        }
+    )
+
+
+def set_result_code(span: Span, response_info: ResponseInfo | None) -> None:
+    """Set the result code attribute of a span from a response, if known."""
+    if response_info is not None and response_info.code is not None:
+        span.set_attribute(ATTR_RESULT_CODE, response_info.code)
+
+
+class _DeviceTracing:
+    """Device classes waiting for their methods to be wrapped in spans."""
+
+    __slots__ = ('classes', 'enabled')
+
+    def __init__(self) -> None:
+        """Initialize with tracing disabled."""
+        self.classes: list[type] = []
+        self.enabled = False
+
+
+_DEVICE_TRACING = _DeviceTracing()
+
+
+def register_traced_class(cls: type) -> None:
+    """Wrap the traced methods of a device class, deferred until tracing is on."""
+    if _DEVICE_TRACING.enabled:
+        wrap_traced_methods(cls)
+    else:
+        _DEVICE_TRACING.classes.append(cls)
+
+
+def enable_device_tracing() -> None:
+    """Wrap the traced methods of all registered device classes in spans.
+
+    Called when a manager with a tracer is created. Device classes defined later
+    are wrapped when they are registered.
+    """
+    if _DEVICE_TRACING.enabled:
+        return
+    _DEVICE_TRACING.enabled = True
+    for cls in _DEVICE_TRACING.classes:
+        wrap_traced_methods(cls)
+    _DEVICE_TRACING.classes.clear()
+
+
+def wrap_traced_methods(cls: type) -> None:
+    """Wrap the traced coroutine methods defined on a class in spans."""
+    for name, value in list(vars(cls).items()):
+        if is_traced_device_method(name, value):
+            setattr(cls, name, traced_device_method(value))
+
+
+def is_traced_device_method(name: str, value: object) -> bool:
+    """Return True if a device class attribute is a method to wrap in a span."""
+    if getattr(value, '__vesync_traced__', False):
+        return False
+    if name not in TRACED_DEVICE_METHODS and not name.startswith('set_'):
+        return False
+    return inspect.iscoroutinefunction(value)
+
+
+def traced_device_method(
+    func: Callable[..., Coroutine[Any, Any, _T]],
+) -> Callable[..., Coroutine[Any, Any, _T]]:
+    """Wrap a device coroutine method in a span named after the device class.
+
+    The span is only started when the device's manager has a tracer configured,
+    and not when the method is called with `super()` from an override that is
+    already in its span.
+    """
+
+    @wraps(func)
+    async def wrapper(
+        self: VeSyncBaseDevice,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> _T:
+        tracer = self.manager.tracer
+        traced_method = (id(self), func.__name__)
+        if tracer is NOOP_TRACER or _TRACED_METHOD.get() == traced_method:
+            return await func(self, *args, **kwargs)
+        token = _TRACED_METHOD.set(traced_method)
+        try:
+            with tracer.start_as_current_span(
+                f'{type(self).__name__}.{func.__name__}',
+                attributes=device_attributes(self),
+            ) as span:
+                result = await func(self, *args, **kwargs)
+                set_result_code(span, self.last_response)
+                return result
+        finally:
+            _TRACED_METHOD.reset(token)
+
+    wrapper.__vesync_traced__ = True  # type: ignore[attr-defined]
+    return wrapper
@@ -0,0 +1,280 @@
+"""HTTP transport for the VeSync API.
+
+The `VeSync` manager sends every request through an object implementing the
+`Transport` protocol. By default this is an `AiohttpTransport` wrapping the
+manager's `aiohttp.ClientSession`. Other transports, such as an in-process fake of
+the VeSync cloud for load testing, can be passed with `VeSync(..., transport=...)`.
+
+The `TransportConfig` dataclass holds the connection pool and timeout settings used
+by the `VeSync` manager for every request to the VeSync cloud. A single pooled
+`aiohttp.ClientSession` is shared for both regional API hosts
+(`smartapi.vesync.com` and `smartapi.vesync.eu`), so the per-host limit applies to
+each region independently. Set `base_url` to send all requests to another host,
+for example a fake cloud server on localhost.
+
+Example:
+    Configure a larger connection pool for a big account:
+
+    ```python
+    from pyvesync import VeSync
+    from pyvesync.utils.transport import TransportConfig
+
+    config = TransportConfig(limit=200, limit_per_host=50, keepalive_timeout=60)
+    async with VeSync('user', 'password', transport_config=config) as manager:
+        await manager.login()
+    ```
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+import orjson
+from aiohttp import ClientTimeout, TCPConnector
+
+from pyvesync.const import API_TIMEOUT
+from pyvesync.utils.request_timing import RequestTiming
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from aiohttp import ClientSession
+    from mashumaro.mixins.orjson import DataClassORJSONMixin
+    from yarl import URL
+
+
+@dataclass(kw_only=True)
+class TransportConfig:
+    """Connection pool and timeout configuration for API requests.
+
+    The connector settings are only applied to the session created by the
+    `VeSync` manager. The request timeout is applied to every request, including
+    requests made through a user supplied `ClientSession`.
+
+    Attributes:
+        limit (int): Total number of simultaneous connections in the pool,
+            0 for no limit.
+        limit_per_host (int): Simultaneous connections to a single API host,
+            0 for no limit.
+        keepalive_timeout (float): Seconds an idle connection is kept open for reuse.
+        ttl_dns_cache (int | None): Seconds to cache DNS lookups, None to cache
+            forever.
+        total_timeout (float | None): Total seconds allowed for a request,
+            including waiting for a pooled connection. Defaults to `API_TIMEOUT`.
+        connect_timeout (float | None): Seconds allowed to acquire a connection
+            from the pool or open a new one.
+        sock_connect_timeout (float | None): Seconds allowed to open a new socket.
+        sock_read_timeout (float | None): Seconds allowed between reads of the
+            response.
+        base_url (str | None): Base URL used for all requests instead of the
+            regional API host, None to use the host for the account region.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 30
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: int | None = 300
+    total_timeout: float | None = API_TIMEOUT
+    connect_timeout: float | None = None
+    sock_connect_timeout: float | None = None
+    sock_read_timeout: float | None = None
+    base_url: str | None = None
+
+    def build_connector(self) -> TCPConnector:
+        """Return a `TCPConnector` using the pool settings.
+
+        Must be called from a running event loop.
+        """
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def build_timeout(self) -> ClientTimeout:
+        """Return the `ClientTimeout` applied to each request."""
+        return ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.sock_connect_timeout,
+            sock_read=self.sock_read_timeout,
+        )
+
+
+@dataclass
+class TransportResponse:
+    """Response returned by a `Transport`.
+
+    Attributes:
+        status (int): HTTP status code.
+        body (bytes): Raw response body.
+        url (URL): URL of the request.
+        method (str): HTTP method of the request.
+        headers (Mapping[str, str]): Response headers.
+        timing (RequestTiming | None): Connection level timing of the request, None
+            if the transport does not measure it.
+    """
+
+    status: int
+    body: bytes
+    url: URL
+    method: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    timing: RequestTiming | None = None
+
+
+class RequestBody:
+    """JSON body of an API request.
+
+    Request models are serialized straight to bytes with their orjson `to_jsonb()`.
+    The dictionary form of a model is only built when it is needed, such as for
+    debug logging or when the body has to be replayed with a new token.
+
+    Args:
+        source (DataClassORJSONMixin | dict): Request model or dictionary.
+    """
+
+    __slots__ = ('_content', '_dict', 'model')
+
+    def __init__(self, source: DataClassORJSONMixin | dict) -> None:
+        """Initialize the request body."""
+        self.model: DataClassORJSONMixin | None = None
+        self._dict: dict | None = None
+        if isinstance(source, dict):
+            self._dict = source
+        else:
+            self.model = source
+        self._content: bytes | None = None
+
+    @property
+    def content(self) -> bytes:
+        """Return the serialized body, serializing it on first use."""
+        if self._content is None:
+            if self.model is not None:
+                self._content = self.model.to_jsonb()
+            else:
+                self._content = orjson.dumps(self._dict, option=orjson.OPT_NON_STR_KEYS)
+        return self._content
+
+    def to_dict(self) -> dict:
+        """Return the body as a dictionary, building it from the model once."""
+        if self._dict is None:
+            self._dict = self.model.to_dict() if self.model is not None else {}
+        return self._dict
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        """Return the value of a top level key, None if it is not set."""
+        if self.model is None:
+            return self.to_dict().get(key)
+        return getattr(self.model, key, None)
+
+    def replace(self, **values: Any) -> RequestBody:  # noqa: ANN401
+        """Return a copy of the body with the values of existing keys replaced."""
+        body = self.to_dict().copy()
+        for key, value in values.items():
+            if key in body:
+                body[key] = value
+        return RequestBody(body)
+
+
+def json_content_headers(headers: dict | None) -> dict:
+    """Return the headers with a JSON content type added if none is set."""
+    if headers is None:
+        return {'Content-Type': 'application/json'}
+    if any(key.lower() == 'content-type' for key in headers):
+        return headers
+    return {**headers, 'Content-Type': 'application/json'}
+
+
+class Transport(Protocol):
+    """Interface used by the `VeSync` manager to send API requests."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict | None = None,
+        data: bytes | None = None,
+        headers: dict | None = None,
+    ) -> TransportResponse:
+        """Send a request and return the complete response.
+
+        The `VeSync` manager sends JSON bodies already serialized in `data`.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full request URL.
+            json (dict | None): JSON request body to serialize.
+            data (bytes | None): Serialized JSON request body.
+            headers (dict | None): Request headers.
+
+        Returns:
+            TransportResponse: Status, body and headers of the response.
+        """
+        ...
+
+
+class AiohttpTransport:
+    """Transport sending requests with an `aiohttp.ClientSession`.
+
+    Args:
+        session (ClientSession): Session used for requests, it is not closed by
+            the transport.
+        request_timeout (ClientTimeout | None): Timeout applied to each request,
+            None to use the session timeout.
+    """
+
+    __slots__ = ('request_timeout', 'session')
+
+    def __init__(
+        self, session: ClientSession, request_timeout: ClientTimeout | None = None
+    ) -> None:
+        """Initialize the transport."""
+        self.session = session
+        self.request_timeout = request_timeout
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict | None = None,
+        data: bytes | None = None,
+        headers: dict | None = None,
+    ) -> TransportResponse:
+        """Send a request with the session and read the response body.
+
+        A `data` body is sent as `application/json` unless the headers set another
+        content type. The request is timed with a `RequestTiming` passed as the
+        aiohttp `trace_request_ctx`.
+        """
+        if data is not None:
+            headers = json_content_headers(headers)
+        timing = RequestTiming()
+        timing.started = time.monotonic()
+        async with self.session.request(
+            method,
+            url=url,
+            json=json,
+            data=data,
+            headers=headers,
+            raise_for_status=False,
+            timeout=self.request_timeout,
+            trace_request_ctx=timing,
+        ) as response:
+            if timing.response_start is None:
+                timing.response_start = time.monotonic()
+            body = await response.read()
+            timing.body_end = time.monotonic()
+            return TransportResponse(
+                status=response.status,
+                body=body,
+                url=response.url,
+                method=response.method,
+                headers=dict(response.headers),
+                timing=timing,
+            )
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import MISSING, fields
+import time
+from dataclasses import MISSING, dataclass, field, fields, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
@@ -12,13 +13,14 @@ from aiohttp import ClientSession
 from aiohttp.client_exceptions import ClientResponseError
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
-from pyvesync.auth import VeSyncAuth
+from pyvesync.auth import LOGIN_REQUEST, TokenRefreshConfig, VeSyncAuth
 from pyvesync.const import (
     DEFAULT_REGION,
     DEFAULT_TZ,
     MAX_API_REAUTH_RETRIES,
     REGION_API_MAP,
     STATUS_OK,
+    STATUS_TOO_MANY_REQUESTS,
 )
 from pyvesync.device_container import DeviceContainer
 from pyvesync.models.vesync_models import (
@@ -28,25 +30,128 @@ from pyvesync.models.vesync_models import (
     ResponseDeviceListModel,
     ResponseFirmwareModel,
 )
+from pyvesync.utils.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    device_key,
+    url_key,
+)
+from pyvesync.utils.coalesce import RequestCoalescer
 from pyvesync.utils.errors import (
     ErrorCodes,
     ErrorTypes,
     VeSyncAPIResponseError,
     VeSyncAPIStatusCodeError,
     VeSyncError,
+    VeSyncRateLimitError,
     VeSyncServerError,
     VeSyncTokenError,
     raise_api_errors,
 )
-from pyvesync.utils.helpers import Helpers
+from pyvesync.utils.exchange_log import (
+    ExchangeLog,
+    ExchangeLogConfig,
+    payload_method,
+)
+from pyvesync.utils.helpers import FieldCache, Helpers
 from pyvesync.utils.logs import LibraryLogger
+from pyvesync.utils.metrics import MetricKey, MetricsRegistry, error_type_of
+from pyvesync.utils.rate_limit import AdaptiveRateLimiter, RateLimitConfig
+from pyvesync.utils.request_timing import RequestTimingStats, timing_trace_config
+from pyvesync.utils.response import ResponseEnvelope
+from pyvesync.utils.scheduler import RequestScheduler, SchedulerConfig, endpoint_family
+from pyvesync.utils.tracing import (
+    ATTR_CID,
+    ATTR_ENDPOINT,
+    ATTR_HTTP_METHOD,
+    ATTR_HTTP_STATUS,
+    ATTR_PAYLOAD_METHOD,
+    NOOP_TRACER,
+    device_attributes,
+    enable_device_tracing,
+    set_result_code,
+    span_attributes,
+)
+from pyvesync.utils.transport import (
+    AiohttpTransport,
+    RequestBody,
+    Transport,
+    TransportConfig,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from pyvesync.base_devices import VeSyncBaseDevice
+    from pyvesync.utils.tracing import AttributeValue, Span, Tracer
+    from pyvesync.utils.transport import TransportResponse
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(kw_only=True)
+class DeviceListConfig:
+    """Pagination settings for the device list request.
+
+    Attributes:
+        page_size (int): Devices requested per page.
+        page_concurrency (int): Pages requested at once after the first page.
+    """
+
+    page_size: int = 100
+    page_concurrency: int = 4
+
+
+@dataclass
+class UpdateResult:
+    """Outcome of `VeSync.update_all_devices()`.
+
+    Attributes:
+        updated (list[VeSyncBaseDevice]): Devices updated before the deadline.
+        failed (dict[VeSyncBaseDevice, BaseException]): Devices whose update
+            raised an exception, with the exception.
+        pending (list[VeSyncBaseDevice]): Devices still updating when the deadline
+            was reached.
+        cancelled (bool): True if the pending updates were cancelled, False if
+            they were left running in the background.
+    """
+
+    updated: list[VeSyncBaseDevice] = field(default_factory=list)
+    failed: dict[VeSyncBaseDevice, BaseException] = field(default_factory=dict)
+    pending: list[VeSyncBaseDevice] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def complete(self) -> bool:
+        """Return True if every device finished updating before the deadline."""
+        return not self.pending
+
+
+@dataclass(slots=True)
+class _ApiCall:
+    """One `VeSync.async_call_api` call, shared by its retries and replay.
+
+    Attributes:
+        api (str): Endpoint of the request.
+        method (str): HTTP method of the request.
+        request_body (RequestBody | None): Body of the request.
+        headers (dict | None): Headers of the request.
+        device (VeSyncBaseDevice | None): Device making the request, if any.
+        cid (str | None): Device cid of the request, if any.
+        metric_key (MetricKey): Metrics key of the request.
+        span (Span): Tracing span of the call.
+    """
+
+    api: str
+    method: str
+    request_body: RequestBody | None
+    headers: dict | None
+    device: VeSyncBaseDevice | None
+    cid: str | None
+    metric_key: MetricKey
+    span: Span
+
+
 class VeSync:  # pylint: disable=function-redefined
     """VeSync Manager Class."""
 
@@ -54,19 +159,34 @@ class VeSync:  # pylint: disable=function-redefined
         '__weakref__',
         '_api_attempts',
         '_auth',
+        '_background_updates',
+        '_circuit_breakers',
         '_close_session',
+        '_coalescer',
         '_debug',
         '_device_container',
+        '_device_list_config',
+        '_exchange_log',
+        '_field_cache',
+        '_metrics',
+        '_rate_limiter',
+        '_reauth_task',
         '_redact',
+        '_request_timeout',
+        '_request_timing',
+        '_scheduler',
+        '_time_zone',
+        '_tracer',
+        '_transport',
+        '_transport_config',
         '_verbose',
         'enabled',
         'in_process',
         'language',
         'session',
-        'time_zone',
     )
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         username: str,
         password: str,
@@ -74,6 +194,16 @@ class VeSync:  # pylint: disable=function-redefined
         session: ClientSession | None = None,
         time_zone: str = DEFAULT_TZ,
         redact: bool = True,
+        *,
+        transport_config: TransportConfig | None = None,
+        scheduler_config: SchedulerConfig | None = None,
+        rate_limit_config: RateLimitConfig | None = None,
+        token_refresh_config: TokenRefreshConfig | None = None,
+        circuit_breaker_config: CircuitBreakerConfig | None = None,
+        transport: Transport | None = None,
+        device_list_config: DeviceListConfig | None = None,
+        exchange_log_config: ExchangeLogConfig | None = None,
+        tracer: Tracer | None = None,
     ) -> None:
         """Initialize VeSync Manager.
 
@@ -100,6 +230,31 @@ class VeSync:  # pylint: disable=function-redefined
                 DEFAULT_TZ. This is automatically set to the time zone of the
                 VeSync account during login.
             redact (bool): Enable redaction of sensitive information, by default True.
+            transport_config (TransportConfig | None): Connection pool and timeout
+                settings for API requests, by default None to use the
+                `TransportConfig` defaults.
+            scheduler_config (SchedulerConfig | None): Limits on the number of
+                requests in flight, by default None which does not limit
+                concurrent requests.
+            rate_limit_config (RateLimitConfig | None): Adaptive rate limiting and
+                retry settings, by default None which does not rate limit or retry
+                requests.
+            token_refresh_config (TokenRefreshConfig | None): Background token
+                refresh settings, by default None which disables proactive refresh.
+            circuit_breaker_config (CircuitBreakerConfig | None): Circuit breaker
+                settings for API base URLs and devices, by default None to use the
+                `CircuitBreakerConfig` defaults.
+            transport (Transport | None): Transport used to send requests, by
+                default None to send requests with the aiohttp `session`.
+            device_list_config (DeviceListConfig | None): Page size and concurrency
+                of the device list request, by default None to use the
+                `DeviceListConfig` defaults.
+            exchange_log_config (ExchangeLogConfig | None): Size and sampling of the
+                ring buffer of recent API exchanges, by default None to use the
+                `ExchangeLogConfig` defaults, which record failed requests only.
+            tracer (Tracer | None): Tracer starting spans around device updates,
+                device commands and API calls, for example an OpenTelemetry tracer.
+                By default None to disable tracing. See `pyvesync.utils.tracing`.
 
         Attributes:
             session (ClientSession):  Client session for API calls
@@ -110,6 +265,17 @@ class VeSync:  # pylint: disable=function-redefined
             auth (VeSyncAuth): Authentication manager
             time_zone (str): Time zone for VeSync account pulled from API
             enabled (bool): True if logged in to VeSync, False if not
+            transport_config (TransportConfig): Connection pool and timeout settings
+            scheduler (RequestScheduler): Scheduler limiting requests in flight
+            rate_limiter (AdaptiveRateLimiter): Token bucket limiting request rate
+            coalescer (RequestCoalescer): Shares identical in-flight device reads
+            circuit_breakers (CircuitBreakerRegistry): Circuit breakers per base URL
+                and device
+            exchange_log (ExchangeLog): Recent API exchanges, globally and per device
+            metrics (MetricsRegistry): Latency and counters of API requests
+            request_timing (RequestTimingStats): Connection level timing of API
+                requests
+            tracer (Tracer): Tracer starting spans, a no-op tracer by default
 
         Note:
             This class is a context manager, use `async with VeSync() as manager:`
@@ -134,15 +300,32 @@ class VeSync:  # pylint: disable=function-redefined
                 Object to store device state information
         """
         self.session = session
+        self._transport = transport
+        self._transport_config = transport_config or TransportConfig()
+        self._request_timeout = self._transport_config.build_timeout()
+        self._scheduler = RequestScheduler(scheduler_config)
+        self._rate_limiter = AdaptiveRateLimiter(rate_limit_config)
+        self._coalescer = RequestCoalescer()
+        self._circuit_breakers = CircuitBreakerRegistry(circuit_breaker_config)
+        self._exchange_log = ExchangeLog(exchange_log_config)
+        self._metrics = MetricsRegistry()
+        self._request_timing = RequestTimingStats()
+        self._tracer: Tracer = tracer or NOOP_TRACER
+        if self._tracer is not NOOP_TRACER:
+            enable_device_tracing()
         self._api_attempts = 0
+        self._reauth_task: asyncio.Task[bool] | None = None
+        self._background_updates: set[asyncio.Task[None]] = set()
         self._close_session = False
         self.redact = redact
         self._verbose: bool = False
-        self.time_zone: str = time_zone
+        self._field_cache = FieldCache(self)
+        self._time_zone: str = time_zone
         self.language: str = 'en'
         self.enabled = False
         self.in_process = False
         self._device_container: DeviceContainer = DeviceContainer()
+        self._device_list_config = device_list_config or DeviceListConfig()
 
         # Initialize authentication manager
         self._auth = VeSyncAuth(
@@ -150,6 +333,7 @@ class VeSync:  # pylint: disable=function-redefined
             username=username,
             password=password,
             country_code=country_code,
+            refresh_config=token_refresh_config,
         )
 
     @property
@@ -162,6 +346,71 @@ class VeSync:  # pylint: disable=function-redefined
         """
         return self._device_container
 
+    @property
+    def transport_config(self) -> TransportConfig:
+        """Return connection pool and timeout configuration."""
+        return self._transport_config
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Return the request scheduler used by `async_call_api`.
+
+        See Also:
+            [`RequestScheduler.stats`][pyvesync.utils.scheduler.RequestScheduler.stats]
+            for queue depth and wait time statistics.
+        """
+        return self._scheduler
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        """Return the adaptive rate limiter used by `async_call_api`."""
+        return self._rate_limiter
+
+    @property
+    def coalescer(self) -> RequestCoalescer:
+        """Return the coalescer shared by identical in-flight device reads."""
+        return self._coalescer
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakerRegistry:
+        """Return the circuit breakers for API base URLs and devices."""
+        return self._circuit_breakers
+
+    @property
+    def exchange_log(self) -> ExchangeLog:
+        """Return the ring buffer of recent API exchanges.
+
+        See Also:
+            [`ExchangeLog.dump`][pyvesync.utils.exchange_log.ExchangeLog.dump] to
+            dump the recorded exchanges as JSON.
+        """
+        return self._exchange_log
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Return the latency histograms and counters of API requests.
+
+        See Also:
+            [`MetricsRegistry.snapshot`][pyvesync.utils.metrics.MetricsRegistry.snapshot]
+            and `MetricsRegistry.render_prometheus` to read the metrics.
+        """
+        return self._metrics
+
+    @property
+    def request_timing(self) -> RequestTimingStats:
+        """Return the aggregated connection level timing of API requests.
+
+        Pool wait, DNS and connect times are only measured for sessions using
+        `pyvesync.utils.request_timing.timing_trace_config()`, which is installed
+        on the session created by the manager.
+        """
+        return self._request_timing
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return the tracer starting spans, a no-op tracer if none was given."""
+        return self._tracer
+
     @property
     def auth(self) -> VeSyncAuth:
         """Return VeSync authentication manager."""
@@ -172,6 +421,17 @@ class VeSync:  # pylint: disable=function-redefined
         """Return country code."""
         return self._auth.country_code
 
+    @property
+    def time_zone(self) -> str:
+        """Return the time zone sent in API requests."""
+        return self._time_zone
+
+    @time_zone.setter
+    def time_zone(self, value: str) -> None:
+        """Set the time zone and clear the cached request fields."""
+        self._time_zone = value
+        self._field_cache.invalidate()
+
     @property
     def current_region(self) -> str:
         """Return current region."""
@@ -254,7 +514,10 @@ class VeSync:  # pylint: disable=function-redefined
         Returns:
             bool: True if credentials were loaded successfully, False otherwise.
         """
-        return await self.auth.load_credentials_from_file(filename)
+        success = await self.auth.load_credentials_from_file(filename)
+        if success:
+            self._auth.start_token_refresh()
+        return success
 
     def set_credentials(
         self, token: str, account_id: str, country_code: str, region: str
@@ -282,53 +545,131 @@ class VeSync:  # pylint: disable=function-redefined
     def process_devices(self, dev_list_resp: ResponseDeviceListModel) -> bool:
         """Instantiate Device Objects.
 
-        Internal method run by `get_devices()` to instantiate device objects.
+        Internal method run by `get_devices()` to reconcile the device container
+        with the device list. See `DeviceContainer.reconcile()`.
 
         """
+        result = self._device_container.reconcile(dev_list_resp, self)
+        if result.removed:
+            logger.debug('Removed %s devices', len(result.removed))
+        if result.added:
+            logger.debug('Added %s devices', len(result.added))
+        if result.changed:
+            logger.debug('Updated %s devices', len(result.changed))
+        return True
+
+    async def get_devices(self) -> bool:
+        """Return tuple listing outlets, switches, and fans of devices.
+
+        This is also called by `VeSync.update()`. Every page of the device list is
+        requested, the devices on each page are added to `devices` as soon as the
+        page arrives. Devices missing from the complete list are removed at the end.
+
+        Raises:
+            VeSyncAPIResponseError: If API response is invalid.
+            VeSyncServerError: If server returns an error.
+        """
+        with self._tracer.start_as_current_span('VeSync.get_devices') as span:
+            response = await self._get_device_list(self._add_device_page)
+            if response is None:
+                return False
+            success = self.process_devices(response)
+            span.set_attribute('vesync.device_count', len(self._device_container))
+            return success
+
+    def _add_device_page(self, page: ResponseDeviceListModel) -> None:
+        """Add the new devices on a device list page to the container."""
         current_device_count = len(self._device_container)
-        if current_device_count > 0:
-            self._device_container.remove_stale_devices(dev_list_resp)
+        self._device_container.add_new_devices(page, self)
         new_device_count = len(self._device_container)
-
         if new_device_count != current_device_count:
             logger.debug(
-                'Removed %s devices', str(current_device_count - new_device_count)
+                'Added %s devices from page %s',
+                new_device_count - current_device_count,
+                page.result.pageNo,
             )
 
-        current_device_count = new_device_count
-        self._device_container.add_new_devices(dev_list_resp, self)
-        new_device_count = len(self._device_container)
-        if new_device_count != current_device_count:
-            logger.debug('Added %s devices', str(new_device_count - current_device_count))
-        return True
+    async def _get_device_list(
+        self, on_page: Callable[[ResponseDeviceListModel], None] | None = None
+    ) -> ResponseDeviceListModel | None:
+        """Request all pages of the device list from the API.
 
-    async def get_devices(self) -> bool:
-        """Return tuple listing outlets, switches, and fans of devices.
+        The first page gives the total number of devices, the remaining pages are
+        requested concurrently, limited by `DeviceListConfig.page_concurrency`.
 
-        This is also called by `VeSync.update()`
+        Args:
+            on_page (Callable[[ResponseDeviceListModel], None] | None): Called with
+                each page as it arrives.
+
+        Returns:
+            ResponseDeviceListModel | None: Device list response with the devices
+                of all pages, None if not logged in.
 
         Raises:
             VeSyncAPIResponseError: If API response is invalid.
             VeSyncServerError: If server returns an error.
         """
         self.in_process = True
-        proc_return = False
 
         if not self.auth.is_authenticated or (
             not self.auth.token or not self.auth.account_id
         ):
             logger.info("Not logged in to VeSync, can't get devices")
-            return False
+            return None
+
+        response = await self._get_device_list_page(1)
+        if on_page is not None:
+            on_page(response)
+        page_size = response.result.pageSize or self._device_list_config.page_size
+        page_count = -(-response.result.total // page_size)
+        if page_count > 1:
+            semaphore = asyncio.Semaphore(self._device_list_config.page_concurrency)
+
+            async def get_page(page_no: int) -> ResponseDeviceListModel:
+                async with semaphore:
+                    return await self._get_device_list_page(page_no)
+
+            page_tasks = [
+                asyncio.create_task(get_page(page_no))
+                for page_no in range(2, page_count + 1)
+            ]
+            try:
+                for page_future in asyncio.as_completed(page_tasks):
+                    page = await page_future
+                    if on_page is not None:
+                        on_page(page)
+                    response.result.list.extend(page.result.list)
+            finally:
+                for task in page_tasks:
+                    task.cancel()
+            logger.debug('Received %d device list pages', page_count)
+
+        self.in_process = False
+
+        return response
+
+    async def _get_device_list_page(self, page_no: int) -> ResponseDeviceListModel:
+        """Request a single page of the device list.
 
+        Raises:
+            VeSyncAPIResponseError: If API response is invalid.
+            VeSyncServerError: If server returns an error.
+        """
+        if not self.auth.token or not self.auth.account_id:
+            raise VeSyncAPIResponseError('Not logged in to VeSync')
         request_model = RequestDeviceListModel(
-            token=self.auth.token, accountID=self.auth.account_id, timeZone=self.time_zone
+            token=self.auth.token,
+            accountID=self.auth.account_id,
+            timeZone=self.time_zone,
+            pageNo=page_no,
+            pageSize=self._device_list_config.page_size,
         )
-        logger.debug('Requesting device list from VeSync')
+        logger.debug('Requesting device list page %s from VeSync', page_no)
         response_dict, _ = await self.async_call_api(
             '/cloud/v1/deviceManaged/devices',
             'post',
             headers=Helpers.req_header_bypass(),
-            json_object=request_model.to_dict(),
+            json_object=request_model,
         )
 
         if response_dict is None:
@@ -338,21 +679,18 @@ class VeSync:  # pylint: disable=function-redefined
 
         response = ResponseDeviceListModel.from_dict(response_dict)
 
-        if response.code == 0:
-            proc_return = self.process_devices(response)
-        else:
+        if response.code != 0:
             error_info = ErrorCodes.get_error_info(response.code)
             if response.msg is not None:
-                error_info.message = f'{error_info.message} ({response.msg})'
+                error_info = replace(
+                    error_info, message=f'{error_info.message} ({response.msg})'
+                )
             if error_info.error_type == ErrorTypes.SERVER_ERROR:
                 raise VeSyncServerError(error_info.message)
             raise VeSyncAPIResponseError(
                 'Error receiving response to device list request'
             )
-
-        self.in_process = False
-
-        return proc_return
+        return response
 
     async def login(self) -> bool:  # pylint: disable=W9006 # pylint mult docstring raises
         """Log into VeSync server.
@@ -369,39 +707,148 @@ class VeSync:  # pylint: disable=function-redefined
             VeSyncServerError: If server returns an error.
         """
         self.enabled = False
-        success = await self._auth.login()
+        with self._tracer.start_as_current_span('VeSync.login') as span:
+            success = await self._auth.login()
+            span.set_attribute('vesync.login_success', success)
         if success:
             self.enabled = True
+            self._auth.start_token_refresh()
         return success
 
-    async def update(self) -> None:
+    async def update(self, *, from_device_list: bool = False) -> None:
         """Fetch updated information about devices and new device list.
 
         Pulls devices list from VeSync and instantiates any new devices. Devices
         are stored in the instance attributes `outlets`, `switches`, `fans`, and
         `bulbs`. The `_device_list` attribute is a dictionary of these attributes.
+
+        Args:
+            from_device_list (bool): Refresh device state from the device list
+                response and only call `get_details()` for devices whose state is
+                not covered by it, by default False to update every device.
+
+        Note:
+            The device list carries the power and connection status of every
+            device, and air quality, mode and fan speed for some purifiers. Wall
+            switches, offline devices and purifiers reporting these fields are
+            refreshed without a request of their own. See
+            `VeSyncBaseDevice.update_from_device_list()`.
         """
         if not self.enabled:
             logger.error('Not logged in to VeSync')
             return
-        await self.get_devices()
+        with self._tracer.start_as_current_span(
+            'VeSync.update', attributes={'vesync.from_device_list': from_device_list}
+        ):
+            if not from_device_list:
+                await self.get_devices()
+                await self.update_all_devices()
+                return
+            response = await self._get_device_list()
+            if response is None:
+                return
+            self.process_devices(response)
+            stale = self._device_container.update_from_device_list(response)
+            logger.debug(
+                '%d of %d devices refreshed from the device list',
+                len(self._device_container) - len(stale),
+                len(self._device_container),
+            )
+            if stale:
+                await self.update_all_devices(devices=stale)
 
-        await self.update_all_devices()
+    async def update_all_devices(
+        self,
+        deadline: float | None = None,
+        *,
+        cancel_pending: bool = False,
+        devices: Iterable[VeSyncBaseDevice] | None = None,
+    ) -> UpdateResult:
+        """Run `get_details()` for each device and update state.
+
+        All devices are updated concurrently. Without a deadline this waits until
+        every update has finished, so one unreachable device can hold back the
+        whole cycle for the full cloud timeout.
 
-    async def update_all_devices(self) -> None:
-        """Run `get_details()` for each device and update state."""
+        Args:
+            deadline (float | None): Seconds to wait for the updates, None to
+                wait for all of them.
+            cancel_pending (bool): Cancel updates still running at the deadline
+                instead of leaving them running in the background.
+            devices (Iterable[VeSyncBaseDevice] | None): Devices to update, None
+                to update every device in `devices`.
+
+        Returns:
+            UpdateResult: Devices that updated, failed, or were still pending at
+                the deadline.
+
+        Note:
+            Updates left running in the background are cancelled when exiting the
+            manager context.
+        """
+        with self._tracer.start_as_current_span('VeSync.update_all_devices') as span:
+            result = await self._run_device_updates(deadline, cancel_pending, devices)
+            span.set_attribute('vesync.devices_updated', len(result.updated))
+            span.set_attribute('vesync.devices_failed', len(result.failed))
+            span.set_attribute('vesync.devices_pending', len(result.pending))
+            return result
+
+    async def _run_device_updates(
+        self,
+        deadline: float | None,
+        cancel_pending: bool,
+        devices: Iterable[VeSyncBaseDevice] | None,
+    ) -> UpdateResult:
+        """Update the devices concurrently, see `update_all_devices()`.
+
+        The update tasks copy the current context, so the device spans are children
+        of the `VeSync.update_all_devices` span.
+        """
         logger.debug('Start updating the device details one by one')
-        if len(self._device_container) == 0:
+        result = UpdateResult()
+        to_update = list(self._device_container if devices is None else devices)
+        if not to_update:
             logger.error('No devices to update')
-            return
-        update_tasks: list[asyncio.Task] = [
-            asyncio.create_task(device.update()) for device in self._device_container
-        ]
-        done, _ = await asyncio.wait(update_tasks, return_when=asyncio.ALL_COMPLETED)
+            return result
+        update_tasks = {
+            asyncio.create_task(device.update()): device for device in to_update
+        }
+        done, pending = await asyncio.wait(
+            update_tasks, timeout=deadline, return_when=asyncio.ALL_COMPLETED
+        )
         for task in done:
-            exc = task.exception()
-            if exc is not None and isinstance(exc, VeSyncError):
+            device = update_tasks[task]
+            exc = asyncio.CancelledError() if task.cancelled() else task.exception()
+            if exc is None:
+                result.updated.append(device)
+                continue
+            result.failed[device] = exc
+            if isinstance(exc, VeSyncError):
                 logger.error('Error updating device: %s', exc)
+        for task in pending:
+            result.pending.append(update_tasks[task])
+            if cancel_pending:
+                task.cancel()
+            else:
+                self._background_updates.add(task)
+                task.add_done_callback(self._finish_background_update)
+        if pending:
+            result.cancelled = cancel_pending
+            if cancel_pending:
+                await asyncio.wait(pending)
+            logger.debug(
+                '%d device updates pending after %s seconds', len(pending), deadline
+            )
+        return result
+
+    def _finish_background_update(self, task: asyncio.Task[None]) -> None:
+        """Log the outcome of an update that outlived its deadline."""
+        self._background_updates.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if isinstance(exc, VeSyncError):
+            logger.error('Error updating device: %s', exc)
 
     async def __aenter__(self) -> Self:
         """Asynchronous context manager enter."""
@@ -409,18 +856,48 @@ class VeSync:  # pylint: disable=function-redefined
 
     async def __aexit__(self, *exec_info: object) -> None:
         """Asynchronous context manager exit."""
+        await self._auth.stop_token_refresh()
+        for task in list(self._background_updates):
+            task.cancel()
         if self.session and self._close_session:
             logger.debug('Closing session, exiting context manager')
             await self.session.close()
             return
         logger.debug('Session not closed, exiting context manager')
 
-    async def _reauthenticate(self) -> bool:
+    async def _reauthenticate(self, generation: int | None = None) -> bool:
         """Re-authenticate using stored username and password.
 
+        Concurrent callers share a single in-flight login instead of each logging
+        in on their own. If the credentials have changed since the failed request
+        was sent, the new token is used without logging in again.
+
+        Args:
+            generation (int | None): `VeSyncAuth.credential_generation` at the time
+                the failed request was sent, None to always log in.
+
         Returns:
             True if re-authentication successful, False otherwise
         """
+        if (
+            generation is not None
+            and generation != self._auth.credential_generation
+            and self._auth.is_authenticated
+        ):
+            return True
+        if self._reauth_task is None:
+            self._reauth_task = asyncio.create_task(self._run_reauthentication())
+            self._reauth_task.add_done_callback(self._clear_reauth_task)
+        # Shield the shared login so a cancelled caller does not cancel it for all
+        return await asyncio.shield(self._reauth_task)
+
+    def _clear_reauth_task(self, task: asyncio.Task[bool]) -> None:
+        """Forget the finished re-authentication task."""
+        if self._reauth_task is task:
+            self._reauth_task = None
+
+    async def _run_reauthentication(self) -> bool:
+        """Log in again, counting consecutive failed attempts."""
         self.enabled = False
         self._api_attempts += 1
         if self._api_attempts >= MAX_API_REAUTH_RETRIES:
@@ -433,6 +910,23 @@ class VeSync:  # pylint: disable=function-redefined
             return True
         return await self.auth.reauthenticate()
 
+    def _replace_credentials(
+        self, request_body: RequestBody | None, headers: dict | None
+    ) -> tuple[RequestBody | None, dict | None]:
+        """Return copies of a request body and headers with the current token."""
+        if request_body is not None:
+            request_body = request_body.replace(
+                token=self.token, accountID=self.account_id
+            )
+        if headers is not None:
+            headers = headers.copy()
+            for key in headers:
+                if key.lower() == 'tk':
+                    headers[key] = self.token
+                elif key.lower() == 'accountid':
+                    headers[key] = self.account_id
+        return request_body, headers
+
     async def async_call_api(
         self,
         api: str,
@@ -444,7 +938,15 @@ class VeSync:  # pylint: disable=function-redefined
         """Make API calls by passing endpoint, header and body.
 
         api argument is appended to `API_BASE_URL`.
-        Raises VeSyncRateLimitError if API returns a rate limit error.
+        Raises VeSyncRateLimitError if API returns a rate limit error or an HTTP
+        429 status. Each call
+        waits for a token from the manager's `AdaptiveRateLimiter` and a slot from
+        the `RequestScheduler`, the slot is released as soon as the response body
+        has been read. Rate limited requests are retried with jittered exponential
+        backoff up to `RateLimitConfig.max_retries` times. Requests that fail with
+        a token error wait for a single shared re-authentication and are replayed
+        once with the new token. Requests to a base URL or device whose circuit
+        breaker is open fail immediately with `VeSyncCircuitOpenError`.
 
         Args:
             api (str): Endpoint to call with `API_BASE_URL`.
@@ -459,9 +961,10 @@ class VeSync:  # pylint: disable=function-redefined
 
         Raises:
             VeSyncAPIStatusCodeError: If API returns an error status code.
-            VeSyncRateLimitError: If API returns a rate limit error.
+            VeSyncRateLimitError: If API returns a rate limit error or HTTP 429.
             VeSyncServerError: If API returns a server error.
             VeSyncTokenError: If API returns an authentication error.
+            VeSyncCircuitOpenError: If the circuit breaker rejects the request.
             ClientResponseError: If API returns a client response error.
 
         Note:
@@ -469,72 +972,273 @@ class VeSync:  # pylint: disable=function-redefined
             instead of dictionary.
         """
         self.check_debug()
-        if self.session is None:
-            self.session = ClientSession()
+        if self._transport is None and self.session is None:
+            self.session = ClientSession(
+                connector=self._transport_config.build_connector(),
+                timeout=self._request_timeout,
+                trace_configs=[timing_trace_config()],
+            )
             self._close_session = True
-        response = None
-        status_code = None
-        if isinstance(json_object, DataClassORJSONMixin):
-            req_dict = json_object.to_dict()
-        elif isinstance(json_object, dict):
-            req_dict = json_object
-        else:
-            req_dict = None
-        try:
-            async with self.session.request(
-                method,
-                url=self._api_base_url_for_current_region() + api,
-                json=req_dict,
+        request_body = (
+            RequestBody(json_object)
+            if isinstance(json_object, (DataClassORJSONMixin, dict))
+            else None
+        )
+        cid = self._request_cid(request_body, device)
+        with self._tracer.start_as_current_span(
+            'VeSync.async_call_api',
+            attributes=self._api_span_attributes(api, method, request_body, cid, device),
+        ) as span:
+            call = _ApiCall(
+                api=api,
+                method=method,
+                request_body=request_body,
                 headers=headers,
-                raise_for_status=False,
-            ) as response:
-                resp_bytes = await response.read()
-                resp_status = response.status
-
-                if resp_status != STATUS_OK:
-                    LibraryLogger.log_api_status_error(logger, response=response)
-                    raise VeSyncAPIStatusCodeError(str(resp_status))
-
-                LibraryLogger.log_api_call(
-                    logger,
-                    response=response,
-                    response_body=resp_bytes,
-                    request_headers=headers,
-                    request_body=req_dict,
-                )
-                resp_dict, status_code = await self._api_response_wrapper(
-                    resp_bytes, resp_status, api, req_dict, device=device
+                device=device,
+                cid=cid,
+                metric_key=self._metric_key(api, request_body, cid, device),
+                span=span,
+            )
+            attempt = 0
+            while (result := await self._send_or_retry(call, attempt)) is None:
+                delay = self._rate_limiter.backoff_delay(attempt)
+                attempt += 1
+                span.set_attribute('vesync.retries', attempt)
+                self._metrics.record_retry(call.metric_key)
+                logger.debug(
+                    'Rate limited on %s, retry %s in %.2f seconds', api, attempt, delay
                 )
+                await asyncio.sleep(delay)
+            return result
+
+    async def _send_or_retry(
+        self, call: _ApiCall, attempt: int
+    ) -> tuple[dict | None, int] | None:
+        """Send the request, return None if it was rate limited and can be retried.
 
+        Raises:
+            VeSyncRateLimitError: If the request was rate limited and
+                `RateLimitConfig.max_retries` retries have been made.
+        """
+        try:
+            return await self._send_api_request(call)
+        except VeSyncRateLimitError:
+            if attempt >= self._rate_limiter.config.max_retries:
+                raise
+        return None
+
+    def _api_span_attributes(
+        self,
+        api: str,
+        method: str,
+        request_body: RequestBody | None,
+        cid: str | None,
+        device: VeSyncBaseDevice | None,
+    ) -> dict[str, AttributeValue] | None:
+        """Return the attributes of an API call span, None without a tracer."""
+        if self._tracer is NOOP_TRACER:
+            return None
+        if device is None and cid:
+            device = self._device_container.get_by_cid(cid)
+        attributes = device_attributes(device) if device is not None else {}
+        attributes.update(
+            span_attributes(
+                {
+                    ATTR_ENDPOINT: api,
+                    ATTR_HTTP_METHOD: method.upper(),
+                    ATTR_PAYLOAD_METHOD: payload_method(request_body),
+                    ATTR_CID: cid,
+                }
+            )
+        )
+        return attributes
+
+    async def _send_api_request(
+        self, call: _ApiCall, *, replay: bool = False
+    ) -> tuple[dict | None, int]:
+        """Send a single request and replay it once on a token error."""
+        base_url = self._api_base_url_for_current_region()
+        breakers = self._circuit_breakers.acquire(*self._circuit_keys(base_url, call.cid))
+        self._metrics.start(call.metric_key.family)
+        generation = self._auth.credential_generation
+        outcome: BaseException | None = None
+        failure: BaseException | None = None
+        response: TransportResponse | None = None
+        resp_dict = None
+        start = time.monotonic()
+        try:
+            response = await self._fetch_response(
+                base_url, call.api, call.method, call.request_body, call.headers
+            )
+            resp_dict = LibraryLogger.try_json_loads(response.body)
+            LibraryLogger.log_api_call(
+                logger,
+                response=response,
+                response_body=response.body if resp_dict is None else resp_dict,
+                request_headers=call.headers,
+                request_body=call.request_body,
+                device=call.device,
+            )
+            resp_dict, status = self._api_response_wrapper(resp_dict, response.status)
+            return resp_dict, status  # noqa: TRY300
+        except VeSyncTokenError as exc:
+            token_error = exc
+            failure = exc
+        except BaseException as exc:
+            outcome = failure = exc
+            raise
+        finally:
+            self._circuit_breakers.record(breakers, outcome)
+            self._record_exchange(
+                call,
+                response,
+                resp_dict if isinstance(resp_dict, dict) else None,
+                time.monotonic() - start,
+                failure,
+            )
+        # Replay once with fresh credentials after the shared re-authentication,
+        # login requests are never replayed since re-authentication awaits them
+        if replay or LOGIN_REQUEST.get() or not await self._reauthenticate(generation):
+            self.enabled = False
+            raise token_error
+        call.request_body, call.headers = self._replace_credentials(
+            call.request_body, call.headers
+        )
+        return await self._send_api_request(call, replay=True)
+
+    async def _fetch_response(
+        self,
+        base_url: str,
+        api: str,
+        method: str,
+        request_body: RequestBody | None,
+        headers: dict | None,
+    ) -> TransportResponse:
+        """Read the raw response through the rate limiter and scheduler.
+
+        The body is sent as serialized bytes, its dictionary is only built for
+        logging.
+        """
+        transport = self._transport
+        if transport is None:
+            if self.session is None:
+                raise VeSyncAPIResponseError('No client session available')
+            transport = AiohttpTransport(self.session, self._request_timeout)
+        await self._rate_limiter.acquire()
+        family = endpoint_family(api)
+        await self._scheduler.acquire(family)
+        try:
+            response = await transport.request(
+                method,
+                base_url + api,
+                data=request_body.content if request_body is not None else None,
+                headers=headers,
+            )
         except ClientResponseError as e:
-            LibraryLogger.log_api_exception(logger, exception=e, request_body=req_dict)
+            LibraryLogger.log_api_exception(
+                logger,
+                exception=e,
+                request_body=request_body.to_dict() if request_body else None,
+            )
             raise
-        return resp_dict, status_code
+        finally:
+            self._scheduler.release(family)
+
+        if response.timing is not None:
+            self._request_timing.record(response.timing)
+        if response.status != STATUS_OK:
+            LibraryLogger.log_api_status_error(logger, response=response)
+            if response.status == STATUS_TOO_MANY_REQUESTS:
+                self._rate_limiter.on_throttle()
+                raise VeSyncRateLimitError
+            raise VeSyncAPIStatusCodeError(str(response.status))
+        return response
+
+    def _record_exchange(
+        self,
+        call: _ApiCall,
+        response: TransportResponse | None,
+        resp_dict: dict | None,
+        latency: float,
+        failure: BaseException | None,
+    ) -> None:
+        """Record a finished request in the metrics, exchange log and span."""
+        response_info = (
+            ResponseEnvelope.wrap(resp_dict).error_info if resp_dict is not None else None
+        )
+        if response is not None:
+            call.span.set_attribute(ATTR_HTTP_STATUS, response.status)
+        set_result_code(call.span, response_info)
+        self._metrics.finish(
+            call.metric_key, latency, error_type_of(failure, response_info)
+        )
+        self._exchange_log.record(
+            call.api,
+            call.request_body,
+            call.cid,
+            response.status if response is not None else None,
+            resp_dict,
+            latency,
+            failure,
+            timing=response.timing if response is not None else None,
+        )
 
-    async def _api_response_wrapper(
+    def _metric_key(
         self,
-        response_bytes: bytes | None,
-        status_code: int,
-        endpoint: str,
-        request_body: dict | None,
-        device: VeSyncBaseDevice | None = None,
+        api: str,
+        request_body: RequestBody | None,
+        cid: str | None,
+        device: VeSyncBaseDevice | None,
+    ) -> MetricKey:
+        """Return the metrics key of a request."""
+        if device is None and cid:
+            device = self._device_container.get_by_cid(cid)
+        return MetricKey(
+            str(endpoint_family(api)),
+            payload_method(request_body) or '',
+            device.product_type if device is not None else '',
+        )
+
+    @staticmethod
+    def _request_cid(
+        request_body: RequestBody | None, device: VeSyncBaseDevice | None
+    ) -> str | None:
+        """Return the cid of the device a request is made for, if any."""
+        if device is not None:
+            return device.cid
+        if request_body is not None:
+            return request_body.get('cid')
+        return None
+
+    @staticmethod
+    def _circuit_keys(base_url: str, cid: str | None) -> tuple[str, ...]:
+        """Return the circuit breaker keys of a request."""
+        if cid:
+            return url_key(base_url), device_key(cid)
+        return (url_key(base_url),)
+
+    def _api_response_wrapper(
+        self, resp_dict: object, status_code: int
     ) -> tuple[dict | None, int]:
-        """Internal wrapper used by async_call_api."""
-        resp_dict = LibraryLogger.try_json_loads(response_bytes)
+        """Internal wrapper used by async_call_api.
+
+        The decoded body is wrapped in a `ResponseEnvelope`, which is returned as
+        the response dictionary and keeps the parsed error information.
+        """
         if not isinstance(resp_dict, dict):
             return None, status_code
 
-        error_info = Helpers.parse_error_code(resp_dict)
+        envelope = ResponseEnvelope(resp_dict)
+        error_info = envelope.error_info
+        if error_info.error_type == ErrorTypes.RATE_LIMIT:
+            self._rate_limiter.on_throttle()
+        else:
+            self._rate_limiter.on_success()
         if error_info.error_type == ErrorTypes.TOKEN_ERROR:
-            self.enabled = False
-            if await self._reauthenticate():
-                return await self.async_call_api(
-                    endpoint, 'post', request_body, device=device
-                )
             raise VeSyncTokenError(error_info.message)
         raise_api_errors(error_info)
 
-        return resp_dict, status_code
+        return envelope, status_code
 
     def _api_base_url_for_current_region(self) -> str:
         """Retrieve the API base url for the current region.
@@ -543,8 +1247,11 @@ class VeSync:  # pylint: disable=function-redefined
         (for all EU countries), and one for all others
         (currently `US`, `CA`, `MX`, `JP` - also used as a fallback).
 
-        If `API_BASE_URL` is set, it will take precedence over the determined URL.
+        If `TransportConfig.base_url` is set, it will take precedence over the
+        determined URL.
         """
+        if self._transport_config.base_url is not None:
+            return self._transport_config.base_url
         return REGION_API_MAP[self.current_region]
 
     def _update_fw_version(self, info_list: list[FirmwareDeviceItemModel]) -> bool:
@@ -611,7 +1318,9 @@ class VeSync:  # pylint: disable=function-redefined
             error_info = ErrorCodes.get_error_info(resp_model.code)
             resp_message = resp_model.msg
             if resp_message is not None:
-                error_info.message = f'{error_info.message} ({resp_message})'
+                error_info = replace(
+                    error_info, message=f'{error_info.message} ({resp_message})'
+                )
             logger.warning('Error in firmware update response: %s', error_info.message)
             return False
         info_list = resp_model.result.cidFwInfoList
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import fields
+from dataclasses import fields, replace
 from typing import TYPE_CHECKING
 
 from pyvesync.models.home_models import (
@@ -109,7 +109,7 @@ class VeSyncHome:
         if resp_model.code != 0:
             error = ErrorCodes.get_error_info(resp_model.code)
             if resp_model.msg is not None:
-                error.message = f'{resp_model.msg} ({error.message})'
+                error = replace(error, message=f'{resp_model.msg} ({error.message})')
 
             msg = f'Failed to get home list with error: {error.to_json()}'
             raise VeSyncAPIResponseError(msg)
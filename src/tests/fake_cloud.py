@@ -0,0 +1,370 @@
+"""In-process fake of the VeSync cloud API.
+
+`FakeVeSyncCloud` answers the requests pyvesync makes for login, the device list,
+bypassV1, bypassV2, legacy and energy endpoints. Requests are matched against the
+recorded API calls in the `api/` YAML fixtures and answered with the responses in
+the `call_json_*` modules, so any device type with a fixture can be simulated.
+Each device type is copied `copies` times with a unique cid and uuid, which allows
+load tests with thousands of simulated devices.
+
+The fake can be used in two ways:
+
+1. As a `pyvesync.utils.transport.Transport`, requests are answered in-process:
+
+    ```python
+    cloud = FakeVeSyncCloud(FakeCloudConfig(copies=100))
+    manager = VeSync('EMAIL', 'PASSWORD', transport=cloud)
+    ```
+
+2. As an aiohttp web server on localhost:
+
+    ```python
+    async with FakeVeSyncCloud(FakeCloudConfig(latency=0.05)) as cloud:
+        manager = VeSync(
+            'EMAIL',
+            'PASSWORD',
+            transport_config=TransportConfig(base_url=cloud.base_url),
+        )
+    ```
+
+Latency and error injection are set with `FakeCloudConfig`.
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+import random
+from collections import Counter
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import orjson
+import yaml
+from aiohttp import web
+from yarl import URL
+
+from pyvesync.utils.transport import TransportResponse
+import call_json
+import call_json_bulbs
+import call_json_fans
+import call_json_humidifiers
+import call_json_outlets
+import call_json_purifiers
+import call_json_switches
+
+API_DIR = Path(__file__).parent / 'api'
+
+RESPONSE_MODULES: dict[str, ModuleType] = {
+    'vesyncbulb': call_json_bulbs,
+    'vesyncfan': call_json_fans,
+    'vesynchumidifier': call_json_humidifiers,
+    'vesyncoutlet': call_json_outlets,
+    'vesyncpurifier': call_json_purifiers,
+    'vesyncswitch': call_json_switches,
+}
+"""YAML fixture directory and the call_json module with its responses."""
+
+LOGIN_RESPONSES = {
+    '/globalPlatform/api/accountAuth/v1/authByPWDOrOTM': (
+        call_json.LoginResponses.GET_TOKEN_RESPONSE_SUCCESS
+    ),
+    '/user/api/accountManage/v1/loginByAuthorizeCode4Vesync': (
+        call_json.LoginResponses.LOGIN_RESPONSE_SUCCESS
+    ),
+}
+DEVICE_LIST_PATH = '/cloud/v1/deviceManaged/devices'
+METHOD_NOT_FOUND = call_json.response_body(-11004000, 'Method not found')
+
+
+@dataclass(kw_only=True)
+class FakeCloudConfig:
+    """Settings for the fake cloud.
+
+    Attributes:
+        copies (int): Number of simulated devices for each device type.
+        latency (float): Seconds added to every response.
+        latency_jitter (float): Random extra seconds, up to this value, added to
+            every response.
+        error_rate (float): Fraction of requests answered with `error_status`.
+        error_status (int): HTTP status code of injected errors.
+        seed (int | None): Seed for latency jitter and error injection.
+    """
+
+    copies: int = 1
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    seed: int | None = None
+
+
+@dataclass
+class SimulatedDevice:
+    """A simulated device and the fixture it is based on."""
+
+    setup_entry: str
+    module: str
+    cid: str
+    uuid: str
+    template_cid: str
+    template_uuid: str
+    list_item: dict[str, Any]
+
+
+def request_method(body: dict | None) -> str | None:
+    """Return the payload method of a request body, or the outer method."""
+    if not body:
+        return None
+    payload = body.get('payload')
+    if isinstance(payload, dict) and 'method' in payload:
+        return payload['method']
+    return body.get('method')
+
+
+@cache
+def load_fixture_index() -> dict[str, dict[tuple[str, str | None], str]]:
+    """Index the YAML fixtures by device type, request path and method.
+
+    Returns:
+        dict: `{setup_entry: {(url, method): fixture method name}}`.
+    """
+    index: dict[str, dict[tuple[str, str | None], str]] = {}
+    for module in RESPONSE_MODULES:
+        for file in sorted((API_DIR / module).glob('*.yaml')):
+            calls = yaml.safe_load(file.read_text(encoding='utf-8')) or {}
+            routes: dict[tuple[str, str | None], str] = {}
+            for name, call in calls.items():
+                key = (call['url'], request_method(call.get('json_object')))
+                # Prefer the details call when several methods share a request
+                if key not in routes or name == 'update':
+                    routes[key] = name
+            index[file.stem] = routes
+    return index
+
+
+class FakeVeSyncCloud:
+    """Fake VeSync cloud serving responses from the test fixtures.
+
+    Args:
+        config (FakeCloudConfig | None): Fake cloud settings.
+    """
+
+    def __init__(self, config: FakeCloudConfig | None = None) -> None:
+        """Build the simulated devices from the fixtures."""
+        self.config = config or FakeCloudConfig()
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(self.config.seed)  # noqa: S311
+        self._routes = load_fixture_index()
+        self._devices: dict[str, SimulatedDevice] = {}
+        self.device_list: list[dict[str, Any]] = []
+        for setup_entry in self._routes:
+            for copy_no in range(self.config.copies):
+                self._add_device(setup_entry, copy_no)
+        self._runner: web.AppRunner | None = None
+        self.base_url: str | None = None
+
+    def _add_device(self, setup_entry: str, copy_no: int) -> None:
+        """Add a simulated copy of a device type."""
+        item = copy.deepcopy(
+            call_json.DeviceList.device_list_item(
+                call_json.ALL_DEVICE_MAP_DICT[setup_entry]
+            )
+        )
+        suffix = f'-{copy_no}'
+        template_cid, template_uuid = item['cid'], item['uuid']
+        item['cid'] = template_cid + suffix
+        item['uuid'] = template_uuid + suffix
+        item['macID'] = f"{item['macID']}{suffix}"
+        item['deviceName'] = f"{item['deviceName']}{suffix}"
+        module = next(
+            name
+            for name in RESPONSE_MODULES
+            if (API_DIR / name / f'{setup_entry}.yaml').exists()
+        )
+        device = SimulatedDevice(
+            setup_entry=setup_entry,
+            module=module,
+            cid=item['cid'],
+            uuid=item['uuid'],
+            template_cid=template_cid,
+            template_uuid=template_uuid,
+            list_item=item,
+        )
+        self._devices[device.cid] = device
+        self._devices[device.uuid] = device
+        self.device_list.append(item)
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests received."""
+        return self.requests.total()
+
+    def _find_device(self, path: str, body: dict | None) -> SimulatedDevice | None:
+        """Find the simulated device a request is for."""
+        if body:
+            for key in ('cid', 'uuid'):
+                device = self._devices.get(body.get(key) or '')
+                if device is not None:
+                    return device
+        for segment in path.split('/'):
+            device = self._devices.get(segment)
+            if device is not None:
+                return device
+        return None
+
+    def _device_list(self, body: dict | None) -> dict:
+        """Return a page of the simulated device list."""
+        body = body or {}
+        page_no = int(body.get('pageNo', 1))
+        page_size = int(body.get('pageSize', 100))
+        start = (page_no - 1) * page_size
+        response = copy.deepcopy(call_json.DeviceList.list_response_base)
+        response['result'].update(
+            pageNo=page_no,
+            pageSize=page_size,
+            total=len(self.device_list),
+            list=self.device_list[start : start + page_size],
+        )
+        return response
+
+    def _device_response(self, device: SimulatedDevice, name: str) -> dict:
+        """Return the fixture response for a device method."""
+        responses = RESPONSE_MODULES[device.module]
+        if name == 'update':
+            response = responses.DETAILS_RESPONSES[device.setup_entry]
+        else:
+            response = responses.METHOD_RESPONSES[device.setup_entry][name]
+        if callable(response):
+            response = response()
+        if isinstance(response, tuple):
+            response = response[0]
+        if response is None:
+            return call_json.response_body(0, 'Success')
+        return copy.deepcopy(response)
+
+    def respond(self, path: str, body: dict | None) -> dict:
+        """Return the response body for a request.
+
+        Args:
+            path (str): Request path without the host.
+            body (dict | None): JSON request body.
+        """
+        self.requests[path] += 1
+        if path in LOGIN_RESPONSES:
+            return copy.deepcopy(LOGIN_RESPONSES[path])
+        if path == DEVICE_LIST_PATH:
+            return self._device_list(body)
+        device = self._find_device(path, body)
+        if device is None:
+            return METHOD_NOT_FOUND
+        template_path = path.replace(device.cid, device.template_cid).replace(
+            device.uuid, device.template_uuid
+        )
+        name = self._routes[device.setup_entry].get(
+            (template_path, request_method(body))
+        )
+        if name is None:
+            return METHOD_NOT_FOUND
+        return self._device_response(device, name)
+
+    async def _delay(self) -> None:
+        """Wait for the configured latency."""
+        delay = self.config.latency
+        if self.config.latency_jitter:
+            delay += self._random.uniform(0, self.config.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _inject_error(self) -> bool:
+        """Return True if the request should fail."""
+        return (
+            self.config.error_rate > 0
+            and self._random.random() < self.config.error_rate
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: dict | None = None,
+        data: bytes | None = None,
+        headers: dict | None = None,
+    ) -> TransportResponse:
+        """Answer a request in-process, implementing the `Transport` protocol."""
+        if data:
+            json = orjson.loads(data)
+        request_url = URL(url)
+        await self._delay()
+        if self._inject_error():
+            self.requests[request_url.path] += 1
+            return TransportResponse(
+                status=self.config.error_status,
+                body=b'',
+                url=request_url,
+                method=method.upper(),
+            )
+        response = self.respond(request_url.path, json)
+        return TransportResponse(
+            status=200,
+            body=orjson.dumps(response),
+            url=request_url,
+            method=method.upper(),
+            headers={'Content-Type': 'application/json'},
+        )
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer a request to the web server."""
+        await self._delay()
+        if self._inject_error():
+            self.requests[request.path] += 1
+            return web.Response(status=self.config.error_status)
+        body = await request.read()
+        json_body = orjson.loads(body) if body else None
+        return web.Response(
+            body=orjson.dumps(self.respond(request.path, json_body)),
+            content_type='application/json',
+        )
+
+    def build_app(self) -> web.Application:
+        """Return the aiohttp web application of the fake cloud."""
+        app = web.Application()
+        app.router.add_route('*', '/{path:.*}', self._handle)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Serve the fake cloud on localhost.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 to pick a free port.
+
+        Returns:
+            str: Base URL of the server, e.g. `http://127.0.0.1:8080`.
+        """
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # type: ignore[union-attr]  # noqa: SLF001
+        bound_port = sockets[0].getsockname()[1]
+        self.base_url = f'http://{host}:{bound_port}'
+        return self.base_url
+
+    async def close(self) -> None:
+        """Stop the web server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> FakeVeSyncCloud:
+        """Start the web server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the web server."""
+        await self.close()
@@ -0,0 +1,159 @@
+"""Test circuit breakers for API base URLs and devices."""
+import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.const import API_BASE_URL_US
+from pyvesync.utils.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    CircuitState,
+    device_key,
+    url_key,
+)
+from pyvesync.utils.errors import (
+    VeSyncAPIStatusCodeError,
+    VeSyncCircuitOpenError,
+    VeSyncServerError,
+)
+import call_json
+from aiohttp_mocker import AiohttpMockSession
+from defaults import TestDefaults
+
+URL_KEY = url_key(API_BASE_URL_US)
+
+
+def mock_response(status: int, response: dict | None = None) -> AiohttpMockSession:
+    """Return a mock response for the default endpoint."""
+    return AiohttpMockSession(
+        method='post',
+        url=API_BASE_URL_US + '/endpoint',
+        status=status,
+        response=orjson.dumps(response) if response is not None else None,
+    )
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_open_half_open_close(self):
+        """Test a circuit opens on failures and closes after a successful trial."""
+        registry = CircuitBreakerRegistry(
+            CircuitBreakerConfig(failure_threshold=2, recovery_timeout=0)
+        )
+        events = []
+        registry.add_listener(events.append)
+        breakers = registry.acquire('key')
+        registry.record(breakers, VeSyncServerError('error'))
+        assert registry.state('key') == CircuitState.CLOSED
+        registry.record(registry.acquire('key'), VeSyncServerError('error'))
+        assert registry.state('key') == CircuitState.OPEN
+
+        trial = registry.acquire('key')
+        assert registry.state('key') == CircuitState.HALF_OPEN
+        with pytest.raises(VeSyncCircuitOpenError):
+            registry.acquire('key')
+        registry.record(trial, None)
+        assert registry.state('key') == CircuitState.CLOSED
+        assert [(e.previous_state, e.state) for e in events] == [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+
+    def test_failed_trial_reopens(self):
+        """Test a failed half-open trial opens the circuit again."""
+        registry = CircuitBreakerRegistry(
+            CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0)
+        )
+        registry.record(registry.acquire('key'), TimeoutError())
+        registry.record(registry.acquire('key'), VeSyncAPIStatusCodeError('503'))
+        assert registry.state('key') == CircuitState.OPEN
+
+    def test_open_rejects_until_timeout(self):
+        """Test an open circuit fails fast with the time left."""
+        registry = CircuitBreakerRegistry(
+            CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60)
+        )
+        registry.record(registry.acquire('other', 'key'), TimeoutError())
+        with pytest.raises(VeSyncCircuitOpenError) as exc_info:
+            registry.acquire('key')
+        assert exc_info.value.key == 'key'
+        assert 0 < exc_info.value.retry_after <= 60
+
+    def test_non_failures(self):
+        """Test client errors and cancellations do not open circuits."""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=1))
+        registry.record(registry.acquire('key'), VeSyncAPIStatusCodeError('404'))
+        registry.record(registry.acquire('key'), asyncio.CancelledError())
+        assert registry.state('key') == CircuitState.CLOSED
+
+    def test_disabled(self):
+        """Test no breakers are used when the threshold is None."""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=None))
+        assert registry.enabled is False
+        assert registry.acquire('key') == []
+
+
+class TestCircuitBreakerManager:
+    """Test the manager fails fast on open circuits."""
+
+    def build_manager(self) -> VeSync:
+        """Return a logged in manager that opens circuits after two failures."""
+        manager = VeSync(
+            'EMAIL',
+            'PASSWORD',
+            circuit_breaker_config=CircuitBreakerConfig(failure_threshold=2),
+        )
+        manager.enabled = True
+        manager.auth._token = TestDefaults.token
+        manager.auth._account_id = TestDefaults.account_id
+        return manager
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_url_circuit(self, mock):
+        """Test server errors open the base URL circuit."""
+        mock.return_value.request.side_effect = [
+            mock_response(500),
+            mock_response(200, call_json.response_body(-11102000, 'Internal error')),
+        ]
+        manager = self.build_manager()
+
+        async def run():
+            with pytest.raises(VeSyncAPIStatusCodeError):
+                await manager.async_call_api('/endpoint', 'post')
+            with pytest.raises(VeSyncServerError):
+                await manager.async_call_api('/endpoint', 'post')
+            with pytest.raises(VeSyncCircuitOpenError):
+                await manager.async_call_api('/endpoint', 'post')
+
+        asyncio.run(run())
+        assert mock.return_value.request.call_count == 2
+        assert manager.circuit_breakers.state(URL_KEY) == CircuitState.OPEN
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_device_circuit(self, mock):
+        """Test device circuits are keyed on the request cid."""
+        mock.return_value.request.side_effect = [
+            mock_response(502),
+            mock_response(200, call_json.response_body(0, 'Success')),
+            mock_response(502),
+            mock_response(200, call_json.response_body(0, 'Success')),
+        ]
+        manager = self.build_manager()
+        body = {'cid': 'CID1'}
+
+        async def run():
+            for _ in range(2):
+                with pytest.raises(VeSyncAPIStatusCodeError):
+                    await manager.async_call_api('/endpoint', 'post', body)
+                await manager.async_call_api('/endpoint', 'post', {'cid': 'CID2'})
+            with pytest.raises(VeSyncCircuitOpenError):
+                await manager.async_call_api('/endpoint', 'post', body)
+
+        asyncio.run(run())
+        assert manager.circuit_breakers.state(device_key('CID1')) == CircuitState.OPEN
+        assert manager.circuit_breakers.state(URL_KEY) == CircuitState.CLOSED
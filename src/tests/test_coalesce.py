@@ -0,0 +1,141 @@
+"""Test coalescing of identical in-flight device reads."""
+import asyncio
+
+import pytest
+
+from pyvesync.utils.coalesce import RequestCoalescer, is_read_method, request_key
+import call_json_purifiers
+from base_test_cases import TestBase
+
+
+@pytest.mark.parametrize(
+    'method, expected',
+    [
+        ('getPurifierStatus', True),
+        ('getHumidifierStatus', True),
+        ('deviceDetail', True),
+        ('setSwitch', False),
+        ('bypass', False),
+    ],
+)
+def test_is_read_method(method, expected):
+    """Test read methods are detected by name."""
+    assert is_read_method(method) is expected
+
+
+def test_request_key():
+    """Test keys are equal for equal data regardless of key order."""
+    assert request_key('CID', 0, data={'a': 1, 'b': 2}) == request_key(
+        'CID', 0, data={'b': 2, 'a': 1}
+    )
+    assert request_key('CID', 0) != request_key('CID', 1)
+
+
+class TestRequestCoalescer:
+    """Test RequestCoalescer sharing and releasing calls."""
+
+    def test_shared_result(self):
+        """Test concurrent callers with the same key share one call."""
+        calls = []
+
+        async def read():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {'code': 0}
+
+        async def run():
+            coalescer = RequestCoalescer()
+            results = await asyncio.gather(
+                *(coalescer.run('key', read) for _ in range(3)),
+                coalescer.run('other', read),
+            )
+            assert coalescer.in_flight == 0
+            await coalescer.run('key', read)
+            return coalescer, results
+
+        coalescer, results = asyncio.run(run())
+        assert len(calls) == 3
+        assert results[0] is results[1] is results[2]
+        assert coalescer.coalesced_count == 2
+
+    def test_shared_exception(self):
+        """Test an exception is raised to every caller and the key is released."""
+
+        async def read():
+            await asyncio.sleep(0)
+            raise ValueError
+
+        async def run():
+            coalescer = RequestCoalescer()
+            results = await asyncio.gather(
+                coalescer.run('key', read),
+                coalescer.run('key', read),
+                return_exceptions=True,
+            )
+            assert coalescer.in_flight == 0
+            return results
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_cancel_waiters(self):
+        """Test the shared call is only cancelled once every caller is cancelled."""
+        started = []
+
+        async def read():
+            started.append(1)
+            await asyncio.sleep(10)
+
+        async def run():
+            coalescer = RequestCoalescer()
+            first = asyncio.ensure_future(coalescer.run('key', read))
+            second = asyncio.ensure_future(coalescer.run('key', read))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            assert coalescer.in_flight == 1
+            second.cancel()
+            await asyncio.gather(first, second, return_exceptions=True)
+            await asyncio.sleep(0)
+            return coalescer
+
+        coalescer = asyncio.run(run())
+        assert coalescer.in_flight == 0
+        assert len(started) == 1
+
+
+class TestDeviceCoalescing(TestBase):
+    """Test device updates and bypass reads are coalesced."""
+
+    async def slow_response(self, *args, **kwargs):
+        """Return the purifier details response after yielding."""
+        await asyncio.sleep(0)
+        return call_json_purifiers.DETAILS_RESPONSES['Core300S'], 200
+
+    def test_concurrent_update(self):
+        """Test overlapping updates of a device send one request."""
+        self.mock_api.side_effect = self.slow_response
+        purifier = self.get_device('air_purifiers', 'Core300S')
+
+        async def run():
+            await asyncio.gather(purifier.update(), purifier.update())
+
+        self.loop.run_until_complete(run())
+        assert self.mock_api.call_count == 1
+        assert self.manager.coalescer.coalesced_count == 1
+
+    def test_concurrent_bypass_reads(self):
+        """Test identical reads are shared and writes are always sent."""
+        self.mock_api.side_effect = self.slow_response
+        purifier = self.get_device('air_purifiers', 'Core300S')
+
+        async def run():
+            await asyncio.gather(
+                purifier.call_bypassv2_api('getPurifierStatus'),
+                purifier.call_bypassv2_api('getPurifierStatus'),
+                purifier.call_bypassv2_api('setSwitch', {'enabled': True}),
+                purifier.call_bypassv2_api('setSwitch', {'enabled': True}),
+            )
+
+        self.loop.run_until_complete(run())
+        assert self.mock_api.call_count == 3
@@ -0,0 +1,147 @@
+"""Test the DeviceContainer indexes, views and reconciliation."""
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.device_container import DeviceContainer, DeviceEventType
+from pyvesync.models.vesync_models import (
+    ResponseDeviceDetailsModel,
+    ResponseDeviceListModel,
+)
+from call_json import ALL_DEVICE_MAP_DICT, DeviceList
+from defaults import TestDefaults
+
+
+def device_model(setup_entry: str, **kwargs) -> ResponseDeviceDetailsModel:
+    """Return the device list entry for a setup entry."""
+    details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT[setup_entry])
+    details.update(kwargs)
+    return ResponseDeviceDetailsModel.from_dict(details)
+
+
+class ContainerFixture:
+    """Container with an outlet and two purifiers."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Build a container with an outlet and two purifiers."""
+        self.manager = VeSync(TestDefaults.email, TestDefaults.password)
+        self.container = DeviceContainer()
+        for setup_entry in ('ESW15-USA', 'Core300S', 'Core400S'):
+            self.container.add_device_from_model(device_model(setup_entry), self.manager)
+
+
+class TestDeviceContainer(ContainerFixture):
+    """Test lookups stay in sync with the container contents."""
+
+    def test_lookups(self):
+        """Test lookups by cid and name."""
+        cid = TestDefaults.cid('Core300S')
+        device = self.container.get_by_cid(cid)
+        assert device is not None
+        assert device.cid == cid
+        assert self.container.device_exists(cid)
+        assert not self.container.device_exists(cid, 1)
+        assert self.container.get_by_name(TestDefaults.name('Core300S')) is device
+        assert self.container.get_by_name('core300sname', fuzzy=True) is device
+        assert self.container.get_by_name('core300sname') is None
+
+    def test_views(self):
+        """Test product type views are live and read-only."""
+        purifiers = self.container.air_purifiers
+        assert len(purifiers) == 2
+        assert len(self.container.outlets) == 1
+        assert not hasattr(purifiers, 'append')
+        assert self.container.remove_by_cid(TestDefaults.cid('Core400S'))
+        assert len(purifiers) == 1
+        assert purifiers == [self.container.get_by_cid(TestDefaults.cid('Core300S'))]
+        self.container.clear()
+        assert len(purifiers) == 0
+        assert self.container.get_by_cid(TestDefaults.cid('Core300S')) is None
+
+    def test_discard(self):
+        """Test discarding a device removes it from every index."""
+        device = self.container.get_by_cid(TestDefaults.cid('ESW15-USA'))
+        self.container.discard(device)
+        self.container.discard(device)
+        assert device not in self.container
+        assert len(self.container.outlets) == 0
+        assert self.container.get_by_name(device.device_name) is None
+        assert not self.container.remove_by_cid(device.cid)
+
+    def test_remove_moves_last(self):
+        """Test removing a device moves the last device of its type into its place."""
+        purifiers = self.container.air_purifiers
+        first, last = purifiers
+        self.container.discard(first)
+        assert purifiers == [last]
+        self.container.discard(last)
+        assert len(purifiers) == 0
+        self.container.add(first)
+        assert purifiers == [first]
+
+    def test_assigned_name(self):
+        """Test lookups use the indexed name after assigning a device name."""
+        device = self.container.get_by_cid(TestDefaults.cid('Core300S'))
+        device.device_name = 'Renamed'
+        assert self.container.get_by_name(TestDefaults.name('Core300S')) is device
+        assert self.container.get_by_name('Renamed') is None
+        self.container.discard(device)
+        assert self.container.get_by_name(TestDefaults.name('Core300S')) is None
+
+
+class TestReconcile(ContainerFixture):
+    """Test reconciling the container with the device list."""
+
+    def list_response(self, *details: ResponseDeviceDetailsModel):
+        """Return a device list response model with the entries."""
+        response = DeviceList.device_list_response([])
+        response['result']['list'] = [model.to_dict() for model in details]
+        response['result']['total'] = len(details)
+        return ResponseDeviceListModel.from_dict(response)
+
+    def test_reconcile(self):
+        """Test devices are added, removed and patched in place."""
+        events = []
+        self.container.add_listener(events.append)
+        purifier = self.container.get_by_cid(TestDefaults.cid('Core300S'))
+        purifier.state.fan_level = 2
+        response = self.list_response(
+            device_model(
+                'Core300S', deviceName='Bedroom', currentFirmVersion='2.0.0'
+            ),
+            device_model('ESW15-USA'),
+            device_model('LV-PUR131S'),
+        )
+        result = self.container.reconcile(response, self.manager)
+        assert [device.cid for device in result.removed] == [
+            TestDefaults.cid('Core400S')
+        ]
+        assert [device.cid for device in result.added] == [
+            TestDefaults.cid('LV-PUR131S')
+        ]
+        assert result.changed == [purifier]
+        assert self.container.get_by_cid(TestDefaults.cid('Core300S')) is purifier
+        assert purifier.state.fan_level == 2
+        assert purifier.current_firm_version == '2.0.0'
+        assert self.container.get_by_name('Bedroom') is purifier
+        assert self.container.get_by_name(TestDefaults.name('Core300S')) is None
+        assert [event.event_type for event in events] == [
+            DeviceEventType.REMOVED,
+            DeviceEventType.CHANGED,
+            DeviceEventType.ADDED,
+        ]
+        assert events[1].changes['device_name'] == (
+            TestDefaults.name('Core300S'),
+            'Bedroom',
+        )
+
+    def test_reconcile_unchanged(self):
+        """Test an unchanged device list produces no events."""
+        events = []
+        self.container.add_listener(events.append)
+        response = self.list_response(
+            device_model('ESW15-USA'), device_model('Core300S'), device_model('Core400S')
+        )
+        result = self.container.reconcile(response, self.manager)
+        assert result.added == result.removed == result.changed == []
+        assert events == []
@@ -0,0 +1,118 @@
+"""Test device type lookups in the device map."""
+import os
+import subprocess
+import sys
+from itertools import chain
+from pathlib import Path
+
+import pytest
+
+from pyvesync import device_map
+from pyvesync.device_map import (
+    OutletMap,
+    get_device_config,
+    get_outlet,
+    invalidate_device_index,
+)
+
+ALL_MODULES = [
+    device_map.outlet_modules,
+    device_map.switch_modules,
+    device_map.bulb_modules,
+    device_map.fan_modules,
+    device_map.purifier_modules,
+    device_map.humidifier_modules,
+    device_map.air_fryer_modules,
+    device_map.thermostat_modules,
+]
+
+
+def linear_lookup(device_type):
+    """Return the device map using a linear scan of all maps."""
+    for module in chain(*ALL_MODULES):
+        if device_type in module.dev_types:
+            return module
+    if device_type.count('-') > 1:
+        device_type = '-'.join(device_type.split('-')[:-1])
+        for module in chain(*ALL_MODULES):
+            if any(dev.lower().startswith(device_type.lower()) for dev in module.dev_types):
+                return module
+    return None
+
+
+DEVICE_TYPES = [
+    dev_type for module in chain(*ALL_MODULES) for dev_type in module.dev_types
+]
+
+
+@pytest.mark.parametrize(
+    'device_type',
+    [*DEVICE_TYPES, 'LAP-C601S-WXX', 'Core300S', 'UNKNOWN-TYPE-XX', 'unknown'],
+)
+def test_index_matches_linear_scan(device_type):
+    """Test the index returns the same map as a linear scan."""
+    assert get_device_config(device_type) is linear_lookup(device_type)
+
+
+def new_outlet_map():
+    """Return an outlet map that is not in the device map lists."""
+    return OutletMap(
+        dev_types=['TEST-OUTLET-US'],
+        class_name='VeSyncOutlet7A',
+        setup_entry='TEST-OUTLET',
+        model_display='Test Outlet',
+        model_name='Test Outlet',
+    )
+
+
+def test_index_rebuilt_on_new_map():
+    """Test a device map added at runtime is found after invalidating the index."""
+    new_map = new_outlet_map()
+    assert get_outlet('TEST-OUTLET-US') is None
+    device_map.outlet_modules.append(new_map)
+    try:
+        assert get_outlet('TEST-OUTLET-US') is None
+        invalidate_device_index()
+        assert get_outlet('TEST-OUTLET-US') is new_map
+        assert get_device_config('TEST-OUTLET-US') is new_map
+        assert get_outlet('TEST-OUTLET-US-EU') is new_map
+    finally:
+        device_map.outlet_modules.remove(new_map)
+        invalidate_device_index()
+    assert get_outlet('TEST-OUTLET-US') is None
+
+
+def test_index_rebuilt_on_replaced_map():
+    """Test a device map replaced in place is found after invalidating the index."""
+    old_map = device_map.outlet_modules[0]
+    new_map = new_outlet_map()
+    assert get_outlet(old_map.dev_types[0]) is old_map
+    device_map.outlet_modules[0] = new_map
+    invalidate_device_index()
+    try:
+        assert get_outlet('TEST-OUTLET-US') is new_map
+        assert get_outlet(old_map.dev_types[0]) is not old_map
+    finally:
+        device_map.outlet_modules[0] = old_map
+        invalidate_device_index()
+    assert get_outlet(old_map.dev_types[0]) is old_map
+    assert get_outlet('TEST-OUTLET-US') is None
+
+
+def test_lazy_device_modules():
+    """Test importing pyvesync does not load the device modules."""
+    code = (
+        'import sys, pyvesync; '
+        "print(sorted(m for m in sys.modules if m.startswith(("
+        "'pyvesync.devices.', 'pyvesync.models.purifier_models'))))"
+    )
+    src_dir = Path(device_map.__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, 'PYTHONPATH': str(src_dir)},
+    )
+    assert result.stdout.strip() == '[]'
+    assert get_outlet('ESW15-USA').module.__name__ == 'pyvesync.devices.vesyncoutlet'
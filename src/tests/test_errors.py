@@ -0,0 +1,51 @@
+"""Test error code extraction and lookup."""
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from pyvesync.utils.errors import (
+    SUCCESS_RESPONSE,
+    ErrorCodes,
+    ErrorTypes,
+    find_error_code,
+)
+from pyvesync.utils.helpers import Helpers
+
+
+def test_success_is_shared():
+    """Test successful responses return the shared, frozen success information."""
+    assert ErrorCodes.get_error_info(0) is SUCCESS_RESPONSE
+    assert ErrorCodes.get_error_info('0') is SUCCESS_RESPONSE
+    assert Helpers.parse_error_code({'code': 0, 'result': {}}) is SUCCESS_RESPONSE
+    with pytest.raises(FrozenInstanceError):
+        SUCCESS_RESPONSE.message = 'changed'  # type: ignore[misc]
+    with_msg = ErrorCodes.get_error_info(0, 'msg')
+    assert with_msg.message == 'Success - msg'
+    assert SUCCESS_RESPONSE.message == 'Success'
+
+
+def test_error_lookup():
+    """Test exact codes, buckets and unknown codes are looked up."""
+    exact = ErrorCodes.get_error_info(-11260022, 'msg')
+    assert exact.error_type == ErrorTypes.CROSS_REGION
+    assert exact.code == -11260022
+    assert exact.message.endswith(' - msg')
+    assert ErrorCodes.errors['-11260022'].message == 'Cross region error'
+    assert ErrorCodes.get_error_info(-11203022).name == (
+        ErrorCodes.errors['-11203000'].name
+    )
+    assert ErrorCodes.get_error_info('bad').error_type == ErrorTypes.UNKNOWN_ERROR
+
+
+def test_find_error_code():
+    """Test nested codes are found in one pass with key precedence."""
+    assert find_error_code({'code': 5, 'msg': 'outer'}) == (5, 'outer')
+    response = {
+        'code': 0,
+        'result': {
+            'code': 0,
+            'result': {'items': [{'code': 1, 'msg': 'a'}, {'errorCode': 2}]},
+        },
+    }
+    assert find_error_code(response) == (2, None)
+    assert find_error_code(response, max_depth=2) == (0, None)
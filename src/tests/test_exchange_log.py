@@ -0,0 +1,88 @@
+"""Test the ring buffer of recent API exchanges."""
+import asyncio
+
+import orjson
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.utils.errors import VeSyncAPIStatusCodeError
+from pyvesync.utils.exchange_log import ExchangeLog, ExchangeLogConfig, payload_method
+from pyvesync.utils.logs import LibraryLogger
+from pyvesync.utils.transport import RequestBody
+from fake_cloud import FakeCloudConfig, FakeVeSyncCloud
+
+BODY = RequestBody(
+    {'cid': 'CID', 'token': 'secret', 'payload': {'method': 'getPurifierStatus'}}
+)
+
+
+class TestExchangeLog:
+    """Test ExchangeLog sampling and buffers."""
+
+    def test_payload_method(self):
+        """Test the payload method is preferred over the outer method."""
+        assert payload_method(BODY) == 'getPurifierStatus'
+        assert payload_method(RequestBody({'method': 'devices'})) == 'devices'
+        assert payload_method(None) is None
+
+    def test_errors_always_recorded(self):
+        """Test failed exchanges are recorded with redacted bodies."""
+        log = ExchangeLog(ExchangeLogConfig(sample_rate=0.0))
+        log.record('/ok', BODY, 'CID', 200, {'code': 0}, 0.1)
+        log.record('/bad', BODY, 'CID', 200, {'code': -11003000}, 0.2)
+        log.record('/down', BODY, 'CID', None, None, 0.3, ValueError('down'))
+        exchanges = log.snapshot('CID')
+        assert [exchange.endpoint for exchange in exchanges] == ['/bad', '/down']
+        assert exchanges[0].response_info.code == -11003000
+        assert exchanges[0].payload_method == 'getPurifierStatus'
+        assert 'secret' not in exchanges[0].request_body
+        assert exchanges[1].error == "ValueError('down')"
+        dump = orjson.loads(log.dump())
+        assert dump[0]['response_info']['code'] == -11003000
+
+    def test_sampling_and_bounds(self):
+        """Test sampled successes are recorded without bodies and buffers are bounded."""
+        log = ExchangeLog(ExchangeLogConfig(size=3, device_size=2, sample_rate=1.0))
+        for idx in range(5):
+            log.record(f'/{idx}', BODY, 'CID', 200, {'code': 0}, 0.1)
+        assert [exchange.endpoint for exchange in log.snapshot()] == ['/2', '/3', '/4']
+        assert len(log.snapshot('CID')) == 2
+        assert log.snapshot()[0].request_body is None
+        log.clear()
+        assert log.snapshot() == ()
+
+    def test_redacted_without_log_redaction(self, monkeypatch):
+        """Test bodies are redacted when debug log redaction is off."""
+        monkeypatch.setattr(LibraryLogger, 'shouldredact', False)
+        log = ExchangeLog()
+        log.record('/bad', BODY, 'CID', 200, {'code': -11003000, 'token': 'tk'}, 0.1)
+        exchange = log.snapshot()[0]
+        assert 'secret' not in exchange.request_body
+        assert '"CID"' not in exchange.request_body
+        assert '"tk"' not in exchange.response_body
+
+    def test_device_buffers_bounded(self):
+        """Test the buffer of the device recorded least recently is dropped."""
+        log = ExchangeLog(ExchangeLogConfig(max_devices=2))
+        for cid in ('A', 'B', 'A', 'C'):
+            log.record('/bad', BODY, cid, 200, {'code': -11003000}, 0.1)
+        assert len(log.snapshot('A')) == 2
+        assert log.snapshot('B') == ()
+        assert len(log.snapshot('C')) == 1
+
+    def test_manager_records_errors(self):
+        """Test the manager records failed requests."""
+        cloud = FakeVeSyncCloud(FakeCloudConfig(error_rate=1.0, error_status=503))
+
+        managers = []
+
+        async def run():
+            async with VeSync('EMAIL', 'PASSWORD', transport=cloud) as manager:
+                managers.append(manager)
+                await manager.async_call_api('/endpoint', 'post')
+
+        with pytest.raises(VeSyncAPIStatusCodeError):
+            asyncio.run(run())
+        exchange = managers[0].exchange_log.snapshot()[-1]
+        assert exchange.endpoint == '/endpoint'
+        assert 'VeSyncAPIStatusCodeError' in exchange.error
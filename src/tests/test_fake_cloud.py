@@ -0,0 +1,99 @@
+"""Test the pluggable transport with the fake VeSync cloud."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.models.vesync_models import RequestDeviceListModel
+from pyvesync.vesync import DeviceListConfig
+from pyvesync.utils.errors import VeSyncAPIStatusCodeError
+from pyvesync.utils.transport import TransportConfig
+from fake_cloud import FakeCloudConfig, FakeVeSyncCloud
+
+
+class TestFakeCloud:
+    """Test the manager against the fake cloud."""
+
+    def test_in_process_transport(self):
+        """Test login, device discovery and updates through the transport."""
+        cloud = FakeVeSyncCloud(FakeCloudConfig(copies=2))
+
+        async def run():
+            async with VeSync('EMAIL', 'PASSWORD', transport=cloud) as manager:
+                await manager.login()
+                await manager.get_devices()
+                await manager.update_all_devices()
+                return manager
+
+        manager = asyncio.run(run())
+        assert manager.enabled is True
+        assert len(manager.devices) == len(cloud.device_list)
+        cids = {device.cid for device in manager.devices}
+        assert len(cids) == len(cloud.device_list)
+        assert cloud.requests['/cloud/v1/deviceManaged/devices'] == 1
+        assert cloud.request_count > len(manager.devices)
+
+    def test_device_list_pages(self):
+        """Test every page of a large device list is fetched."""
+        cloud = FakeVeSyncCloud(FakeCloudConfig(copies=3))
+        config = DeviceListConfig(page_size=25, page_concurrency=2)
+
+        async def run():
+            async with VeSync(
+                'EMAIL', 'PASSWORD', transport=cloud, device_list_config=config
+            ) as manager:
+                await manager.login()
+                await manager.get_devices()
+                return manager
+
+        manager = asyncio.run(run())
+        assert len(cloud.device_list) > 100
+        assert len(manager.devices) == len(cloud.device_list)
+        pages = -(-len(cloud.device_list) // 25)
+        assert cloud.requests['/cloud/v1/deviceManaged/devices'] == pages
+
+    def test_device_list_body_serialized(self):
+        """Test device list requests are serialized without a dict round trip."""
+        cloud = FakeVeSyncCloud()
+
+        async def run():
+            async with VeSync('EMAIL', 'PASSWORD', transport=cloud) as manager:
+                await manager.login()
+                await manager.get_devices()
+                return manager
+
+        with patch.object(
+            RequestDeviceListModel, 'to_dict', side_effect=AssertionError
+        ) as to_dict:
+            manager = asyncio.run(run())
+        to_dict.assert_not_called()
+        assert len(manager.devices) == len(cloud.device_list)
+
+    def test_localhost_server(self):
+        """Test the manager against the fake cloud served on localhost."""
+
+        async def run():
+            async with FakeVeSyncCloud() as cloud:
+                config = TransportConfig(base_url=cloud.base_url)
+                async with VeSync(
+                    'EMAIL', 'PASSWORD', transport_config=config
+                ) as manager:
+                    await manager.login()
+                    await manager.get_devices()
+                    return manager, cloud
+
+        manager, cloud = asyncio.run(run())
+        assert len(manager.devices) == len(cloud.device_list)
+
+    def test_error_injection(self):
+        """Test injected errors are raised as status code errors."""
+        cloud = FakeVeSyncCloud(FakeCloudConfig(error_rate=1.0, error_status=503))
+
+        async def run():
+            async with VeSync('EMAIL', 'PASSWORD', transport=cloud) as manager:
+                await manager.async_call_api('/endpoint', 'post')
+
+        with pytest.raises(VeSyncAPIStatusCodeError):
+            asyncio.run(run())
+        assert cloud.request_count == 1
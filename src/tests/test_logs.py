@@ -0,0 +1,54 @@
+"""Test deferred API call logging."""
+import logging
+from unittest.mock import patch
+
+from yarl import URL
+
+from pyvesync.utils.logs import API_CALLER, ApiCallRecord, LibraryLogger
+from pyvesync.utils.transport import RequestBody, TransportResponse
+
+RESPONSE = TransportResponse(
+    status=200,
+    body=b'{"code": 0}',
+    url=URL('https://smartapi.vesync.com/cloud/v2/deviceManaged/bypassV2'),
+    method='post',
+)
+
+
+class TestLogApiCall:
+    """Test LibraryLogger.log_api_call records."""
+
+    def test_record_deferred(self, caplog):
+        """Test the record is only formatted when it is emitted."""
+        logger = logging.getLogger('pyvesync.test_logs')
+        body = RequestBody({'token': 'secret', 'method': 'bypassV2'})
+        with patch.object(LibraryLogger, 'debug_enabled', True), patch.object(
+            ApiCallRecord, '__str__', autospec=True, return_value='formatted'
+        ) as formatter:
+            with caplog.at_level(logging.INFO, logger='pyvesync'):
+                LibraryLogger.log_api_call(logger, RESPONSE, {'code': 0}, None, body)
+            formatter.assert_not_called()
+            with caplog.at_level(logging.DEBUG, logger='pyvesync'):
+                with LibraryLogger.api_caller('VeSyncAirBypass.getPurifierStatus'):
+                    LibraryLogger.log_api_call(
+                        logger, RESPONSE, {'code': 0}, None, body
+                    )
+        assert API_CALLER.get() is None
+        record = caplog.records[-1].api_call
+        assert record.caller == 'VeSyncAirBypass.getPurifierStatus'
+        assert record.request_body is body
+
+    def test_record_redacted(self, monkeypatch):
+        """Test the formatted record redacts sensitive values."""
+        monkeypatch.setattr(LibraryLogger, 'shouldredact', True)
+        record = ApiCallRecord(
+            'caller',
+            RESPONSE,
+            {'code': 0, 'cid': 'CID'},
+            None,
+            RequestBody({'token': 'secret'}),
+        )
+        message = str(record)
+        assert 'Caller: caller' in message
+        assert 'secret' not in message
+        assert '"cid": "CID"' not in message
@@ -0,0 +1,74 @@
+"""Test request metrics."""
+import asyncio
+
+from pyvesync import VeSync
+from pyvesync.utils.errors import ErrorTypes, VeSyncRateLimitError
+from pyvesync.utils.metrics import (
+    LATENCY_BUCKETS,
+    MetricKey,
+    MetricsRegistry,
+    error_type_of,
+)
+from fake_cloud import FakeCloudConfig, FakeVeSyncCloud
+
+KEY = MetricKey('bypassV2', 'getPurifierStatus', 'Core300S')
+
+
+class TestMetricsRegistry:
+    """Test MetricsRegistry recording and rendering."""
+
+    def test_record(self):
+        """Test latency, requests, errors and in-flight requests are recorded."""
+        metrics = MetricsRegistry()
+        metrics.start(KEY.family)
+        assert metrics.snapshot().in_flight == {KEY.family: 1}
+        metrics.finish(KEY, 0.02)
+        metrics.start(KEY.family)
+        metrics.finish(KEY, 100.0, ErrorTypes.SERVER_ERROR.value)
+        metrics.record_retry(KEY)
+        snapshot = metrics.snapshot()
+        histogram = snapshot.latency[KEY]
+        assert histogram.count == 2
+        assert histogram.counts[LATENCY_BUCKETS.index(0.025)] == 1
+        assert histogram.counts[-1] == 1
+        assert histogram.quantile(0.5) == 0.025
+        assert histogram.quantile(1.0) == float('inf')
+        assert snapshot.requests[KEY] == 2
+        assert snapshot.errors[(KEY, 'server_error')] == 1
+        assert snapshot.retries[KEY] == 1
+        assert snapshot.in_flight == {KEY.family: 0}
+
+    def test_render_prometheus(self):
+        """Test the Prometheus text exposition output."""
+        metrics = MetricsRegistry()
+        metrics.start(KEY.family)
+        metrics.finish(KEY, 0.02)
+        text = metrics.render_prometheus()
+        labels = 'family="bypassV2",method="getPurifierStatus",product_type="Core300S"'
+        assert f'pyvesync_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f'pyvesync_requests_total{{{labels}}} 1' in text
+        assert 'pyvesync_requests_in_flight{family="bypassV2"} 0' in text
+
+    def test_error_type_of(self):
+        """Test exceptions are mapped to error types."""
+        assert error_type_of(None, None) is None
+        assert error_type_of(VeSyncRateLimitError(), None) == 'rate_limit_error'
+        assert error_type_of(asyncio.CancelledError(), None) is None
+
+
+def test_manager_metrics():
+    """Test the manager records the requests of device updates."""
+    cloud = FakeVeSyncCloud(FakeCloudConfig())
+
+    async def run():
+        async with VeSync('EMAIL', 'PASSWORD', transport=cloud) as manager:
+            await manager.login()
+            await manager.get_devices()
+            await manager.update_all_devices()
+            return manager
+
+    manager = asyncio.run(run())
+    snapshot = manager.metrics.snapshot()
+    assert sum(snapshot.requests.values()) == cloud.request_count
+    assert any(key.product_type for key in snapshot.requests)
+    assert all(count == 0 for count in snapshot.in_flight.values())
@@ -0,0 +1,186 @@
+"""Test the adaptive rate limiter used by `VeSync.async_call_api`."""
+import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.const import API_BASE_URL_US
+from pyvesync.utils.errors import (
+    VeSyncAPIStatusCodeError,
+    VeSyncRateLimitError,
+    VeSyncServerError,
+)
+from pyvesync.utils.rate_limit import AdaptiveRateLimiter, RateLimitConfig
+import call_json
+from aiohttp_mocker import AiohttpMockSession
+from defaults import TestDefaults
+
+RATE_LIMIT_RESP = call_json.response_body(-11003000, 'Rate limit exceeded')
+SUCCESS_RESP = call_json.response_body(0, 'Success')
+SERVER_ERROR_RESP = call_json.response_body(-11100000, 'Database error')
+
+
+def mock_response(response: dict | None, status: int = 200) -> AiohttpMockSession:
+    """Return a mock response for the default endpoint."""
+    return AiohttpMockSession(
+        method='post',
+        url=API_BASE_URL_US + '/endpoint',
+        status=status,
+        response=orjson.dumps(response) if response is not None else None,
+    )
+
+
+class TestAdaptiveRateLimiter:
+    """Test token bucket and adaptive rate behavior."""
+
+    def test_burst_then_wait(self):
+        """Test requests beyond the burst wait for the refill."""
+
+        async def run():
+            limiter = AdaptiveRateLimiter(RateLimitConfig(rate=100, burst=2))
+            waits = [await limiter.acquire() for _ in range(3)]
+            return waits
+
+        waits = asyncio.run(run())
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] > 0
+
+    def test_disabled(self):
+        """Test a limiter without a rate never waits."""
+        limiter = AdaptiveRateLimiter(RateLimitConfig(rate=None, burst=1))
+        assert limiter.enabled is False
+
+        async def run():
+            return [await limiter.acquire() for _ in range(5)]
+
+        assert asyncio.run(run()) == [0.0] * 5
+
+    def test_throttle_and_recover(self):
+        """Test the refill rate shrinks on throttling and recovers on success."""
+        config = RateLimitConfig(
+            rate=10, min_rate=2, decrease_factor=0.5, recovery_step=1
+        )
+        limiter = AdaptiveRateLimiter(config)
+        limiter.on_throttle()
+        assert limiter.current_rate == 5
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.current_rate == 2
+        assert limiter.throttle_count == 3
+        limiter.on_success()
+        assert limiter.current_rate == 3
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter.current_rate == 10
+
+    def test_disabled_by_default(self):
+        """Test the default configuration does not rate limit requests."""
+        assert AdaptiveRateLimiter().enabled is False
+        assert VeSync('EMAIL', 'PASSWORD').rate_limiter.enabled is False
+
+    def test_recovery_time(self):
+        """Test the rate recovers from a throttle within a few seconds of traffic."""
+        clock = [0.0]
+
+        async def fake_sleep(delay: float) -> None:
+            # Timers have a resolution, and float rounding can leave tiny delays
+            clock[0] += max(delay, 0.001)
+
+        async def run(limiter: AdaptiveRateLimiter) -> float:
+            limiter.on_throttle()
+            assert limiter.current_rate == 10
+            while limiter.current_rate != 20:
+                await limiter.acquire()
+                limiter.on_success()
+            return clock[0]
+
+        with patch('pyvesync.utils.rate_limit.time.monotonic', lambda: clock[0]), \
+                patch('pyvesync.utils.rate_limit.asyncio.sleep', fake_sleep):
+            limiter = AdaptiveRateLimiter(RateLimitConfig(rate=20, burst=1))
+            elapsed = asyncio.run(run(limiter))
+        assert 0 < elapsed < 5
+
+    def test_backoff_delay(self):
+        """Test backoff delays are jittered and capped."""
+        limiter = AdaptiveRateLimiter(
+            RateLimitConfig(backoff_base=1, backoff_max=4)
+        )
+        for attempt in range(6):
+            delay = limiter.backoff_delay(attempt)
+            assert 0 <= delay <= min(4, 2**attempt)
+
+
+class TestRateLimitManager:
+    """Test rate limiter feedback and retries in the manager."""
+
+    def build_manager(self, config: RateLimitConfig) -> VeSync:
+        """Return a logged in manager with the rate limit configuration."""
+        manager = VeSync('EMAIL', 'PASSWORD', rate_limit_config=config)
+        manager.enabled = True
+        manager.auth._token = TestDefaults.token
+        manager.auth._account_id = TestDefaults.account_id
+        return manager
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_retry_rate_limited(self, mock):
+        """Test rate limited requests are retried and the rate is reduced."""
+        mock.return_value.request.side_effect = [
+            mock_response(RATE_LIMIT_RESP),
+            mock_response(RATE_LIMIT_RESP),
+            mock_response(SUCCESS_RESP),
+        ]
+        manager = self.build_manager(
+            RateLimitConfig(rate=10, max_retries=2, backoff_base=0)
+        )
+        resp, status = asyncio.run(manager.async_call_api('/endpoint', 'post'))
+        assert resp == SUCCESS_RESP
+        assert status == 200
+        assert mock.return_value.request.call_count == 3
+        assert manager.rate_limiter.throttle_count == 2
+        assert manager.rate_limiter.current_rate < 10
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_retry_status_429(self, mock):
+        """Test HTTP 429 responses are retried as rate limit errors."""
+        mock.return_value.request.side_effect = [
+            mock_response(None, status=429),
+            mock_response(SUCCESS_RESP),
+        ]
+        manager = self.build_manager(
+            RateLimitConfig(rate=10, max_retries=1, backoff_base=0)
+        )
+        resp, status = asyncio.run(manager.async_call_api('/endpoint', 'post'))
+        assert resp == SUCCESS_RESP
+        assert status == 200
+        assert manager.rate_limiter.throttle_count == 1
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_retries_exhausted(self, mock):
+        """Test the rate limit error is raised when retries are exhausted."""
+        mock.return_value.request.side_effect = [
+            mock_response(RATE_LIMIT_RESP),
+            mock_response(RATE_LIMIT_RESP),
+        ]
+        manager = self.build_manager(
+            RateLimitConfig(rate=10, max_retries=1, backoff_base=0)
+        )
+        with pytest.raises(VeSyncRateLimitError):
+            asyncio.run(manager.async_call_api('/endpoint', 'post'))
+        assert mock.return_value.request.call_count == 2
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_server_error_not_throttled(self, mock):
+        """Test server errors do not reduce the rate."""
+        mock.return_value.request.side_effect = [
+            mock_response(SERVER_ERROR_RESP),
+            mock_response(None, status=503),
+        ]
+        manager = self.build_manager(RateLimitConfig(rate=10))
+        with pytest.raises(VeSyncServerError):
+            asyncio.run(manager.async_call_api('/endpoint', 'post'))
+        with pytest.raises(VeSyncAPIStatusCodeError):
+            asyncio.run(manager.async_call_api('/endpoint', 'post'))
+        assert manager.rate_limiter.throttle_count == 0
+        assert manager.rate_limiter.current_rate == 10
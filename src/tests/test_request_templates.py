@@ -0,0 +1,176 @@
+"""Test request templates and the request field caches."""
+import gc
+import weakref
+
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.device_container import DeviceContainer
+from pyvesync.device_map import air_fryer_modules
+from pyvesync.models.base_models import DefaultValues
+from pyvesync.models.bulb_models import JSONCMD, RequestESL100CWBase
+from pyvesync.models.fryer_models import RequestFryerBypass
+from pyvesync.models.bypass_models import RequestBypassV2
+from pyvesync.models.switch_models import RequestSwitchStatus
+from pyvesync.models.vesync_models import (
+    ResponseDeviceDetailsModel,
+    ResponseDeviceListModel,
+)
+from pyvesync.utils.helpers import Helpers
+from pyvesync.utils.request_templates import request_template
+from call_json import ALL_DEVICE_MAP_DICT, DeviceList
+from defaults import TestDefaults
+
+
+def add_device(manager, setup_entry):
+    """Add a device to a new container and return it."""
+    details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT[setup_entry])
+    return DeviceContainer().add_device_from_model(
+        ResponseDeviceDetailsModel.from_dict(details), manager
+    )
+
+
+class ManagerFixture:
+    """Manager with test credentials."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Create a logged in manager."""
+        self.manager = VeSync(TestDefaults.email, TestDefaults.password)
+        self.manager.auth._token = TestDefaults.token
+        self.manager.auth._account_id = TestDefaults.account_id
+
+
+class TestRequestTemplates(ManagerFixture):
+    """Test templates match the reflective helpers."""
+
+    def reflective_body(self, device, keys):
+        """Build the request keys with the reflective helpers."""
+        body = Helpers.get_class_attributes(DefaultValues, keys)
+        body.update(Helpers.get_class_attributes(self.manager, keys))
+        body.update(Helpers.get_class_attributes(device, keys))
+        return body
+
+    @pytest.mark.parametrize(
+        ('setup_entry', 'model'),
+        [
+            ('Core300S', RequestBypassV2),
+            ('ESWL01', RequestSwitchStatus),
+            ('ESL100CW', RequestESL100CWBase),
+        ],
+    )
+    def test_matches_helpers(self, setup_entry, model):
+        """Test template fields equal the fields found by reflection."""
+        device = add_device(self.manager, setup_entry)
+        template = request_template(model, device.request_keys)
+        body = template.fields(device)
+        expected = self.reflective_body(device, template.keys)
+        assert body.pop('traceId').isdigit()
+        assert expected.pop('traceId').isdigit()
+        assert body == expected
+        assert body['deviceId'] == body['cid'] == device.cid
+
+    def test_dict_bodies(self):
+        """Test the Valceno bulb and air fryer bodies match the reflective helpers."""
+        bulb = add_device(self.manager, 'XYD0001')
+        request = bulb._build_request({'method': 'getLightStatusV2'})
+        body = request.to_dict()
+        expected = self.reflective_body(bulb, bulb.request_keys)
+        assert body.pop('traceId').isdigit()
+        assert expected.pop('traceId').isdigit()
+        assert body == {**expected, 'method': 'bypassV2', 'payload': request.payload}
+        details = DeviceList.device_list_item(air_fryer_modules[0])
+        details['configModule'] = 'WiFi_SKA_AirFryer158_US'
+        fryer = DeviceContainer().add_device_from_model(
+            ResponseDeviceDetailsModel.from_dict(details), self.manager
+        )
+        body = fryer._build_request({'getStatus': 'status'})
+        template = request_template(RequestFryerBypass, fryer.request_keys)
+        expected = self.reflective_body(fryer, template.keys)
+        assert body.pop('traceId').isdigit()
+        assert expected.pop('traceId').isdigit()
+        assert body == {**expected, 'method': 'bypass', 'jsonCmd': {'getStatus': 'status'}}
+        assert body['pid'] == fryer.pid
+
+    def test_volatile_fields(self):
+        """Test manager fields are read on every call."""
+        device = add_device(self.manager, 'Core300S')
+        first = device._build_request('getPurifierStatus')
+        self.manager.auth.set_credentials('NEW_TOKEN', TestDefaults.account_id, 'US', 'US')
+        self.manager.time_zone = 'Europe/Berlin'
+        second = device._build_request('getPurifierStatus')
+        assert first.token == TestDefaults.token
+        assert second.token == 'NEW_TOKEN'
+        assert second.timeZone == 'Europe/Berlin'
+        assert second.cid == first.cid == device.cid
+        template = request_template(RequestBypassV2, device.request_keys)
+        assert list(device._field_cache.templates) == [template]
+
+    def test_converted_fields(self):
+        """Test plain values of nested or mismatched fields are converted."""
+        device = add_device(self.manager, 'ESL100CW')
+        request = device._build_request(
+            RequestESL100CWBase, {'jsonCmd': {'light': {'action': 'on'}}}
+        )
+        assert isinstance(request.jsonCmd, JSONCMD)
+        assert request.jsonCmd.light.action == 'on'
+        request = device._build_request(
+            RequestESL100CWBase, {'jsonCmd': JSONCMD(getLightStatus='get')}
+        )
+        assert request.to_dict()['jsonCmd'] == {'getLightStatus': 'get'}
+
+
+class TestFieldCache(ManagerFixture):
+    """Test the request field caches are cleared when their values change."""
+
+    def test_defaults_not_shared(self):
+        """Test callers can change the default values they receive."""
+        keys = ('appVersion', 'traceId')
+        body = Helpers.get_defaultvalues_attributes(keys)
+        body['appVersion'] = 'changed'
+        assert Helpers.get_defaultvalues_attributes(keys)['appVersion'] != 'changed'
+
+    def test_manager_invalidation(self):
+        """Test credential, region and time zone changes reach the manager fields."""
+        keys = ('token', 'accountID', 'userCountryCode', 'timeZone')
+        fields = Helpers.get_manager_attributes(self.manager, keys)
+        assert fields['token'] == TestDefaults.token
+        self.manager.auth.set_credentials('NEW_TOKEN', 'NEW_ID', 'DE', 'EU')
+        self.manager.time_zone = 'Europe/Berlin'
+        assert Helpers.get_manager_attributes(self.manager, keys) == {
+            'token': 'NEW_TOKEN',
+            'accountID': 'NEW_ID',
+            'userCountryCode': 'DE',
+            'timeZone': 'Europe/Berlin',
+        }
+        self.manager.auth.country_code = 'fr'
+        fields = Helpers.get_manager_attributes(self.manager, keys)
+        assert fields['userCountryCode'] == 'FR'
+
+    def test_device_invalidation(self):
+        """Test patching a device clears its cached fields and templates."""
+        device = add_device(self.manager, 'Core300S')
+        device._build_request('getPurifierStatus')
+        assert Helpers.get_device_attributes(device, ('cid',)) == {'cid': device.cid}
+        device._field_cache._fields[('cid',)]['cid'] = 'STALE'
+        container = DeviceContainer()
+        container.add(device)
+        details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT['Core300S'])
+        details['deviceName'] = 'Bedroom'
+        response = DeviceList.device_list_response([])
+        response['result']['list'] = [details]
+        container.patch_devices(ResponseDeviceListModel.from_dict(response))
+        assert device.device_name == 'Bedroom'
+        assert not device._field_cache.templates
+        assert Helpers.get_device_attributes(device, ('cid',)) == {'cid': device.cid}
+
+    def test_weak_owner(self):
+        """Test a cache does not keep its device alive."""
+        device = add_device(self.manager, 'Core300S')
+        device._build_request('getPurifierStatus')
+        field_cache = device._field_cache
+        device_ref = weakref.ref(device)
+        del device
+        gc.collect()
+        assert device_ref() is None
+        assert field_cache.get(('cid',)) == {}
@@ -0,0 +1,49 @@
+"""Test connection level request timing."""
+import asyncio
+
+from pyvesync import VeSync
+from pyvesync.utils.request_timing import RequestTiming, RequestTimingStats
+from pyvesync.utils.transport import TransportConfig
+from fake_cloud import FakeVeSyncCloud
+
+
+def test_timing_phases():
+    """Test phase durations are computed from the marks."""
+    timing = RequestTiming()
+    timing.started = 0.0
+    timing.dns_start, timing.dns_end = 0.1, 0.3
+    timing.connect_start, timing.connect_end = 0.1, 0.6
+    timing.headers_sent = 0.7
+    timing.response_start = 1.2
+    timing.body_end = 1.5
+    assert timing.pool_wait is None
+    assert round(timing.dns, 3) == 0.2
+    assert round(timing.connect, 3) == 0.3
+    assert round(timing.ttfb, 3) == 0.5
+    assert round(timing.body_read, 3) == 0.3
+    assert timing.total == 1.5
+    stats = RequestTimingStats()
+    stats.record(timing)
+    snapshot = stats.snapshot()
+    assert stats.requests == 1
+    assert snapshot['pool_wait'].count == 0
+    assert snapshot['total'].max == 1.5
+
+
+def test_manager_session_timing():
+    """Test requests through the manager's session are traced."""
+
+    async def run():
+        async with FakeVeSyncCloud() as cloud:
+            config = TransportConfig(base_url=cloud.base_url)
+            async with VeSync('EMAIL', 'PASSWORD', transport_config=config) as manager:
+                await manager.login()
+                await manager.get_devices()
+                return manager
+
+    manager = asyncio.run(run())
+    snapshot = manager.request_timing.snapshot()
+    assert manager.request_timing.requests >= 2
+    assert snapshot['connect'].count >= 1
+    assert snapshot['ttfb'].count == manager.request_timing.requests
+    assert manager.request_timing.reused_connections >= 1
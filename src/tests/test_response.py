@@ -0,0 +1,71 @@
+"""Test the decoded API response envelope."""
+from unittest.mock import MagicMock
+
+from pyvesync.utils.errors import ErrorTypes
+from pyvesync.utils.helpers import Helpers
+from pyvesync.utils.response import ResponseEnvelope
+
+
+class TestResponseEnvelope:
+    """Test ResponseEnvelope error detection and model caching."""
+
+    def test_success(self):
+        """Test a response without error codes is successful."""
+        envelope = ResponseEnvelope(
+            {'code': 0, 'result': {'code': 0, 'result': {'enabled': True}}}
+        )
+        assert envelope.error_info.error_type == ErrorTypes.SUCCESS
+        assert envelope.inner_result == {'enabled': True}
+        assert envelope['result']['result'] == {'enabled': True}
+
+    def test_outer_code(self):
+        """Test the outer code and message are used first."""
+        envelope = ResponseEnvelope({'code': -11260022, 'msg': 'outer'})
+        assert envelope.error_info.code == -11260022
+        assert envelope.error_info.message.endswith('outer')
+
+    def test_inner_codes(self):
+        """Test codes of the result and inner result are found."""
+        result_error = ResponseEnvelope(
+            {'code': 0, 'result': {'code': 11000000, 'msg': 'result'}}
+        )
+        assert result_error.error_info.code == 11000000
+        inner_error = ResponseEnvelope(
+            {'code': 0, 'result': {'code': 0, 'result': {'errorCode': 11000000}}}
+        )
+        assert inner_error.error_info.code == 11000000
+
+    def test_payload_not_walked(self):
+        """Test codes below the inner result are ignored when the levels have one."""
+        envelope = ResponseEnvelope(
+            {
+                'code': 0,
+                'result': {'code': 0, 'result': {'status': {'error': 11005000}}},
+            }
+        )
+        assert envelope.error_info.code == 0
+        nested = ResponseEnvelope({'code': 0, 'result': {'code': 0, 'error': 12101000}})
+        assert nested.error_info.code == 12101000
+
+    def test_search_without_status(self):
+        """Test a response without status keys is searched like parse_error_code."""
+        response = {'result': {'data': [{'errorCode': 11005000}]}}
+        envelope = ResponseEnvelope(response)
+        assert envelope.error_info.code == 11005000
+        assert envelope.error_info == Helpers.parse_error_code(response)
+
+    def test_error_info_cached(self):
+        """Test the error information is determined once."""
+        envelope = ResponseEnvelope({'code': 0})
+        assert envelope.error_info is envelope.error_info
+        assert ResponseEnvelope.wrap(envelope) is envelope
+
+    def test_result_model_cached(self):
+        """Test the result model is built once and not cached when it fails."""
+        envelope = ResponseEnvelope({'code': 0, 'result': {}})
+        factory = MagicMock(return_value=None)
+        assert envelope.result_model(dict, factory) is None
+        factory.return_value = {'built': True}
+        model = envelope.result_model(dict, factory)
+        assert envelope.result_model(dict, factory) is model
+        assert factory.call_count == 2
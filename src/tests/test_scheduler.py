@@ -0,0 +1,178 @@
+"""Test the request scheduler used by `VeSync.async_call_api`."""
+import asyncio
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from pyvesync import VeSync
+from pyvesync.const import API_BASE_URL_US
+from pyvesync.utils.errors import VeSyncAPIStatusCodeError
+from pyvesync.utils.scheduler import (
+    EndpointFamily,
+    RequestScheduler,
+    SchedulerConfig,
+    endpoint_family,
+)
+import call_json
+from aiohttp_mocker import AiohttpMockSession
+from defaults import TestDefaults
+
+
+@pytest.mark.parametrize(
+    'api, family',
+    [
+        ('/cloud/v2/deviceManaged/bypassV2', EndpointFamily.BYPASS_V2),
+        ('/cloud/v1/deviceManaged/bypass', EndpointFamily.BYPASS_V1),
+        ('/cloud/v1/deviceManaged/deviceDetail', EndpointFamily.BYPASS_V1),
+        ('/cloud/v1/deviceManaged/devices', EndpointFamily.ACCOUNT),
+        ('/v1/device/CID/detail', EndpointFamily.LEGACY),
+        ('/v2/device/CID/timer', EndpointFamily.LEGACY),
+        ('/cloud/v1/device/getLastWeekEnergy', EndpointFamily.ENERGY),
+        ('/cloud/v1/outlet/getELECConsumePerMonthLastYear', EndpointFamily.ENERGY),
+        ('/globalPlatform/api/accountAuth/v1/authByPWDOrOTM', EndpointFamily.ACCOUNT),
+    ],
+)
+def test_endpoint_family(api, family):
+    """Test API paths are grouped into endpoint families."""
+    assert endpoint_family(api) == family
+
+
+class TestRequestScheduler:
+    """Test RequestScheduler limits, ordering and statistics."""
+
+    def test_unbounded_by_default(self):
+        """Test the default configuration never queues requests."""
+        assert VeSync('EMAIL', 'PASSWORD').scheduler.config.max_in_flight is None
+
+        async def run():
+            scheduler = RequestScheduler()
+            waits = [
+                await scheduler.acquire(EndpointFamily.BYPASS_V2) for _ in range(100)
+            ]
+            return waits, scheduler.stats()
+
+        waits, stats = asyncio.run(run())
+        assert waits == [0.0] * 100
+        assert stats.in_flight == 100
+        assert stats.queued_requests == 0
+
+    def test_global_limit_fifo(self):
+        """Test slots are limited and granted in arrival order."""
+
+        async def run():
+            scheduler = RequestScheduler(SchedulerConfig(max_in_flight=2))
+            order = []
+            release = asyncio.Event()
+
+            async def request(idx):
+                await scheduler.acquire(EndpointFamily.BYPASS_V2)
+                order.append(idx)
+                await release.wait()
+                scheduler.release(EndpointFamily.BYPASS_V2)
+
+            tasks = [asyncio.create_task(request(idx)) for idx in range(5)]
+            await asyncio.sleep(0)
+            assert scheduler.in_flight == 2
+            assert scheduler.queue_depth == 3
+            release.set()
+            await asyncio.gather(*tasks)
+            return scheduler, order
+
+        scheduler, order = asyncio.run(run())
+        assert order == [0, 1, 2, 3, 4]
+        stats = scheduler.stats()
+        assert stats.in_flight == 0
+        assert stats.queue_depth == 0
+        assert stats.max_queue_depth == 3
+        assert stats.total_requests == 5
+        assert stats.queued_requests == 3
+
+    def test_family_limit(self):
+        """Test a capped family does not block other families."""
+
+        async def run():
+            scheduler = RequestScheduler(
+                SchedulerConfig(
+                    max_in_flight=10, family_limits={EndpointFamily.ENERGY: 1}
+                )
+            )
+            await scheduler.acquire(EndpointFamily.ENERGY)
+            energy = asyncio.create_task(scheduler.acquire(EndpointFamily.ENERGY))
+            await asyncio.sleep(0)
+            await asyncio.wait_for(
+                scheduler.acquire(EndpointFamily.BYPASS_V2), timeout=1
+            )
+            assert not energy.done()
+            assert scheduler.stats().in_flight_by_family == {
+                'energy': 1,
+                'bypassV2': 1,
+            }
+            scheduler.release(EndpointFamily.ENERGY)
+            await asyncio.wait_for(energy, timeout=1)
+            return scheduler
+
+        scheduler = asyncio.run(run())
+        assert scheduler.in_flight == 2
+
+    def test_cancelled_waiter(self):
+        """Test a cancelled waiter leaves the queue without taking a slot."""
+
+        async def run():
+            scheduler = RequestScheduler(SchedulerConfig(max_in_flight=1))
+            await scheduler.acquire(EndpointFamily.LEGACY)
+            waiter = asyncio.create_task(scheduler.acquire(EndpointFamily.LEGACY))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            assert scheduler.queue_depth == 0
+            scheduler.release(EndpointFamily.LEGACY)
+            return scheduler
+
+        scheduler = asyncio.run(run())
+        assert scheduler.in_flight == 0
+
+
+class TestSchedulerManager:
+    """Test the manager releases scheduler slots."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Create a logged in manager."""
+        self.loop = asyncio.new_event_loop()
+        self.manager = VeSync(
+            'EMAIL', 'PASSWORD', scheduler_config=SchedulerConfig(max_in_flight=1)
+        )
+        self.manager.enabled = True
+        self.manager.auth._token = TestDefaults.token
+        self.manager.auth._account_id = TestDefaults.account_id
+        yield
+        self.loop.close()
+
+    @patch('pyvesync.vesync.ClientSession')
+    def test_slot_released(self, mock):
+        """Test slots are released after success and error responses."""
+        mock.return_value.request.side_effect = [
+            AiohttpMockSession(
+                method='post',
+                url=API_BASE_URL_US + '/endpoint',
+                status=404,
+                response=None,
+            ),
+            AiohttpMockSession(
+                method='post',
+                url=API_BASE_URL_US + '/endpoint',
+                status=200,
+                response=orjson.dumps(call_json.response_body(0, 'Success')),
+            ),
+        ]
+        with pytest.raises(VeSyncAPIStatusCodeError):
+            self.loop.run_until_complete(
+                self.manager.async_call_api('/endpoint', 'post')
+            )
+        assert self.manager.scheduler.in_flight == 0
+        self.loop.run_until_complete(self.manager.async_call_api('/endpoint', 'post'))
+        stats = self.manager.scheduler.stats()
+        assert stats.in_flight == 0
+        assert stats.total_requests == 2
@@ -0,0 +1,175 @@
+"""Test tracing spans around device and manager operations."""
+import asyncio
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from types import SimpleNamespace
+
+import pyvesync
+
+from pyvesync import VeSync
+from pyvesync.utils.tracing import (
+    ATTR_CID,
+    ATTR_DEVICE_CLASS,
+    ATTR_PAYLOAD_METHOD,
+    ATTR_RESULT_CODE,
+    NOOP_TRACER,
+    is_traced_device_method,
+    traced_device_method,
+)
+from fake_cloud import FakeCloudConfig, FakeVeSyncCloud
+
+
+class RecordedSpan:
+    """Span recording its attributes and parent."""
+
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    """Tracer tracking the current span in a context variable."""
+
+    def __init__(self):
+        self.spans = []
+        self._current = ContextVar('current_span', default=None)
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = RecordedSpan(name, attributes, self._current.get())
+        self.spans.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        finally:
+            self._current.reset(token)
+
+
+def test_is_traced_device_method():
+    """Test only the update, get_details, toggle and set coroutines are traced."""
+
+    async def set_level():
+        pass
+
+    def set_state():
+        pass
+
+    assert is_traced_device_method('set_level', set_level)
+    assert is_traced_device_method('get_details', set_level)
+    assert not is_traced_device_method('turn_on', set_level)
+    assert not is_traced_device_method('set_state', set_state)
+
+
+class FakeDevice:
+    """Device with the attributes read by traced device methods."""
+
+    cid = 'CID'
+    device_type = 'DEVICE_TYPE'
+    product_type = 'PRODUCT_TYPE'
+    sub_device_no = None
+    last_response = None
+
+    def __init__(self, tracer):
+        self.manager = SimpleNamespace(tracer=tracer)
+
+    @traced_device_method
+    async def set_level(self, level):
+        return level
+
+
+class FakeOverride(FakeDevice):
+    """Device overriding a traced method and calling it with super()."""
+
+    @traced_device_method
+    async def set_level(self, level):
+        return await super().set_level(level + 1)
+
+
+def test_super_call_not_nested():
+    """Test a super() call runs in the span of the override."""
+    tracer = RecordingTracer()
+    assert asyncio.run(FakeOverride(tracer).set_level(1)) == 2
+    assert [span.name for span in tracer.spans] == ['FakeOverride.set_level']
+    assert asyncio.run(FakeDevice(tracer).set_level(1)) == 1
+    assert len(tracer.spans) == 2
+
+
+def test_fleet_update_trace():
+    """Test device updates are child spans of the fleet update span."""
+    cloud = FakeVeSyncCloud(FakeCloudConfig())
+    tracer = RecordingTracer()
+
+    async def run():
+        async with VeSync(
+            'EMAIL', 'PASSWORD', transport=cloud, tracer=tracer
+        ) as manager:
+            await manager.login()
+            await manager.get_devices()
+            await manager.update_all_devices()
+            return manager
+
+    manager = asyncio.run(run())
+    assert manager.tracer is tracer
+    names = {span.name for span in tracer.spans}
+    assert {'VeSync.login', 'VeSync.get_devices', 'VeSync.update_all_devices'} <= names
+    fleet = next(
+        span for span in tracer.spans if span.name == 'VeSync.update_all_devices'
+    )
+    updates = [span for span in tracer.spans if span.parent is fleet]
+    assert len(updates) == len(manager.devices)
+    assert all(span.name.endswith('.update') for span in updates)
+    assert all(span.attributes[ATTR_CID] for span in updates)
+    details = [span for span in tracer.spans if span.parent in updates]
+    assert details
+    assert all(span.name.endswith('.get_details') for span in details)
+    api_calls = [
+        span
+        for span in tracer.spans
+        if span.name == 'VeSync.async_call_api' and span.parent in details
+    ]
+    assert api_calls
+    for span in api_calls:
+        assert ATTR_RESULT_CODE in span.attributes
+        if ATTR_DEVICE_CLASS in span.attributes:
+            device_class = span.parent.attributes[ATTR_DEVICE_CLASS]
+            assert span.attributes[ATTR_DEVICE_CLASS] == device_class
+    assert any(ATTR_PAYLOAD_METHOD in span.attributes for span in api_calls)
+
+
+def test_default_tracer():
+    """Test the manager uses the no-op tracer without a tracer."""
+
+    async def run():
+        return VeSync('EMAIL', 'PASSWORD').tracer
+
+    assert asyncio.run(run()) is NOOP_TRACER
+
+
+def test_wrapped_once_tracing_enabled():
+    """Test device methods are only wrapped once a manager has a tracer."""
+    code = (
+        'from pyvesync import VeSync; '
+        'from pyvesync.devices.vesyncbulb import VeSyncBulbESL100; '
+        'from pyvesync.utils.tracing import NOOP_TRACER; '
+        "traced = lambda: hasattr(VeSyncBulbESL100.get_details, '__vesync_traced__'); "
+        "VeSync('EMAIL', 'PASSWORD'); before = traced(); "
+        "VeSync('EMAIL', 'PASSWORD', tracer=NOOP_TRACER); noop = traced(); "
+        "VeSync('EMAIL', 'PASSWORD', tracer=object()); print(before, noop, traced())"
+    )
+    src_dir = Path(pyvesync.__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, 'PYTHONPATH': str(src_dir)},
+    )
+    assert result.stdout.split() == ['False', 'False', 'True']
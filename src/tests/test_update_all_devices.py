@@ -0,0 +1,193 @@
+"""Test `VeSync.update` and `VeSync.update_all_devices`."""
+import asyncio
+
+from pyvesync import VeSync
+from pyvesync.const import ConnectionStatus, DeviceStatus
+from pyvesync.devices.vesyncswitch import VeSyncWallSwitch
+from pyvesync.models.vesync_models import ResponseDeviceDetailsModel
+from pyvesync.utils.errors import VeSyncServerError
+import call_json_purifiers
+from base_test_cases import TestBase
+from call_json import ALL_DEVICE_MAP_DICT, DeviceList
+from defaults import TestDefaults
+from fake_cloud import FakeVeSyncCloud
+
+SLOW_CID = TestDefaults.cid('Core400S')
+FAILING_CID = TestDefaults.cid('Core600S')
+
+
+class TestUpdateAllDevices(TestBase):
+    """Test partial results when updates miss the deadline."""
+
+    def add_devices(self, *setup_entries: str) -> None:
+        """Add purifiers to the manager device container."""
+        for setup_entry in setup_entries:
+            device_config = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT[setup_entry])
+            self.manager.devices.add_device_from_model(
+                ResponseDeviceDetailsModel.from_dict(device_config), self.manager
+            )
+
+    async def api_response(self, url, method, request, headers):
+        """Return details, hanging for the slow device and failing for another."""
+        if request.cid == SLOW_CID:
+            await asyncio.sleep(10)
+        if request.cid == FAILING_CID:
+            raise VeSyncServerError('Server error')
+        return call_json_purifiers.DETAILS_RESPONSES['Core300S'], 200
+
+    def test_no_deadline(self):
+        """Test all devices are reported without a deadline."""
+        self.mock_api.return_value = (
+            call_json_purifiers.DETAILS_RESPONSES['Core300S'],
+            200,
+        )
+        self.add_devices('Core300S', 'Core400S')
+        result = self.run_in_loop(self.manager.update_all_devices)
+        assert result.complete is True
+        assert len(result.updated) == 2
+        assert not result.failed
+
+    def test_deadline_cancel_pending(self):
+        """Test pending updates are reported and cancelled at the deadline."""
+        self.mock_api.side_effect = self.api_response
+        self.add_devices('Core300S', 'Core400S', 'Core600S')
+
+        result = self.run_in_loop(
+            self.manager.update_all_devices, deadline=0.05, cancel_pending=True
+        )
+        assert [device.cid for device in result.updated] == [
+            TestDefaults.cid('Core300S')
+        ]
+        assert [device.cid for device in result.pending] == [SLOW_CID]
+        assert [device.cid for device in result.failed] == [FAILING_CID]
+        assert result.cancelled is True
+        assert result.complete is False
+        assert self.manager.coalescer.in_flight == 0
+
+    def test_cancelled_update(self):
+        """Test an update cancelled by the device is reported as failed."""
+
+        async def cancelled(*args, **kwargs):
+            raise asyncio.CancelledError
+
+        self.mock_api.side_effect = cancelled
+        self.add_devices('Core300S')
+        result = self.run_in_loop(self.manager.update_all_devices)
+        assert not result.updated
+        device = next(iter(self.manager.devices))
+        assert isinstance(result.failed[device], asyncio.CancelledError)
+
+    def test_explicit_devices(self):
+        """Test the given devices are updated, not the device container."""
+        self.mock_api.return_value = (
+            call_json_purifiers.DETAILS_RESPONSES['Core300S'],
+            200,
+        )
+        self.add_devices('Core300S')
+        result = self.run_in_loop(self.manager.update_all_devices, devices=[])
+        assert not result.updated
+        assert self.mock_api.call_count == 0
+        device = next(iter(self.manager.devices))
+        self.manager.devices.remove(device)
+        result = self.run_in_loop(self.manager.update_all_devices, devices=[device])
+        assert result.updated == [device]
+
+    def test_deadline_background(self):
+        """Test pending updates keep running until the manager exits."""
+        self.mock_api.side_effect = self.api_response
+        self.add_devices('Core300S', 'Core400S')
+
+        async def run():
+            async with self.manager:
+                result = await self.manager.update_all_devices(deadline=0.05)
+                assert self.manager.coalescer.in_flight == 2
+            await asyncio.sleep(0.01)
+            return result
+
+        result = self.run_in_loop(run)
+        assert [device.cid for device in result.pending] == [SLOW_CID]
+        assert result.cancelled is False
+        assert self.manager.coalescer.in_flight == 0
+
+
+class TestUpdateFromDeviceList(TestBase):
+    """Test refreshing device state from the device list response."""
+
+    def test_purifier_extension(self):
+        """Test purifier air quality, mode and speed are read from the list."""
+        purifier = self.get_device('air_purifiers', 'LV-PUR131S')
+        details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT['LV-PUR131S'])
+        details.update(
+            deviceStatus='off',
+            extension={
+                'airQuality': 12,
+                'airQualityLevel': 2,
+                'mode': 'sleep',
+                'fanSpeedLevel': '3',
+            },
+        )
+        model = ResponseDeviceDetailsModel.from_dict(details)
+        assert purifier.update_from_device_list(model) is True
+        assert purifier.state.device_status == DeviceStatus.OFF
+        assert purifier.state.mode == 'sleep'
+        assert purifier.state.fan_level == 3
+        assert purifier.state.air_quality_level == 2
+        assert purifier.state.pm25 == 12
+
+    def test_online_without_extension(self):
+        """Test online devices without list state still need details."""
+        purifier = self.get_device('air_purifiers', 'Core300S')
+        details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT['Core300S'])
+        model = ResponseDeviceDetailsModel.from_dict(details)
+        assert purifier.update_from_device_list(model) is False
+        details['connectionStatus'] = 'offline'
+        model = ResponseDeviceDetailsModel.from_dict(details)
+        assert purifier.update_from_device_list(model) is True
+        assert purifier.state.connection_status == ConnectionStatus.OFFLINE
+
+
+    def test_empty_extension(self):
+        """Test an extension without state fields still needs details."""
+        purifier = self.get_device('air_purifiers', 'LV-PUR131S')
+        details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT['LV-PUR131S'])
+        details['extension'] = {
+            'airQuality': None,
+            'airQualityLevel': None,
+            'mode': None,
+            'fanSpeedLevel': None,
+        }
+        model = ResponseDeviceDetailsModel.from_dict(details)
+        assert purifier.update_from_device_list(model) is False
+
+    def test_wall_switch_status(self):
+        """Test a wall switch is covered only by an on or off status."""
+        switch = self.get_device('switches', 'ESWL01')
+        details = DeviceList.device_list_item(ALL_DEVICE_MAP_DICT['ESWL01'])
+        model = ResponseDeviceDetailsModel.from_dict(details)
+        assert switch.update_from_device_list(model) is True
+        details['deviceStatus'] = 'unknown'
+        model = ResponseDeviceDetailsModel.from_dict(details)
+        assert switch.update_from_device_list(model) is False
+
+
+def test_update_from_device_list():
+    """Test devices covered by the device list are not sent a details request."""
+
+    async def run(from_device_list):
+        cloud = FakeVeSyncCloud()
+        async with VeSync('EMAIL', 'PASSWORD', transport=cloud) as manager:
+            await manager.login()
+            await manager.get_devices()
+            cloud.requests.clear()
+            await manager.update(from_device_list=from_device_list)
+            covered = [
+                device
+                for device in manager.devices
+                if isinstance(device, VeSyncWallSwitch)
+            ]
+            return cloud.request_count, len(covered)
+
+    full_count, _ = asyncio.run(run(False))
+    list_count, covered = asyncio.run(run(True))
+    assert covered > 0
+    assert list_count == full_count - covered
@@ -8,10 +8,13 @@ from unittest.mock import patch, MagicMock
 from pyvesync import VeSync
 from pyvesync.utils.errors import VeSyncRateLimitError, VeSyncServerError
 
-from pyvesync.const import API_BASE_URL_US
+from pyvesync.const import API_BASE_URL_US, API_TIMEOUT
 from pyvesync.utils.errors import (
     VeSyncAPIStatusCodeError
     )
+from pyvesync.models.vesync_models import RequestFirmwareModel
+from pyvesync.utils.request_timing import RequestTiming
+from pyvesync.utils.transport import TransportConfig
 import call_json
 from defaults import TestDefaults
 from aiohttp_mocker import AiohttpMockSession
@@ -137,3 +140,72 @@ class TestApiFunc:
         )
         with pytest.raises(VeSyncAPIStatusCodeError):
             self.run_in_loop(self.manager.async_call_api, DEFAULT_ENDPOINT, 'get')
+
+    @patch("pyvesync.vesync.ClientSession")
+    def test_api_default_transport(self, mock):
+        """Test the created session uses the pooled connector and API timeout."""
+        mock.return_value.request.return_value = AiohttpMockSession(
+            method='post',
+            url=API_BASE_URL_US + DEFAULT_ENDPOINT,
+            status=200,
+            response=orjson.dumps(SUCCESS_RESP),
+        )
+        self.run_in_loop(self.manager.async_call_api, DEFAULT_ENDPOINT, 'post')
+        self.run_in_loop(self.manager.async_call_api, DEFAULT_ENDPOINT, 'post')
+        assert mock.call_count == 1
+        session_kwargs = mock.call_args.kwargs
+        connector = session_kwargs['connector']
+        assert connector.limit == TransportConfig().limit
+        assert connector.limit_per_host == TransportConfig().limit_per_host
+        assert session_kwargs['timeout'].total == API_TIMEOUT
+        assert len(session_kwargs['trace_configs']) == 1
+        request_kwargs = mock.return_value.request.call_args.kwargs
+        assert request_kwargs['timeout'].total == API_TIMEOUT
+        assert isinstance(request_kwargs['trace_request_ctx'], RequestTiming)
+        assert self.manager.request_timing.requests == 2
+
+    def test_api_custom_transport(self):
+        """Test transport configuration is applied to a user supplied session."""
+        session = MagicMock()
+        session.request.return_value = AiohttpMockSession(
+            method='post',
+            url=API_BASE_URL_US + DEFAULT_ENDPOINT,
+            status=200,
+            response=orjson.dumps(SUCCESS_RESP),
+        )
+        config = TransportConfig(total_timeout=3, sock_read_timeout=2)
+        manager = VeSync('EMAIL', 'PASSWORD', session=session, transport_config=config)
+        manager.auth._token = TestDefaults.token
+        manager.auth._account_id = TestDefaults.account_id
+        self.run_in_loop(manager.async_call_api, DEFAULT_ENDPOINT, 'post')
+        request_timeout = session.request.call_args.kwargs['timeout']
+        assert request_timeout.total == 3
+        assert request_timeout.sock_read == 2
+        assert manager.session is session
+
+    @patch("pyvesync.vesync.ClientSession")
+    def test_api_model_bytes(self, mock):
+        """Test request models are sent as JSON bytes without building a dict."""
+        mock.return_value.request.return_value = AiohttpMockSession(
+            method='post',
+            url=API_BASE_URL_US + DEFAULT_ENDPOINT,
+            status=200,
+            response=orjson.dumps(SUCCESS_RESP),
+        )
+        request = RequestFirmwareModel(
+            accountID=TestDefaults.account_id,
+            timeZone=TestDefaults.time_zone,
+            token=TestDefaults.token,
+            userCountryCode=TestDefaults.country_code,
+            cidList=[TestDefaults.cid('Core300S')],
+        )
+        with patch.object(
+            RequestFirmwareModel, 'to_dict', side_effect=AssertionError
+        ):
+            self.run_in_loop(
+                self.manager.async_call_api, DEFAULT_ENDPOINT, 'post', request
+            )
+        request_kwargs = mock.return_value.request.call_args.kwargs
+        assert request_kwargs['json'] is None
+        assert request_kwargs['data'] == request.to_jsonb()
+        assert request_kwargs['headers'] == {'Content-Type': 'application/json'}
@@ -1,11 +1,14 @@
 """Test VeSync login method."""
 # from aiohttp.web_response import Response
-from unittest.mock import MagicMock
+import asyncio
+import copy
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import orjson
 
 from pyvesync.utils.errors import VeSyncLoginError
-from pyvesync import const
+from pyvesync import VeSync, const
+from pyvesync.auth import TokenRefreshConfig, VeSyncAuth
 from pyvesync.utils.helpers import Helpers
 from pyvesync.models.vesync_models import (
     ResponseLoginModel,
@@ -185,3 +188,200 @@ class TestLogin(TestApiFunc):
         assert call_list[3].kwargs['url'] == US_BASE_URL + login_token_endpoint
         assert call_list[4].args[0] == 'post'
         assert call_list[4].kwargs['url'] == US_BASE_URL + first_final_endpoint
+
+    def test_token_error_during_reauthentication(self):
+        """Test a token error from the login endpoint fails instead of waiting."""
+
+        def request(method, url, **kwargs):
+            return AiohttpMockSession(
+                method=method,
+                url=url,
+                status=200,
+                response=orjson.dumps(TOKEN_ERROR_RESP),
+            )
+
+        self.mock_api.return_value = MagicMock()
+        self.mock_api.return_value.request.side_effect = request
+
+        async def run():
+            return await asyncio.wait_for(
+                self.manager.async_call_api(DEFAULT_ENDPOINT, 'post', {}), timeout=5
+            )
+
+        with pytest.raises(VeSyncLoginError):
+            self.loop.run_until_complete(run())
+        urls = [
+            call.kwargs['url'] for call in self.mock_api.return_value.request.mock_calls
+        ]
+        assert urls == [US_BASE_URL + DEFAULT_ENDPOINT, US_BASE_URL + LOGIN_ENDPOINT]
+
+    def test_token_expired_concurrent(self):
+        """Test concurrent token errors share one login and replay with new token."""
+        self.manager.auth._token = 'EXPIRED_TOKEN'
+        legacy_headers = {'tk': 'EXPIRED_TOKEN', 'accountId': TestDefaults.account_id}
+        responses = {
+            LOGIN_ENDPOINT: LOGIN_RESPONSES.GET_TOKEN_RESPONSE_SUCCESS,
+            LOGIN_TOKEN_ENDPOINT: LOGIN_RESPONSES.LOGIN_RESPONSE_SUCCESS,
+        }
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            endpoint = url.removeprefix(US_BASE_URL)
+            body = orjson.loads(data) if data else {}
+            if endpoint in responses:
+                response = responses[endpoint]
+            elif 'EXPIRED_TOKEN' in (body.get('token'), (headers or {}).get('tk')):
+                response = TOKEN_ERROR_RESP
+            else:
+                response = call_json.response_body(0, 'Success')
+            return AiohttpMockSession(
+                method=method, url=url, status=200, response=orjson.dumps(response)
+            )
+
+        self.mock_api.return_value = MagicMock()
+        self.mock_api.return_value.request.side_effect = request
+
+        async def run():
+            body = {'token': 'EXPIRED_TOKEN', 'accountID': TestDefaults.account_id}
+            calls = [
+                self.manager.async_call_api(DEFAULT_ENDPOINT, 'post', body)
+                for _ in range(5)
+            ]
+            calls.append(
+                self.manager.async_call_api(
+                    DEFAULT_ENDPOINT, 'put', headers=legacy_headers
+                )
+            )
+            return await asyncio.gather(*calls)
+
+        results = self.loop.run_until_complete(run())
+        assert all(resp['code'] == 0 for resp, _ in results)
+        urls = [
+            call.kwargs['url'] for call in self.mock_api.return_value.request.mock_calls
+        ]
+        assert urls.count(US_BASE_URL + LOGIN_ENDPOINT) == 1
+        assert urls.count(US_BASE_URL + LOGIN_TOKEN_ENDPOINT) == 1
+        assert urls.count(US_BASE_URL + DEFAULT_ENDPOINT) == 12
+        replayed = self.mock_api.return_value.request.mock_calls[-1]
+        assert replayed.args[0] == 'put'
+        assert replayed.kwargs['headers']['tk'] == TestDefaults.token
+        assert self.manager.token == TestDefaults.token
+        assert self.manager.enabled is True
+
+
+class TestTokenRefresh:
+    """Test proactive token refresh in VeSyncAuth."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Create a logged in manager with a short token lifetime."""
+        self.manager = VeSync(
+            'EMAIL',
+            'PASSWORD',
+            token_refresh_config=TokenRefreshConfig(
+                token_lifetime=100, refresh_margin=10, retry_interval=0
+            ),
+        )
+        self.manager.set_credentials(
+            'OLD_TOKEN', TestDefaults.account_id, TestDefaults.country_code, 'US'
+        )
+        self.auth = self.manager.auth
+
+    def mock_login(self, tokens_seen):
+        """Return a login mock that records the token in use during login."""
+
+        async def login():
+            tokens_seen.append(self.auth.token)
+            await asyncio.sleep(0)
+            self.auth.set_credentials(
+                'NEW_TOKEN', TestDefaults.account_id, TestDefaults.country_code, 'US'
+            )
+            return True
+
+        return AsyncMock(side_effect=login)
+
+    def test_token_expiry(self):
+        """Test the expiry time is tracked from the issue time."""
+        assert self.auth.token_issued_at is not None
+        assert self.auth.token_expires_at == self.auth.token_issued_at + 100
+
+    def test_reauthenticate_swaps_and_persists(self, tmp_path):
+        """Test the old token is kept until login and the new token is saved."""
+        token_file = tmp_path / 'auth.json'
+        tokens_seen = []
+
+        async def run():
+            await self.auth.save_credentials_to_file(token_file)
+            with patch.object(VeSyncAuth, 'login', self.mock_login(tokens_seen)):
+                return await asyncio.gather(
+                    self.auth.reauthenticate(), self.auth.reauthenticate()
+                )
+
+        assert asyncio.run(run()) == [True, True]
+        assert tokens_seen == ['OLD_TOKEN']
+        saved = orjson.loads(token_file.read_text())
+        assert saved['token'] == 'NEW_TOKEN'
+        assert saved['current_region'] == 'US'
+        assert saved['token_issued_at'] == self.auth.token_issued_at
+
+    def test_background_refresh(self):
+        """Test the token is refreshed before it expires."""
+        self.auth._token_issued_at -= 95
+        tokens_seen = []
+
+        async def run():
+            with patch.object(VeSyncAuth, 'login', self.mock_login(tokens_seen)):
+                self.auth.start_token_refresh()
+                while self.auth.token == 'OLD_TOKEN':
+                    await asyncio.sleep(0)
+                await self.manager.__aexit__(None, None, None)
+
+        asyncio.run(asyncio.wait_for(run(), timeout=5))
+        assert tokens_seen == ['OLD_TOKEN']
+        assert self.auth.token == 'NEW_TOKEN'
+        assert self.auth._refresh_task is None
+
+    def test_clear_keeps_token_file(self, tmp_path):
+        """Test clearing credentials does not delete a file passed by the user."""
+        token_file = tmp_path / 'auth.json'
+
+        async def run():
+            await self.auth.save_credentials_to_file(token_file)
+            self.auth.clear_credentials()
+            return await self.auth.load_credentials_from_file(token_file)
+
+        assert asyncio.run(run()) is True
+        assert token_file.exists()
+        self.auth.clear_credentials()
+        assert token_file.exists()
+
+    def test_login_swaps_credentials_at_once(self):
+        """Test a cross region login keeps the old credentials until the token."""
+        cross_region = copy.deepcopy(LOGIN_RESPONSES.LOGIN_RESPONSE_CROSS_REGION)
+        cross_region['result'].update(
+            token='', countryCode='DE', currentRegion='EU', acceptLanguage='de'
+        )
+        success = copy.deepcopy(LOGIN_RESPONSES.LOGIN_RESPONSE_SUCCESS)
+        success['result'].update(token='NEW_TOKEN', countryCode='DE')
+        responses = iter(
+            [LOGIN_RESPONSES.GET_TOKEN_RESPONSE_SUCCESS, cross_region, success]
+        )
+        seen = []
+
+        async def call_api(*args, **kwargs):
+            seen.append(
+                (
+                    self.auth.token,
+                    self.auth.account_id,
+                    self.auth.country_code,
+                    self.auth.current_region,
+                )
+            )
+            return next(responses), 200
+
+        old = ('OLD_TOKEN', TestDefaults.account_id, TestDefaults.country_code, 'US')
+        with patch.object(VeSync, 'async_call_api', side_effect=call_api):
+            assert asyncio.run(self.auth.login()) is True
+        assert seen == [old, old, old]
+        assert self.auth.token == 'NEW_TOKEN'
+        assert self.auth.country_code == 'DE'
+        assert self.auth.current_region == 'EU'